@@ -0,0 +1,130 @@
+"""baseline schema
+
+기존 운영 DB(테이블이 이미 생성된 상태)는 스키마를 만들지 않고
+`alembic stamp 0001_baseline`으로 기준 버전만 기록한 뒤 이후 마이그레이션을 적용합니다.
+기존 운영 스키마(회사, 문서, 섹션, 채팅 이력/참조/피드백)만 포함하며,
+이후 추가된 테이블과 컬럼은 0002부터의 마이그레이션에서 생성합니다.
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-19 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0001_baseline'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('companies',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('business_number', sa.String(length=20), nullable=True),
+        sa.Column('industry', sa.String(length=100), nullable=True),
+        sa.Column('establishment_date', sa.String(length=10), nullable=True),
+        sa.Column('employee_count', sa.Integer(), nullable=True),
+        sa.Column('annual_revenue', sa.Integer(), nullable=True),
+        sa.Column('description', sa.Text(), nullable=True),
+        sa.Column('target_markets', sa.ARRAY(sa.String()), nullable=True),
+        sa.Column('export_countries', sa.ARRAY(sa.String()), nullable=True),
+        sa.Column('export_history', sa.JSON(), nullable=True),
+        sa.Column('is_active', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_companies_business_number'), 'companies', ['business_number'], unique=True)
+    op.create_index(op.f('ix_companies_name'), 'companies', ['name'], unique=False)
+    op.create_table('documents',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('company_id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('type', sa.Enum('BUSINESS_PLAN', 'COMPANY_PROFILE', 'PRODUCT_CATALOG', 'TRAINING_DATA', name='documenttype'), nullable=False),
+        sa.Column('content', sa.Text(), nullable=True),
+        sa.Column('file_path', sa.String(length=512), nullable=True),
+        sa.Column('file_name', sa.String(length=255), nullable=True),
+        sa.Column('mime_type', sa.String(length=100), nullable=True),
+        sa.Column('doc_metadata', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_documents_title'), 'documents', ['title'], unique=False)
+    op.create_index(op.f('ix_documents_type'), 'documents', ['type'], unique=False)
+    op.create_table('chat_histories',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('company_id', sa.Integer(), nullable=False),
+        sa.Column('query', sa.Text(), nullable=False),
+        sa.Column('response', sa.Text(), nullable=False),
+        sa.Column('is_bookmarked', sa.Boolean(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('sections',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('document_id', sa.Integer(), nullable=False),
+        sa.Column('company_id', sa.Integer(), nullable=False),
+        sa.Column('type', sa.Enum('EXECUTIVE_SUMMARY', 'COMPANY_OVERVIEW', 'MARKET_ANALYSIS', 'BUSINESS_MODEL', 'FINANCIAL_PLAN', 'TECHNICAL_DESCRIPTION', 'OTHER', name='sectiontype'), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('content', sa.Text(), nullable=True),
+        sa.Column('order', sa.Integer(), nullable=True),
+        sa.Column('meta_data', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['document_id'], ['documents.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_sections_type'), 'sections', ['type'], unique=False)
+    op.create_table('chat_feedbacks',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('chat_id', sa.Integer(), nullable=False),
+        sa.Column('rating', sa.Integer(), nullable=True),
+        sa.Column('comment', sa.Text(), nullable=True),
+        sa.Column('is_accurate', sa.Boolean(), nullable=True),
+        sa.Column('needs_improvement', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['chat_id'], ['chat_histories.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('chat_id')
+    )
+    op.create_table('chat_references',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('chat_id', sa.Integer(), nullable=False),
+        sa.Column('document_id', sa.Integer(), nullable=False),
+        sa.Column('is_auto_referenced', sa.Boolean(), nullable=True),
+        sa.Column('relevance_score', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['chat_id'], ['chat_histories.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['document_id'], ['documents.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('chat_references')
+    op.drop_table('chat_feedbacks')
+    op.drop_index(op.f('ix_sections_type'), table_name='sections')
+    op.drop_table('sections')
+    op.drop_table('chat_histories')
+    op.drop_index(op.f('ix_documents_type'), table_name='documents')
+    op.drop_index(op.f('ix_documents_title'), table_name='documents')
+    op.drop_table('documents')
+    op.drop_index(op.f('ix_companies_name'), table_name='companies')
+    op.drop_index(op.f('ix_companies_business_number'), table_name='companies')
+    op.drop_table('companies')
+    for enum_name in ('sectiontype', 'documenttype'):
+        op.execute(f'DROP TYPE IF EXISTS {enum_name}')
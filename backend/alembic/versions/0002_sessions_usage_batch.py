@@ -0,0 +1,114 @@
+"""chat sessions, LLM usage rollups and batch jobs
+
+기준 스키마 이후 추가된 테이블과 컬럼을 생성합니다.
+- chat_sessions, chat_histories.session_id: 대화 세션과 요약 메모리
+- llm_usages: 회사별 LLM 사용량 집계
+- batch_jobs, batch_job_items: 사업계획서 일괄 생성 작업
+
+Revision ID: 0002_sessions_usage_batch
+Revises: 0001_baseline
+Create Date: 2026-10-19 10:30:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_sessions_usage_batch'
+down_revision: Union[str, None] = '0001_baseline'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('chat_sessions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('company_id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=True),
+        sa.Column('summary', sa.Text(), nullable=True),
+        sa.Column('summarized_until_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_chat_sessions_company_id'), 'chat_sessions', ['company_id'], unique=False)
+    op.create_table('llm_usages',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('company_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('call_site', sa.String(length=100), nullable=False),
+        sa.Column('model', sa.String(length=100), nullable=False),
+        sa.Column('call_count', sa.Integer(), nullable=False),
+        sa.Column('error_count', sa.Integer(), nullable=False),
+        sa.Column('retry_count', sa.Integer(), nullable=False),
+        sa.Column('validation_failure_count', sa.Integer(), nullable=False),
+        sa.Column('prompt_tokens', sa.BigInteger(), nullable=False),
+        sa.Column('completion_tokens', sa.BigInteger(), nullable=False),
+        sa.Column('total_duration_ms', sa.BigInteger(), nullable=False),
+        sa.Column('estimated_cost', sa.Float(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('company_id', 'day', 'call_site', 'model', name='uq_llm_usages_company_day_site_model')
+    )
+    op.create_index(op.f('ix_llm_usages_company_id'), 'llm_usages', ['company_id'], unique=False)
+    op.create_table('batch_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('template_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.Enum('PENDING', 'RUNNING', 'COMPLETED', 'FAILED', name='batchjobstatus'), nullable=False),
+        sa.Column('total_items', sa.Integer(), nullable=False),
+        sa.Column('completed_items', sa.Integer(), nullable=False),
+        sa.Column('failed_items', sa.Integer(), nullable=False),
+        sa.Column('completed_sections', sa.Integer(), nullable=False),
+        sa.Column('sections_per_minute', sa.Float(), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['template_id'], ['documents.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_batch_jobs_status'), 'batch_jobs', ['status'], unique=False)
+    op.create_table('batch_job_items',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('company_id', sa.Integer(), nullable=False),
+        sa.Column('document_id', sa.Integer(), nullable=True),
+        sa.Column('status', postgresql.ENUM('PENDING', 'RUNNING', 'COMPLETED', 'FAILED', name='batchjobstatus', create_type=False), nullable=False),
+        sa.Column('completed_sections', sa.Integer(), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['document_id'], ['documents.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['job_id'], ['batch_jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('job_id', 'company_id', name='uq_batch_job_items_job_company')
+    )
+    op.create_index(op.f('ix_batch_job_items_job_id'), 'batch_job_items', ['job_id'], unique=False)
+    op.add_column('chat_histories', sa.Column('session_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'chat_histories_session_id_fkey', 'chat_histories', 'chat_sessions',
+        ['session_id'], ['id'], ondelete='SET NULL'
+    )
+    op.create_index(op.f('ix_chat_histories_session_id'), 'chat_histories', ['session_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_chat_histories_session_id'), table_name='chat_histories')
+    op.drop_constraint('chat_histories_session_id_fkey', 'chat_histories', type_='foreignkey')
+    op.drop_column('chat_histories', 'session_id')
+    op.drop_index(op.f('ix_batch_job_items_job_id'), table_name='batch_job_items')
+    op.drop_table('batch_job_items')
+    op.drop_index(op.f('ix_batch_jobs_status'), table_name='batch_jobs')
+    op.drop_table('batch_jobs')
+    op.drop_index(op.f('ix_llm_usages_company_id'), table_name='llm_usages')
+    op.drop_table('llm_usages')
+    op.drop_index(op.f('ix_chat_sessions_company_id'), table_name='chat_sessions')
+    op.drop_table('chat_sessions')
+    op.execute('DROP TYPE IF EXISTS batchjobstatus')
@@ -0,0 +1,80 @@
+"""full-text and trigram search
+
+검색 대상 테이블에 'simple' 설정 tsvector 생성 컬럼(STORED)과 GIN 인덱스,
+부분 일치 검색용 pg_trgm GIN 인덱스를 추가합니다.
+생성 컬럼 추가 시 테이블이 재작성되므로 트래픽이 적은 시간에 적용하고,
+인덱스는 쓰기를 막지 않도록 CONCURRENTLY로 생성합니다.
+
+Revision ID: 0003_full_text_search
+Revises: 0002_sessions_usage_batch
+Create Date: 2026-10-19 11:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_full_text_search'
+down_revision: Union[str, None] = '0002_sessions_usage_batch'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 테이블: (tsvector 생성식의 (컬럼, 가중치) 목록, 부분 일치 인덱스 컬럼)
+SEARCH_TABLES = {
+    'documents': ((('title', 'A'), ('content', 'B')), 'title'),
+    'sections': ((('title', 'A'), ('content', 'B')), 'title'),
+    'chat_histories': ((('query', 'A'), ('response', 'B')), 'query'),
+    'companies': ((('name', 'A'), ('industry', 'B'), ('description', 'C')), 'name'),
+}
+
+
+def _vector_expression(weighted) -> str:
+    return " || ".join(
+        f"setweight(to_tsvector('simple', coalesce({column}, '')), '{weight}')"
+        for column, weight in weighted
+    )
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    for table, (weighted, _) in SEARCH_TABLES.items():
+        op.add_column(
+            table,
+            sa.Column(
+                'search_vector',
+                postgresql.TSVECTOR(),
+                sa.Computed(_vector_expression(weighted), persisted=True),
+                nullable=True
+            )
+        )
+
+    with op.get_context().autocommit_block():
+        for table, (_, trigram_column) in SEARCH_TABLES.items():
+            op.create_index(
+                f'ix_{table}_search_vector',
+                table,
+                ['search_vector'],
+                postgresql_using='gin',
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+            op.create_index(
+                f'ix_{table}_{trigram_column}_trgm',
+                table,
+                [trigram_column],
+                postgresql_using='gin',
+                postgresql_ops={trigram_column: 'gin_trgm_ops'},
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    for table, (_, trigram_column) in SEARCH_TABLES.items():
+        op.drop_index(f'ix_{table}_{trigram_column}_trgm', table_name=table, if_exists=True)
+        op.drop_index(f'ix_{table}_search_vector', table_name=table, if_exists=True)
+        op.drop_column(table, 'search_vector')
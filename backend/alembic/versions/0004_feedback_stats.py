@@ -0,0 +1,84 @@
+"""feedback stats rollup tables
+
+회사별/일자별 피드백 통계 집계 테이블을 추가하고 기존 피드백으로 채웁니다.
+이후에는 피드백 저장 시 같은 트랜잭션에서 변경분만 누적되며,
+정합성 복구가 필요하면 `python -m scripts.feedback_stats rebuild`로 재계산합니다.
+
+Revision ID: 0004_feedback_stats
+Revises: 0003_full_text_search
+Create Date: 2026-10-19 14:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_feedback_stats'
+down_revision: Union[str, None] = '0003_full_text_search'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _counter_columns():
+    return [
+        sa.Column('feedback_count', sa.Integer(), nullable=False),
+        sa.Column('rating_count', sa.Integer(), nullable=False),
+        sa.Column('rating_sum', sa.BigInteger(), nullable=False),
+        sa.Column('accurate_count', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    ]
+
+
+def upgrade() -> None:
+    op.create_table('company_feedback_stats',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('company_id', sa.Integer(), nullable=False),
+        *_counter_columns(),
+        sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('company_id')
+    )
+    op.create_table('daily_feedback_stats',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('company_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        *_counter_columns(),
+        sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('company_id', 'day', name='uq_daily_feedback_stats_company_day')
+    )
+
+    # 기존 피드백 백필
+    op.execute("""
+        INSERT INTO daily_feedback_stats
+            (company_id, day, feedback_count, rating_count, rating_sum, accurate_count, updated_at)
+        SELECT h.company_id,
+               date(timezone('UTC', f.created_at)),
+               count(f.id),
+               count(f.rating),
+               coalesce(sum(f.rating), 0),
+               count(*) FILTER (WHERE f.is_accurate IS true),
+               now()
+        FROM chat_feedbacks f
+        JOIN chat_histories h ON f.chat_id = h.id
+        GROUP BY h.company_id, date(timezone('UTC', f.created_at))
+    """)
+    op.execute("""
+        INSERT INTO company_feedback_stats
+            (company_id, feedback_count, rating_count, rating_sum, accurate_count, updated_at)
+        SELECT company_id,
+               sum(feedback_count),
+               sum(rating_count),
+               sum(rating_sum),
+               sum(accurate_count),
+               now()
+        FROM daily_feedback_stats
+        GROUP BY company_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('daily_feedback_stats')
+    op.drop_table('company_feedback_stats')
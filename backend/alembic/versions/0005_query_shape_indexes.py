@@ -0,0 +1,61 @@
+"""composite and foreign-key indexes for hot query shapes
+
+- documents(company_id, type): 회사별 문서 목록 및 유형 필터
+- sections(document_id, order, id): 문서별 섹션 목록 정렬/키셋 페이지네이션
+- sections(company_id): 회사 단위 섹션 조회 및 회사 삭제 CASCADE
+- chat_histories(company_id, created_at DESC NULLS LAST, id DESC): 회사별 최근 채팅 이력
+- chat_references(chat_id), chat_references(document_id): 참조 조회 및 CASCADE
+
+쓰기를 막지 않도록 CONCURRENTLY로 생성합니다.
+
+Revision ID: 0005_query_shape_indexes
+Revises: 0004_feedback_stats
+Create Date: 2026-10-19 15:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_query_shape_indexes'
+down_revision: Union[str, None] = '0004_feedback_stats'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 인덱스 이름: (테이블, 컬럼/식 목록)
+INDEXES = {
+    'ix_documents_company_id_type': ('documents', ['company_id', 'type']),
+    'ix_sections_document_id_order': ('sections', ['document_id', 'order', 'id']),
+    'ix_sections_company_id': ('sections', ['company_id']),
+    'ix_chat_histories_company_id_created_at': (
+        'chat_histories',
+        ['company_id', sa.text('created_at DESC NULLS LAST'), sa.text('id DESC')]
+    ),
+    'ix_chat_references_chat_id': ('chat_references', ['chat_id']),
+    'ix_chat_references_document_id': ('chat_references', ['document_id']),
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, (table, columns) in INDEXES.items():
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, (table, _) in INDEXES.items():
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True
+            )
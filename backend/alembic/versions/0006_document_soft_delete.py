@@ -0,0 +1,35 @@
+"""document soft delete
+
+문서 삭제 시 deleted_at만 설정하고, 파일과 행은 정리 작업(file_reaper)이 제거합니다.
+정리 대기 문서 조회용 부분 인덱스를 함께 추가합니다.
+
+Revision ID: 0006_document_soft_delete
+Revises: 0005_query_shape_indexes
+Create Date: 2026-10-19 16:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0006_document_soft_delete'
+down_revision: Union[str, None] = '0005_query_shape_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('documents', sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        'ix_documents_deleted_at',
+        'documents',
+        ['deleted_at'],
+        postgresql_where=sa.text('deleted_at IS NOT NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_documents_deleted_at', table_name='documents')
+    op.drop_column('documents', 'deleted_at')
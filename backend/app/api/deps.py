@@ -1,41 +1,211 @@
-from typing import AsyncGenerator, Callable, Optional
-from fastapi import Depends, HTTPException, status
-from sqlalchemy import select
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional, Sequence, Type
+from urllib.parse import urlencode
+from fastapi import Depends, HTTPException, Request, Response, status
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 import functools
 
-from app.core.database import AsyncSessionLocal
+from app.core.database import AsyncSessionLocal, pin_primary
 from app.core.config import settings
-from app.models import Company, Document
+from app.crud.pagination import InvalidCursorError, Page
+from app.crud import company as crud_company, document as crud_document
+from app.models import Company
+from app.schemas.base import BulkItemResult, BulkResult, BulkStatus
+from app.services.list_cache import list_cache, make_etag
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# 데이터를 변경하지 않는 HTTP 메서드 (읽기 복제본 사용 가능)
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
 
 class DatabaseDependency:
     """데이터베이스 세션 관리를 위한 의존성 클래스"""
 
     @staticmethod
-    async def get_db() -> AsyncGenerator[AsyncSession, None]:
-        """데이터베이스 세션 의존성"""
+    async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+        """
+        데이터베이스 세션 의존성
+
+        읽기 복제본이 설정된 경우 GET/HEAD 요청의 읽기 전용 CRUD 조회는 복제본으로,
+        그 외(쓰기) 요청은 방금 쓴 데이터를 읽을 수 있도록 primary로 보냅니다.
+        """
         async with AsyncSessionLocal() as session:
+            if request.method not in SAFE_METHODS:
+                pin_primary(session)
             try:
                 yield session
             finally:
                 await session.close()
 
 class CommonQueryParams:
-    """공통 쿼리 파라미터"""
+    """공통 쿼리 파라미터
+
+    cursor가 주어지면 직전 응답의 X-Next-Cursor 이후부터 조회하며 skip은 무시됩니다.
+    sort_by/order를 지정하지 않으면 목록별 기본 정렬을 사용합니다.
+    목록 응답은 본문(content/response)을 제외한 요약으로 반환하며,
+    include=content를 지정한 경우에만 본문을 함께 조회합니다.
+    """
     def __init__(
         self,
         skip: int = 0,
         limit: int = 100,
         sort_by: Optional[str] = None,
-        order: Optional[str] = "asc"
+        order: Optional[str] = None,
+        cursor: Optional[str] = None,
+        include: Optional[str] = None
     ):
         self.skip = skip
         self.limit = min(limit, 100)
         self.sort_by = sort_by
-        self.order = order.lower() if order else "asc"
+        self.order = order.lower() if order else None
+        self.cursor = cursor
+        self.include = {part.strip() for part in include.split(",")} if include else set()
 
         if self.order not in ["asc", "desc"]:
-            self.order = "asc"
+            self.order = None
+
+    @property
+    def include_content(self) -> bool:
+        return "content" in self.include
+
+    @property
+    def load(self) -> Optional[str]:
+        """본문 포함 여부에 따른 CRUD 로딩 계획 (요약 응답은 본문 컬럼 지연 로딩)"""
+        return None if self.include_content else "summary"
+
+    @property
+    def page(self) -> Dict[str, Any]:
+        """CRUD 목록 조회 메서드에 전달할 페이지네이션 인자"""
+        return {
+            "skip": self.skip,
+            "limit": self.limit,
+            "sort_by": self.sort_by,
+            "order": self.order,
+            "cursor": self.cursor,
+        }
+
+def with_next_cursor(
+    response: Response,
+    page: Page,
+    schema: Optional[Type[BaseModel]] = None
+) -> Page:
+    """다음 페이지 커서를 응답 헤더(X-Next-Cursor)로 전달
+
+    schema가 주어지면 각 항목을 해당 응답 스키마로 변환합니다.
+    """
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    if schema is not None:
+        return Page([schema.model_validate(item) for item in page], page.next_cursor)
+    return page
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 약한 비교 (RFC 9110)"""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+def _not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """조건부 요청 헤더가 현재 버전과 일치하는지 (If-None-Match 우선)"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+def _validator_headers(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+def resource_etag(model: Type[Any], id: Any, updated_at: datetime) -> str:
+    """단일 리소스 ETag (테이블, ID, updated_at)"""
+    return make_etag(model.__tablename__, id, _as_utc(updated_at).isoformat())
+
+async def conditional_get(
+    request: Request,
+    db: AsyncSession,
+    crud: Any,
+    id: Any
+) -> Optional[Response]:
+    """단일 리소스 조건부 GET
+
+    If-None-Match/If-Modified-Since가 있으면 updated_at만 조회해 비교하고,
+    변경이 없으면 본문을 조회/직렬화하지 않고 304 응답을 반환합니다.
+    조건부 헤더가 없거나 변경된 경우 None (본 조회 후 set_validators 호출).
+    """
+    if "if-none-match" not in request.headers and "if-modified-since" not in request.headers:
+        return None
+    updated_at = await crud.get_version(db, id)
+    if updated_at is None:
+        return None
+    etag = resource_etag(crud.model, id, updated_at)
+    if _not_modified(request, etag, _as_utc(updated_at)):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=_validator_headers(etag, updated_at)
+        )
+    return None
+
+def set_validators(response: Response, obj: Any) -> None:
+    """응답에 ETag/Last-Modified 헤더 설정 (updated_at 기반)"""
+    response.headers.update(
+        _validator_headers(resource_etag(type(obj), obj.id, obj.updated_at), obj.updated_at)
+    )
+
+async def cached_list(
+    request: Request,
+    tables: Sequence[str],
+    load_page: Callable[[], Awaitable[Page]],
+    schema: Type[BaseModel]
+) -> Response:
+    """목록 응답 캐시 + 조건부 GET
+
+    같은 경로/쿼리의 목록은 짧은 TTL 동안 직렬화된 본문을 재사용하며(DB 조회 없음),
+    tables에 대한 쓰기가 커밋되면 캐시에서 제거됩니다. ETag는 본문 해시이므로
+    If-None-Match가 일치하면 304를 반환합니다. 유효성 검증(404 등)은 load_page 안에서 수행합니다.
+    """
+    key = f"{request.url.path}?{urlencode(sorted(request.query_params.multi_items()))}"
+    entry = list_cache.get(key)
+    if entry is None:
+        page = await load_page()
+        body = TypeAdapter(List[schema]).dump_json([schema.model_validate(item) for item in page])
+        headers = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor else {}
+        entry = list_cache.store(key, body, tables, headers)
+
+    if _not_modified(request, entry.etag):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=_validator_headers(entry.etag)
+        )
+    return Response(
+        content=entry.body,
+        media_type="application/json",
+        headers={**entry.headers, **_validator_headers(entry.etag)}
+    )
+
+def bulk_result(ids: Sequence[int], affected_ids: Sequence[int], done: BulkStatus) -> BulkResult:
+    """일괄 작업 결과 (요청 순서대로, 중복 ID는 한 번만)"""
+    affected = set(affected_ids)
+    results = [
+        BulkItemResult(id=id, status=done if id in affected else BulkStatus.NOT_FOUND)
+        for id in dict.fromkeys(ids)
+    ]
+    succeeded = sum(1 for item in results if item.status == done)
+    return BulkResult(succeeded=succeeded, not_found=len(results) - succeeded, results=results)
 
 async def validate_company(
     company_id: int,
@@ -43,6 +213,9 @@ async def validate_company(
 ) -> None:
     """회사 ID 유효성 검증
 
+    행 데이터가 필요 없으므로 EXISTS 쿼리로 확인하며,
+    같은 요청에서 이미 확인(조회)한 회사는 쿼리 없이 통과합니다.
+
     Args:
         company_id: 검증할 회사 ID
         db: 데이터베이스 세션
@@ -50,15 +223,35 @@ async def validate_company(
     Raises:
         HTTPException: 회사가 존재하지 않는 경우
     """
-    query = select(Company).where(Company.id == company_id)
-    result = await db.execute(query)
-    company = result.scalar_one_or_none()
+    if not await crud_company.exists(db, company_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"회사 ID {company_id}를 찾을 수 없습니다"
+        )
+
+async def get_company(
+    company_id: int,
+    db: AsyncSession = Depends(DatabaseDependency.get_db)
+) -> Company:
+    """회사 조회 (존재하지 않으면 404)
 
+    조회한 회사는 세션 identity map에 남으므로, 같은 요청에서
+    이어지는 crud.company.get 호출은 추가 쿼리 없이 처리됩니다.
+
+    Args:
+        company_id: 조회할 회사 ID
+        db: 데이터베이스 세션
+
+    Raises:
+        HTTPException: 회사가 존재하지 않는 경우
+    """
+    company = await crud_company.get(db, id=company_id)
     if not company:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"회사 ID {company_id}를 찾을 수 없습니다"
         )
+    return company
 
 async def validate_document(
     document_id: int,
@@ -73,11 +266,7 @@ async def validate_document(
     Raises:
         HTTPException: 문서가 존재하지 않는 경우
     """
-    query = select(Document).where(Document.id == document_id)
-    result = await db.execute(query)
-    document = result.scalar_one_or_none()
-
-    if not document:
+    if not await crud_document.exists(db, document_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"문서 ID {document_id}를 찾을 수 없습니다"
@@ -98,14 +287,7 @@ async def validate_document_ownership(
     Raises:
         HTTPException: 문서가 존재하지 않거나 해당 회사의 소유가 아닌 경우
     """
-    query = select(Document).where(
-        Document.id == document_id,
-        Document.company_id == company_id
-    )
-    result = await db.execute(query)
-    document = result.scalar_one_or_none()
-
-    if not document:
+    if not await crud_document.exists(db, document_id, company_id=company_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="문서를 찾을 수 없거나 접근 권한이 없습니다"
@@ -164,6 +346,11 @@ def handle_exceptions() -> Callable:
                 return await func(*args, **kwargs)
             except HTTPException:
                 raise
+            except InvalidCursorError as e:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=str(e)
+                )
             except Exception as e:
                 # 데이터베이스 관련 예외
                 if "duplicate key" in str(e).lower():
@@ -1,19 +1,151 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
+from typing import Any, Dict, List, Optional, Union
+import json
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
+from app.core.database import AsyncSessionLocal, pin_primary
 from app.schemas import ChatFeedbackUpdate
 from app.schemas.chat import (
-    ChatHistoryCreate, ChatHistoryInDB,
-    ChatReferenceCreate, ChatReferenceInDB,
+    ChatSessionCreate, ChatSessionInDB,
+    ChatHistoryCreate, ChatHistoryInDB, ChatRequest,
+    ChatReferenceCreate, ChatReferenceInDB, ChatHistoryWithReferences, ChatHistorySummary, ChatHistorySearchResult,
     ChatFeedbackCreate, ChatFeedbackInDB
 )
-from app.crud.chat import chat_history, chat_reference, chat_feedback
+from app.crud.chat import chat_session, chat_history, chat_reference, chat_feedback
+from app.crud.feedback_stat import feedback_stat
+from app.services.chat_service import chat_service
+from app.services.response_cache import response_cache
 
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+
+def _format_sse(event: str, data: Any) -> str:
+    """Server-Sent Events 메시지 포맷"""
+    payload = json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+async def _validate_session(session_id: int, company_id: int, db: AsyncSession):
+    """대화 세션 존재 및 회사 일치 여부 확인"""
+    db_session = await chat_session.get(db, id=session_id)
+    if not db_session or db_session.company_id != company_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Chat session not found"
+        )
+    return db_session
+
+# 대화 세션 관련 엔드포인트
+@router.post("/sessions", response_model=ChatSessionInDB, status_code=status.HTTP_201_CREATED)
+@deps.handle_exceptions()
+async def create_session(
+    session_in: ChatSessionCreate,
+    db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
+):
+    """새 대화 세션 생성"""
+    await deps.validate_company(session_in.company_id, db)
+    return await chat_session.create(db, obj_in=session_in)
+
+@router.get("/sessions/company/{company_id}", response_model=List[ChatSessionInDB])
+@deps.handle_exceptions()
+async def get_company_sessions(
+    response: Response,
+    company_id: int,
+    db: AsyncSession = Depends(deps.DatabaseDependency.get_db),
+    commons: deps.CommonQueryParams = Depends()
+):
+    """회사별 대화 세션 목록 조회"""
+    await deps.validate_company(company_id, db)
+    return deps.with_next_cursor(response, await chat_session.get_by_company(
+        db,
+        company_id=company_id,
+        **commons.page
+    ))
+
+@router.get("/sessions/{session_id}", response_model=ChatSessionInDB)
+@deps.handle_exceptions()
+async def get_session(
+    session_id: int,
+    db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
+):
+    """대화 세션 조회 (누적 요약 포함)"""
+    db_session = await chat_session.get(db, id=session_id)
+    if not db_session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Chat session not found"
+        )
+    return db_session
+
+# 채팅 응답 생성 엔드포인트
+@router.post("/ask", response_model=ChatHistoryWithReferences, status_code=status.HTTP_201_CREATED)
+@deps.handle_exceptions()
+async def ask(
+    chat_in: ChatRequest,
+    db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
+):
+    """질문에 대한 응답 생성 (채팅 이력과 참조 문서를 한 번에 저장하여 반환)"""
+    # 응답 생성에서 다시 사용하는 회사 정보를 미리 조회 (세션에 캐시됨)
+    await deps.get_company(chat_in.company_id, db)
+    if chat_in.session_id is not None:
+        await _validate_session(chat_in.session_id, chat_in.company_id, db)
+
+    return await chat_service.generate_response(
+        chat_in.company_id,
+        chat_in.query,
+        db,
+        session_id=chat_in.session_id
+    )
+
+# 채팅 응답 스트리밍 엔드포인트
+@router.post("/stream")
+@deps.handle_exceptions()
+async def stream_chat(
+    chat_in: ChatRequest,
+    db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
+):
+    """채팅 응답 스트리밍 (Server-Sent Events)
+
+    token 이벤트로 생성 중인 텍스트 조각을 전달하고,
+    완료 시 done 이벤트로 최종 응답과 저장된 채팅 ID를 전달합니다.
+    생성 도중 업스트림 오류가 나면 기본 응답을 저장하고 done 대신 error 이벤트를 전달합니다.
+    """
+    await deps.validate_company(chat_in.company_id, db)
+    if chat_in.session_id is not None:
+        await _validate_session(chat_in.session_id, chat_in.company_id, db)
+
+    async def event_stream():
+        # 스트림은 요청 의존성 종료 이후에도 계속되므로 별도 세션 사용
+        # (방금 생성된 회사/세션을 읽고 응답을 저장하는 쓰기 경로이므로 primary로 고정)
+        async with AsyncSessionLocal() as session:
+            pin_primary(session)
+            try:
+                async for event in chat_service.stream_response(
+                    chat_in.company_id,
+                    chat_in.query,
+                    session,
+                    session_id=chat_in.session_id
+                ):
+                    yield _format_sse(event.event, event.data)
+            except Exception as e:
+                logger.error(f"Error in chat stream: {str(e)}")
+                yield _format_sse("error", {"detail": "응답 생성 중 오류가 발생했습니다"})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"  # 프록시 버퍼링 비활성화
+        }
+    )
+
 # 채팅 이력 관련 엔드포인트
 @router.post("/history", response_model=ChatHistoryInDB)
 @deps.handle_exceptions()
@@ -26,21 +158,23 @@ async def create_chat(
     await deps.validate_company(chat_in.company_id, db)
     return await chat_history.create(db, obj_in=chat_in)
 
-@router.get("/history/company/{company_id}", response_model=List[ChatHistoryInDB])
+@router.get("/history/company/{company_id}", response_model=List[Union[ChatHistoryInDB, ChatHistorySummary]])
 @deps.handle_exceptions()
 async def get_company_chats(
+    response: Response,
     company_id: int,
     db: AsyncSession = Depends(deps.DatabaseDependency.get_db),
     commons: deps.CommonQueryParams = Depends()
 ):
     """회사별 채팅 이력 조회"""
+    schema = ChatHistoryInDB if commons.include_content else ChatHistorySummary
     await deps.validate_company(company_id, db)
-    return await chat_history.get_by_company(
+    return deps.with_next_cursor(response, await chat_history.get_by_company(
         db,
         company_id=company_id,
-        skip=commons.skip,
-        limit=commons.limit
-    )
+        load=commons.load,
+        **commons.page
+    ), schema)
 
 @router.get("/history/{chat_id}", response_model=ChatHistoryInDB)
 @deps.handle_exceptions()
@@ -156,23 +290,49 @@ async def get_company_feedback_stats(
     await deps.validate_company(company_id, db)
     return await chat_feedback.get_company_stats(db, company_id=company_id)
 
+@router.get("/feedback/stats/company/{company_id}/daily")
+@deps.handle_exceptions()
+async def get_company_daily_feedback_stats(
+    company_id: int,
+    start_day: Optional[date] = None,
+    end_day: Optional[date] = None,
+    db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
+):
+    """회사별 일자별 피드백 통계 조회"""
+    await deps.validate_company(company_id, db)
+    return await feedback_stat.get_daily_stats(
+        db,
+        company_id=company_id,
+        start_day=start_day,
+        end_day=end_day
+    )
+
 # 통합 검색 엔드포인트
-@router.get("/search", response_model=List[ChatHistoryInDB])
+@router.get("/search", response_model=List[ChatHistorySearchResult])
 @deps.handle_exceptions()
 async def search_chats(
+    response: Response,
     query: str,
     company_id: Optional[int] = None,
     db: AsyncSession = Depends(deps.DatabaseDependency.get_db),
     commons: deps.CommonQueryParams = Depends()
 ):
-    """채팅 이력 검색"""
+    """채팅 이력 검색 (관련도순, 검색어 강조 스니펫 포함)"""
     if company_id:
         await deps.validate_company(company_id, db)
-    return await chat_history.search_history(
+    return deps.with_next_cursor(response, await chat_history.search_history(
         db,
         query=query,
         company_id=company_id,
         skip=commons.skip,
-        limit=commons.limit
-    )
+        limit=commons.limit,
+        cursor=commons.cursor,
+        load="summary"
+    ))
 
+# 관리용 엔드포인트
+@router.get("/cache/stats")
+@deps.handle_exceptions()
+async def get_response_cache_stats():
+    """응답 캐시 적중률 및 절감 토큰 통계 조회"""
+    return response_cache.stats()
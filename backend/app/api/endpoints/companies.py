@@ -1,12 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List
+from datetime import date
+from typing import List, Optional
 
 from app.api import deps
 from app.models import Company
-from app.schemas import CompanyCreate, CompanyUpdate, CompanyInDB
+from app.schemas import CompanyCreate, CompanyUpdate, CompanyInDB, LLMUsageInDB
 from app.crud.company import company
+from app.crud.llm_usage import llm_usage
+from app.services.response_cache import response_cache
 
 router = APIRouter()
 
@@ -33,27 +36,59 @@ async def create_company(
 @router.get("/", response_model=List[CompanyInDB])
 @deps.handle_exceptions()
 async def get_companies(
+    request: Request,
     db: AsyncSession = Depends(deps.DatabaseDependency.get_db),
     commons: deps.CommonQueryParams = Depends()
 ):
-    """회사 목록 조회"""
-    if commons.sort_by:
-        return await company.get_sorted(db, sort_by=commons.sort_by, order=commons.order,
-                                        skip=commons.skip, limit=commons.limit)
-    return await company.get_multi(db, skip=commons.skip, limit=commons.limit)
+    """회사 목록 조회 (짧은 TTL 캐시, ETag 지원)"""
+    return await deps.cached_list(
+        request,
+        ("companies",),
+        lambda: company.get_multi(db, **commons.page),
+        CompanyInDB
+    )
 
 @router.get("/{company_id}", response_model=CompanyInDB)
 @deps.handle_exceptions()
 async def get_company(
+    request: Request,
+    response: Response,
     company_id: int,
     db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
 ):
-    """특정 회사 정보 조회"""
+    """특정 회사 정보 조회 (If-None-Match/If-Modified-Since 지원)"""
+    not_modified = await deps.conditional_get(request, db, company, company_id)
+    if not_modified:
+        return not_modified
+
     db_company = await company.get(db, id=company_id)
     if not db_company:
         raise HTTPException(status_code=404, detail="Company not found")
+    deps.set_validators(response, db_company)
     return db_company
 
+@router.get("/{company_id}/usage", response_model=List[LLMUsageInDB])
+@deps.handle_exceptions()
+async def get_company_usage(
+    response: Response,
+    company_id: int,
+    start_day: Optional[date] = None,
+    end_day: Optional[date] = None,
+    commons: deps.CommonQueryParams = Depends(),
+    db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
+):
+    """회사별 LLM 사용량 조회 (일자/호출 위치/모델 단위)"""
+    db_company = await company.get(db, id=company_id)
+    if not db_company:
+        raise HTTPException(status_code=404, detail="Company not found")
+    return deps.with_next_cursor(response, await llm_usage.get_by_company(
+        db,
+        company_id=company_id,
+        start_day=start_day,
+        end_day=end_day,
+        **commons.page
+    ))
+
 @router.put("/{company_id}", response_model=CompanyInDB)
 @deps.handle_exceptions()
 async def update_company(
@@ -65,7 +100,9 @@ async def update_company(
     db_company = await company.get(db, id=company_id)
     if not db_company:
         raise HTTPException(status_code=404, detail="Company not found")
-    return await company.update(db, db_obj=db_company, obj_in=company_in)
+    updated_company = await company.update(db, db_obj=db_company, obj_in=company_in)
+    response_cache.invalidate_company(company_id)
+    return updated_company
 
 @router.delete("/{company_id}", status_code=status.HTTP_204_NO_CONTENT)
 @deps.handle_exceptions()
@@ -78,3 +115,4 @@ async def delete_company(
     if not db_company:
         raise HTTPException(status_code=404, detail="Company not found")
     await company.remove(db, id=company_id)
+    response_cache.invalidate_company(company_id)
@@ -1,5 +1,5 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+from typing import List, Optional, Union
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status, UploadFile, File, Form
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
@@ -7,9 +7,17 @@ from app.models.document import DocumentType
 from app.schemas.document import (
     DocumentCreate,
     DocumentUpdate,
-    DocumentInDB
+    DocumentInDB,
+    DocumentSummary,
+    DocumentSearchResult,
+    DocumentBulkUpdate
 )
+from app.schemas.base import BulkIds, BulkResult, BulkStatus
+from app.schemas.batch_job import BatchJobCreate, BatchJobInDB, BatchJobWithItems
+from app.crud.batch_job import batch_job
 from app.crud.document import document
+from app.services.batch_generation import batch_generation_service
+from app.services.response_cache import response_cache
 
 
 router = APIRouter()
@@ -37,21 +45,104 @@ async def create_document(
     # 파일 타입 검증
     await deps.validate_file_type(file.content_type)
 
-    return await document.create_with_file(db=db, obj_in=document_in, file=file)
+    db_document = await document.create_with_file(db=db, obj_in=document_in, file=file)
+    response_cache.invalidate_company(document_in.company_id)
+    return db_document
+
+@router.post("/batch-generate", response_model=BatchJobInDB, status_code=status.HTTP_202_ACCEPTED)
+@deps.handle_exceptions()
+async def create_batch_generation(
+    job_in: BatchJobCreate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
+):
+    """템플릿 기반 문서 일괄 생성 작업 등록 (백그라운드 실행)"""
+    job = await batch_generation_service.create_job(db, obj_in=job_in)
+    background_tasks.add_task(batch_generation_service.run_job, job.id)
+    return job
+
+@router.get("/batch-jobs/{job_id}", response_model=BatchJobWithItems)
+@deps.handle_exceptions()
+async def get_batch_job(
+    job_id: int,
+    db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
+):
+    """일괄 생성 작업 진행 상황 조회"""
+    job = await batch_job.get_with_items(db, id=job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Batch job not found"
+        )
+    return job
+
+@router.post("/batch-jobs/{job_id}/resume", response_model=BatchJobInDB, status_code=status.HTTP_202_ACCEPTED)
+@deps.handle_exceptions()
+async def resume_batch_job(
+    job_id: int,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
+):
+    """중단되었거나 실패한 일괄 생성 작업 재개"""
+    job = await batch_job.get(db, id=job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Batch job not found"
+        )
+    background_tasks.add_task(batch_generation_service.run_job, job.id)
+    return job
+
+@router.post("/bulk-delete", response_model=BulkResult)
+@deps.handle_exceptions()
+async def bulk_delete_documents(
+    bulk_in: BulkIds,
+    db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
+):
+    """문서 일괄 삭제 (한 트랜잭션, 파일은 정리 작업이 백그라운드에서 삭제)"""
+    rows = await document.remove_multi(db, ids=bulk_in.ids, returning=("company_id",))
+    for company_id in {row.company_id for row in rows}:
+        response_cache.invalidate_company(company_id)
+    return deps.bulk_result(bulk_in.ids, [row.id for row in rows], BulkStatus.DELETED)
+
+@router.patch("/bulk", response_model=BulkResult)
+@deps.handle_exceptions()
+async def bulk_update_documents(
+    bulk_in: DocumentBulkUpdate,
+    db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
+):
+    """문서 유형/메타데이터 일괄 수정 (지정한 값을 모든 문서에 적용)"""
+    values = bulk_in.model_dump(exclude_unset=True, exclude={"ids"})
+    if not values:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="수정할 항목이 없습니다"
+        )
+    rows = await document.bulk_update(db, ids=bulk_in.ids, values=values, returning=("company_id",))
+    for company_id in {row.company_id for row in rows}:
+        response_cache.invalidate_company(company_id)
+    return deps.bulk_result(bulk_in.ids, [row.id for row in rows], BulkStatus.UPDATED)
 
 @router.get("/{document_id}", response_model=DocumentInDB)
 @deps.handle_exceptions()
 async def get_document(
+    request: Request,
+    response: Response,
     document_id: int,
     db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
 ):
-    """특정 문서 조회"""
+    """특정 문서 조회 (If-None-Match/If-Modified-Since 지원)"""
+    not_modified = await deps.conditional_get(request, db, document, document_id)
+    if not_modified:
+        return not_modified
+
     db_document = await document.get(db, id=document_id)
     if not db_document:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Document not found"
         )
+    deps.set_validators(response, db_document)
     return db_document
 
 @router.put("/{document_id}", response_model=DocumentInDB)
@@ -81,12 +172,14 @@ async def update_document(
     if file:
         await deps.validate_file_type(file.content_type)
 
-    return await document.update_with_file(
+    updated_document = await document.update_with_file(
         db=db,
         db_obj=db_document,
         obj_in=update_data,
         file=file
     )
+    response_cache.invalidate_company(updated_document.company_id)
+    return updated_document
 
 @router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT)
 @deps.handle_exceptions()
@@ -101,71 +194,83 @@ async def delete_document(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Document not found"
         )
+    company_id = db_document.company_id
     await document.remove_with_file(db=db, id=document_id)
+    response_cache.invalidate_company(company_id)
 
-@router.get("/company/{company_id}", response_model=List[DocumentInDB])
+@router.get("/company/{company_id}", response_model=List[Union[DocumentInDB, DocumentSummary]])
 @deps.handle_exceptions()
 async def get_company_documents(
+    request: Request,
     company_id: int,
     document_type: Optional[DocumentType] = None,
     db: AsyncSession = Depends(deps.DatabaseDependency.get_db),
     commons: deps.CommonQueryParams = Depends()
 ):
-    """회사의 문서 목록 조회"""
-    await deps.validate_company(company_id, db)
+    """회사의 문서 목록 조회 (짧은 TTL 캐시, ETag 지원)"""
+    schema = DocumentInDB if commons.include_content else DocumentSummary
 
-    if document_type:
-        return await document.get_by_type(
+    async def load_page():
+        await deps.validate_company(company_id, db)
+        if document_type:
+            return await document.get_by_type(
+                db,
+                doc_type=document_type,
+                company_id=company_id,
+                load=commons.load,
+                **commons.page
+            )
+        return await document.get_by_company(
             db,
-            doc_type=document_type,
             company_id=company_id,
-            skip=commons.skip,
-            limit=commons.limit
+            load=commons.load,
+            **commons.page
         )
-    return await document.get_by_company(
-        db,
-        company_id=company_id,
-        skip=commons.skip,
-        limit=commons.limit
-    )
 
-@router.get("/search/", response_model=List[DocumentInDB])
+    return await deps.cached_list(request, ("documents", "companies"), load_page, schema)
+
+@router.get("/search/", response_model=List[DocumentSearchResult])
 @deps.handle_exceptions()
 async def search_documents(
+    response: Response,
     query: str,
     company_id: Optional[int] = None,
     db: AsyncSession = Depends(deps.DatabaseDependency.get_db),
     commons: deps.CommonQueryParams = Depends()
 ):
-    """문서 검색"""
+    """문서 검색 (관련도순, 검색어 강조 스니펫 포함)"""
     if company_id:
         await deps.validate_company(company_id, db)
 
-    return await document.search_documents(
+    return deps.with_next_cursor(response, await document.search_documents(
         db,
         query=query,
         company_id=company_id,
         skip=commons.skip,
-        limit=commons.limit
-    )
+        limit=commons.limit,
+        cursor=commons.cursor,
+        load="summary"
+    ))
 
-@router.get("/types/", response_model=List[DocumentInDB])
+@router.get("/types/", response_model=List[Union[DocumentInDB, DocumentSummary]])
 @deps.handle_exceptions()
 async def get_documents_by_type(
+    response: Response,
     document_type: DocumentType,
     company_id: Optional[int] = None,
     db: AsyncSession = Depends(deps.DatabaseDependency.get_db),
     commons: deps.CommonQueryParams = Depends()
 ):
     """문서 유형별 조회"""
+    schema = DocumentInDB if commons.include_content else DocumentSummary
     if company_id:
         await deps.validate_company(company_id, db)
 
-    return await document.get_by_type(
+    return deps.with_next_cursor(response, await document.get_by_type(
         db,
         doc_type=document_type,
         company_id=company_id,
-        skip=commons.skip,
-        limit=commons.limit
-    )
+        load=commons.load,
+        **commons.page
+    ), schema)
 
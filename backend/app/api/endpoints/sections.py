@@ -1,5 +1,5 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api import deps
@@ -7,9 +7,14 @@ from app.models.section import SectionType
 from app.schemas.section import (
     SectionCreate,
     SectionUpdate,
-    SectionInDB
+    SectionInDB,
+    SectionSummary,
+    SectionReorder,
+    SectionBulkUpdate
 )
+from app.schemas.base import BulkIds, BulkResult, BulkStatus
 from app.crud.section import section
+from app.services.response_cache import response_cache
 
 router = APIRouter()
 
@@ -20,27 +25,63 @@ async def create_section(
     db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
 ):
     """새로운 섹션 생성"""
-    # 문서 존재 여부 확인
-    await deps.validate_document(section_in.document_id, db)
+    # 문서 존재 및 소유 회사 확인 (외래 키로 회사 존재도 보장됨)
+    await deps.validate_document_ownership(section_in.document_id, section_in.company_id, db)
 
-    # 회사 존재 여부 확인
-    await deps.validate_company(section_in.company_id, db)
+    db_section = await section.create_with_order(db=db, obj_in=section_in)
+    response_cache.invalidate_company(section_in.company_id)
+    return db_section
 
-    return await section.create_with_order(db=db, obj_in=section_in)
+@router.post("/bulk-delete", response_model=BulkResult)
+@deps.handle_exceptions()
+async def bulk_delete_sections(
+    bulk_in: BulkIds,
+    db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
+):
+    """섹션 일괄 삭제 (한 트랜잭션)"""
+    rows = await section.remove_multi(db, ids=bulk_in.ids, returning=("company_id",))
+    for company_id in {row.company_id for row in rows}:
+        response_cache.invalidate_company(company_id)
+    return deps.bulk_result(bulk_in.ids, [row.id for row in rows], BulkStatus.DELETED)
+
+@router.patch("/bulk", response_model=BulkResult)
+@deps.handle_exceptions()
+async def bulk_update_sections(
+    bulk_in: SectionBulkUpdate,
+    db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
+):
+    """섹션 유형/메타데이터 일괄 수정 (지정한 값을 모든 섹션에 적용)"""
+    values = bulk_in.model_dump(exclude_unset=True, exclude={"ids"})
+    if not values:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="수정할 항목이 없습니다"
+        )
+    rows = await section.bulk_update(db, ids=bulk_in.ids, values=values, returning=("company_id",))
+    for company_id in {row.company_id for row in rows}:
+        response_cache.invalidate_company(company_id)
+    return deps.bulk_result(bulk_in.ids, [row.id for row in rows], BulkStatus.UPDATED)
 
 @router.get("/{section_id}", response_model=SectionInDB)
 @deps.handle_exceptions()
 async def get_section(
+    request: Request,
+    response: Response,
     section_id: int,
     db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
 ):
-    """특정 섹션 조회"""
+    """특정 섹션 조회 (If-None-Match/If-Modified-Since 지원)"""
+    not_modified = await deps.conditional_get(request, db, section, section_id)
+    if not_modified:
+        return not_modified
+
     db_section = await section.get(db, id=section_id)
     if not db_section:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Section not found"
         )
+    deps.set_validators(response, db_section)
     return db_section
 
 @router.put("/{section_id}", response_model=SectionInDB)
@@ -57,7 +98,9 @@ async def update_section(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Section not found"
         )
-    return await section.update(db, db_obj=db_section, obj_in=section_in)
+    updated_section = await section.update(db, db_obj=db_section, obj_in=section_in)
+    response_cache.invalidate_company(updated_section.company_id)
+    return updated_section
 
 @router.delete("/{section_id}",  status_code=status.HTTP_204_NO_CONTENT)
 @deps.handle_exceptions()
@@ -72,51 +115,82 @@ async def delete_section(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Section not found"
         )
+    company_id = db_section.company_id
     await section.remove(db, id=section_id)
+    response_cache.invalidate_company(company_id)
 
-@router.get("/document/{document_id}", response_model=List[SectionInDB])
+@router.get("/document/{document_id}", response_model=List[Union[SectionInDB, SectionSummary]])
 @deps.handle_exceptions()
 async def get_document_sections(
+    request: Request,
     document_id: int,
     section_type: Optional[SectionType] = None,
     db: AsyncSession = Depends(deps.DatabaseDependency.get_db),
     commons: deps.CommonQueryParams = Depends()
 ):
-    """문서의 섹션 목록 조회"""
-    await deps.validate_document(document_id, db)
+    """문서의 섹션 목록 조회 (짧은 TTL 캐시, ETag 지원)"""
+    schema = SectionInDB if commons.include_content else SectionSummary
 
-    if section_type:
-        return await section.get_by_type(
+    async def load_page():
+        await deps.validate_document(document_id, db)
+        if section_type:
+            return await section.get_by_type(
+                db,
+                section_type=section_type,
+                document_id=document_id,
+                load=commons.load,
+                **commons.page
+            )
+        return await section.get_by_document(
             db,
-            section_type=section_type,
             document_id=document_id,
-            skip=commons.skip,
-            limit=commons.limit
+            load=commons.load,
+            **commons.page
         )
-    return await section.get_by_document(
+
+    return await deps.cached_list(request, ("sections", "documents", "companies"), load_page, schema)
+
+@router.put("/document/{document_id}/order", response_model=List[SectionSummary])
+@deps.handle_exceptions()
+async def reorder_document_sections(
+    document_id: int,
+    reorder_in: SectionReorder,
+    db: AsyncSession = Depends(deps.DatabaseDependency.get_db)
+):
+    """문서 섹션 순서 일괄 변경 (편집기 드래그 1회당 1번 호출)"""
+    reordered = await section.reorder_sections(
         db,
         document_id=document_id,
-        skip=commons.skip,
-        limit=commons.limit
+        section_orders=reorder_in.section_orders
     )
+    if reordered is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="문서에 속하지 않은 섹션이 포함되어 있습니다"
+        )
+    if reordered:
+        response_cache.invalidate_company(reordered[0].company_id)
+    return reordered
 
-@router.get("/types/", response_model=List[SectionInDB])
+@router.get("/types/", response_model=List[Union[SectionInDB, SectionSummary]])
 @deps.handle_exceptions()
 async def get_sections_by_type(
+    response: Response,
     section_type: SectionType,
     document_id: Optional[int] = None,
     db: AsyncSession = Depends(deps.DatabaseDependency.get_db),
     commons: deps.CommonQueryParams = Depends()
 ):
     """섹션 유형별 조회"""
+    schema = SectionInDB if commons.include_content else SectionSummary
     if document_id:
         await deps.validate_document(document_id, db)
 
-    return await section.get_by_type(
+    return deps.with_next_cursor(response, await section.get_by_type(
         db,
         section_type=section_type,
         document_id=document_id,
-        skip=commons.skip,
-        limit=commons.limit
-    )
+        load=commons.load,
+        **commons.page
+    ), schema)
 
@@ -40,10 +40,82 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     ASYNC_DATABASE_URL: Optional[str] = None
 
+    # Database Pool Settings (프로세스/엔진당 값, 최대 연결 수 = 워커 수 x (SIZE + MAX_OVERFLOW))
+    DB_POOL_SIZE: int = 5  # 유지하는 연결 수
+    DB_POOL_MAX_OVERFLOW: int = 10  # 부하 시 추가로 여는 연결 수
+    DB_POOL_TIMEOUT: float = 30.0  # 연결 대기 최대 시간 (seconds)
+    DB_POOL_RECYCLE: int = 1800  # 이 시간(seconds)보다 오래된 연결은 재생성 (-1: 비활성화)
+    # 체크아웃마다 ping 왕복 수행 여부 (끄면 DB_POOL_RECYCLE로 오래된 연결을 교체하고,
+    # 끊어진 연결은 오류 발생 시 풀 전체를 무효화해 복구)
+    DB_POOL_PRE_PING: bool = False
+    DB_STATEMENT_CACHE_SIZE: int = 100  # 연결당 prepared statement 캐시 크기 (pgbouncer transaction 모드: 0)
+
+    # Read Replica Settings (비어 있으면 모든 쿼리를 ASYNC_DATABASE_URL로 전송)
+    ASYNC_DATABASE_REPLICA_URLS: List[str] = []
+    DB_REPLICA_HEALTH_CHECK_SECONDS: float = 10.0  # 복제본 상태/지연 확인 주기
+    DB_REPLICA_RETRY_SECONDS: float = 30.0  # 장애 복제본을 다시 사용하기까지 대기 시간
+    DB_REPLICA_MAX_LAG_SECONDS: float = 5.0  # 이보다 지연된 복제본은 제외
+
     # OpenAI Settings
     OPENAI_API_KEY: str
     GPT_MODEL: str = "gpt-4-1106-preview"
 
+    # LLM Gateway Settings
+    LLM_MAX_CONNECTIONS: int = 100
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_KEEPALIVE_EXPIRY: float = 30.0  # seconds
+    LLM_TIMEOUT_SECONDS: float = 60.0
+    LLM_MAX_RETRIES: int = 3
+    LLM_BACKOFF_BASE_SECONDS: float = 0.5
+    LLM_BACKOFF_MAX_SECONDS: float = 20.0
+    LLM_DEFAULT_RPM: int = 500  # 모델별 설정이 없을 때 분당 요청 수
+    LLM_DEFAULT_TPM: int = 150000  # 모델별 설정이 없을 때 분당 토큰 수
+    # 모델별 제한 (예: {"gpt-4-1106-preview": {"rpm": 500, "tpm": 150000}})
+    LLM_RATE_LIMITS: Dict[str, Dict[str, int]] = {}
+    LLM_CIRCUIT_FAILURE_THRESHOLD: int = 5  # 연속 실패 시 서킷 오픈
+    LLM_CIRCUIT_RECOVERY_SECONDS: float = 30.0  # 오픈 유지 시간 (이후 시험 호출)
+    LLM_CIRCUIT_HALF_OPEN_MAX_CALLS: int = 1
+    # 모델별 1K 토큰당 가격 (USD, 비용 추정용)
+    LLM_PRICING: Dict[str, Dict[str, float]] = {
+        "gpt-4-1106-preview": {"prompt": 0.01, "completion": 0.03},
+        "text-embedding-ada-002": {"prompt": 0.0001, "completion": 0.0},
+    }
+    LLM_USAGE_FLUSH_SECONDS: float = 30.0  # 사용량 집계 DB 반영 주기
+    LLM_USAGE_MAX_PENDING_ROWS: int = 10000  # DB 반영 실패 시 메모리에 보관할 최대 집계 행 수
+
+    # Batch Generation Settings
+    BATCH_GENERATION_CONCURRENCY: int = 8  # 섹션 커스터마이징 동시 작업 수
+    BATCH_PROGRESS_LOG_INTERVAL: int = 50  # 처리량 로그 주기 (섹션 수)
+
+    # Chat Context Settings
+    CONTEXT_MAX_TOKENS: int = 6000  # 컨텍스트 전체 토큰 예산
+    CONTEXT_PROFILE_MAX_TOKENS: int = 500  # 회사 정보 토큰 예산
+
+    # Chat Validation Settings
+    CHAT_VALIDATION_KEYWORD_DEADLINE_CHARS: int = 600  # 필수 키워드 확인 마감 길이 (문자)
+    CHAT_VALIDATION_MIN_HANGUL_RATIO: float = 0.3  # 응답 글자 중 한글 최소 비율
+
+    # Conversation Memory Settings
+    CHAT_MEMORY_TURNS: int = 3  # 원문 그대로 유지할 최근 대화 수
+    CHAT_MEMORY_TURN_MAX_TOKENS: int = 300  # 대화 1건(질문/응답 각각)의 최대 토큰
+    CHAT_MEMORY_SUMMARY_MAX_TOKENS: int = 400  # 누적 요약 최대 토큰
+
+    # Response Cache Settings
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_SIMILARITY_THRESHOLD: float = 0.95  # 유사 질문 판정 코사인 유사도
+    RESPONSE_CACHE_TTL_SECONDS: int = 24 * 60 * 60
+    RESPONSE_CACHE_MAX_ENTRIES: int = 200  # 회사별 최대 캐시 항목 수
+
+    # HTTP List Cache Settings (목록 응답 캐시, 워커 프로세스별)
+    LIST_CACHE_ENABLED: bool = True
+    LIST_CACHE_TTL_SECONDS: float = 5.0  # 다른 워커의 쓰기가 반영되기까지 최대 지연
+    LIST_CACHE_MAX_ENTRIES: int = 1000
+
+    # File Reaper Settings (삭제 문서/고아 파일 정리)
+    FILE_REAPER_INTERVAL_SECONDS: float = 300.0
+    FILE_REAPER_BATCH_SIZE: int = 100  # 한 번에 정리할 삭제 문서 수
+    FILE_REAPER_ORPHAN_GRACE_SECONDS: int = 3600  # 업로드 중인 파일을 건드리지 않도록 이보다 오래된 파일만 고아로 판단
+
     # File Upload Settings
     UPLOAD_DIR: DirectoryPath
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10MB in bytes
@@ -68,6 +140,10 @@ class Settings(BaseSettings):
             raise ValueError("Either ASYNC_DATABASE_URL or DATABASE_URL must be provided")
         return str(db_url).replace("postgresql://", "postgresql+asyncpg://")
 
+    @field_validator("ASYNC_DATABASE_REPLICA_URLS")
+    def assemble_async_replica_urls(cls, v: List[str]) -> List[str]:
+        return [url.replace("postgresql://", "postgresql+asyncpg://") for url in v]
+
     @field_validator("UPLOAD_DIR", mode='before')
     def create_upload_dir(cls, v: str) -> Path:
         path = Path(v)
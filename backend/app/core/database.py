@@ -1,31 +1,210 @@
-from venv import create
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict, Generator, Iterator, Union
 
-from requests import session
-from sqlalchemy import create_engine
+from sqlalchemy import Select, create_engine, exc
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 from .config import settings
-
-# Sync engine
-engine = create_engine(
-    str(settings.DATABASE_URL),
-    pool_pre_ping=True,
-    echo=settings.DEBUG
+from .metrics import (
+    DB_POOL_CHECKOUT_TIMEOUTS,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_IDLE,
+    DB_POOL_IN_USE,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_ROUTED_QUERIES
 )
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+from .replicas import ReplicaRouter
+
+# 엔진은 import 시점이 아니라 첫 쿼리(또는 명시적 호출) 시점에 생성합니다.
+# 워커 기동/테스트 수집 시 DB 드라이버 로딩과 커넥션 풀 생성을 피하고,
+# 실제로 사용하는 엔진(대부분 비동기 엔진 하나)만 만들어집니다.
+
+
+class _InstrumentedPoolMixin:
+    """연결 체크아웃 대기 시간/타임아웃을 메트릭으로 기록하는 풀 (라벨은 pool_logging_name)"""
+
+    def connect(self):
+        pool_name = self.logging_name or "default"
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.labels(pool=pool_name).inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.labels(pool=pool_name).observe(time.perf_counter() - started)
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
 
-# Async engine
-async_engine = create_async_engine(
-    settings.ASYNC_DATABASE_URL,
-    pool_pre_ping=True,
-    echo=settings.DEBUG
+def _pool_options(pool_name: str) -> Dict[str, Any]:
+    """설정 기반 커넥션 풀 옵션"""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_POOL_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_logging_name": pool_name,
+        "echo": settings.DEBUG,
+    }
+
+
+def register_pool_metrics(engine: Engine, pool_name: str) -> None:
+    """
+    풀 상태 Gauge 등록 (수집 시점의 값)
+
+    dispose() 시 풀이 새로 만들어지므로 풀이 아니라 엔진을 통해 조회합니다.
+    """
+    DB_POOL_SIZE.labels(pool=pool_name).set_function(lambda: engine.pool.size())
+    DB_POOL_IN_USE.labels(pool=pool_name).set_function(lambda: engine.pool.checkedout())
+    DB_POOL_IDLE.labels(pool=pool_name).set_function(lambda: engine.pool.checkedin())
+    DB_POOL_OVERFLOW.labels(pool=pool_name).set_function(lambda: max(engine.pool.overflow(), 0))
+
+
+@lru_cache(maxsize=None)
+def get_engine() -> Engine:
+    """동기 엔진 (스크립트/마이그레이션용, 첫 호출 시 생성)"""
+    engine = create_engine(
+        str(settings.DATABASE_URL),
+        poolclass=InstrumentedQueuePool,
+        **_pool_options("sync")
+    )
+    register_pool_metrics(engine, "sync")
+    return engine
+
+
+def _create_async_engine(url: str, pool_name: str) -> AsyncEngine:
+    engine = create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        connect_args={
+            # asyncpg 자체 캐시와 SQLAlchemy 어댑터의 prepared statement 캐시
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
+        **_pool_options(pool_name)
+    )
+    register_pool_metrics(engine.sync_engine, pool_name)
+    return engine
+
+
+@lru_cache(maxsize=None)
+def get_async_engine() -> AsyncEngine:
+    """비동기 엔진 (primary, 첫 호출 시 생성)"""
+    return _create_async_engine(settings.ASYNC_DATABASE_URL, "async")
+
+
+# 읽기 전용 복제본 (ASYNC_DATABASE_REPLICA_URLS가 비어 있으면 비활성화)
+replica_router = ReplicaRouter(
+    settings.ASYNC_DATABASE_REPLICA_URLS,
+    lambda url, index: _create_async_engine(url, f"replica-{index}"),
+    retry_seconds=settings.DB_REPLICA_RETRY_SECONDS,
+    max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS
 )
+
+
+async def dispose_engines() -> None:
+    """생성된 엔진의 커넥션 풀 종료 (애플리케이션 종료 시)"""
+    await replica_router.dispose()
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+        get_async_engine.cache_clear()
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
+        get_engine.cache_clear()
+
+
+# 세션 라우팅 상태 (session.info 키)
+REPLICA_READS_KEY = "db_replica_reads"  # 복제본 조회 허용 구간 깊이
+STALE_READS_KEY = "db_stale_reads"  # primary 고정 요청에서도 복제본 조회를 허용하는 구간 깊이
+PRIMARY_PINNED_KEY = "db_primary_pinned"  # 쓰기 요청 (요청 전체를 primary로)
+PRIMARY_WRITTEN_KEY = "db_primary_written"  # 세션에서 쓰기 발생 (이후 조회는 항상 primary)
+
+
+@contextmanager
+def use_replica(session: Union[Session, AsyncSession], *, allow_stale: bool = False) -> Iterator[None]:
+    """
+    구간 내 SELECT를 복제본으로 전송
+
+    같은 세션에서 이미 쓰기가 있었다면 자신의 변경을 읽도록 primary를 사용합니다.
+    pin_primary()로 고정된 세션은 allow_stale=True인 경우(복제 지연이 허용되는
+    검색/조회)에만 복제본을 사용합니다.
+    """
+    key = STALE_READS_KEY if allow_stale else REPLICA_READS_KEY
+    session.info[key] = session.info.get(key, 0) + 1
+    try:
+        yield
+    finally:
+        session.info[key] -= 1
+
+
+def pin_primary(session: Union[Session, AsyncSession]) -> None:
+    """세션의 조회를 primary로 고정 (쓰기 요청의 read-your-writes 보장)"""
+    session.info[PRIMARY_PINNED_KEY] = True
+
+
+class LazySyncSession(Session):
+    """bind를 지정하지 않으면 첫 쿼리 시점의 동기 엔진을 사용하는 세션"""
+
+    def get_bind(self, mapper=None, **kwargs):
+        if self.bind is None:
+            return get_engine()
+        return super().get_bind(mapper, **kwargs)
+
+
+class RoutingSession(Session):
+    """
+    AsyncSession 내부 세션 (bind를 지정하지 않은 경우의 라우팅)
+
+    - 쓰기(flush, INSERT/UPDATE/DELETE, 텍스트 SQL)는 primary로 보내고 이후 세션 전체를 primary로 고정
+    - use_replica() 구간의 SELECT는 사용 가능한 복제본으로 (없으면 primary)
+    - 엔진은 첫 쿼리 시점에 생성
+    """
+
+    def get_bind(self, mapper=None, *, clause=None, **kwargs):
+        if self.bind is not None or kwargs.get("bind") is not None:
+            return super().get_bind(mapper, clause=clause, **kwargs)
+
+        if self._flushing or (clause is not None and not isinstance(clause, Select)):
+            self.info[PRIMARY_WRITTEN_KEY] = True
+        elif clause is not None and self._reads_from_replica():
+            engine = replica_router.choose()
+            if engine is not None:
+                DB_ROUTED_QUERIES.labels(target="replica").inc()
+                return engine.sync_engine
+
+        DB_ROUTED_QUERIES.labels(target="primary").inc()
+        return get_async_engine().sync_engine
+
+    def _reads_from_replica(self) -> bool:
+        if not replica_router.enabled or self.info.get(PRIMARY_WRITTEN_KEY):
+            return False
+        if self.info.get(STALE_READS_KEY):
+            return True
+        return bool(self.info.get(REPLICA_READS_KEY)) and not self.info.get(PRIMARY_PINNED_KEY)
+
+
+# Sync sessions
+SessionLocal = sessionmaker(class_=LazySyncSession, autocommit=False, autoflush=False)
+
+# Async sessions
 AsyncSessionLocal = sessionmaker(
-    async_engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
     autocommit=False,
     autoflush=False
 )
@@ -33,7 +212,7 @@ AsyncSessionLocal = sessionmaker(
 Base = declarative_base()
 
 # Dependency for sync operations
-def get_db() -> Session:
+def get_db() -> Generator[Session, None, None]:
     db = SessionLocal()
     try:
         yield db
@@ -41,7 +220,7 @@ def get_db() -> Session:
         db.close()
 
 # Dependency for async operations
-async def get_async_db() -> AsyncSession:
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         try:
             yield session
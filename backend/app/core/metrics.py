@@ -0,0 +1,125 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+# 서킷 상태 값 (Gauge용)
+CIRCUIT_STATE_VALUES = {
+    "closed": 0,
+    "half_open": 1,
+    "open": 2,
+}
+
+# DB 커넥션 풀 (풀 상태 Gauge는 엔진 생성 시 수집 시점 값으로 등록)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "vouchergpt_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled database connection",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30)
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "vouchergpt_db_pool_checkout_timeouts_total",
+    "Connection checkouts that timed out waiting for the pool",
+    ["pool"]
+)
+DB_POOL_SIZE = Gauge(
+    "vouchergpt_db_pool_size",
+    "Configured number of persistent connections in the pool",
+    ["pool"]
+)
+DB_POOL_IN_USE = Gauge(
+    "vouchergpt_db_pool_in_use_connections",
+    "Connections currently checked out of the pool",
+    ["pool"]
+)
+DB_POOL_IDLE = Gauge(
+    "vouchergpt_db_pool_idle_connections",
+    "Open connections waiting in the pool",
+    ["pool"]
+)
+DB_POOL_OVERFLOW = Gauge(
+    "vouchergpt_db_pool_overflow_connections",
+    "Connections opened beyond the pool size",
+    ["pool"]
+)
+
+DB_REPLICA_HEALTHY = Gauge(
+    "vouchergpt_db_replica_healthy",
+    "Whether the read replica is used for routing (1=healthy, 0=excluded)",
+    ["replica"]
+)
+DB_REPLICA_LAG = Gauge(
+    "vouchergpt_db_replica_lag_seconds",
+    "Replication lag measured by the last replica health check",
+    ["replica"]
+)
+DB_ROUTED_QUERIES = Counter(
+    "vouchergpt_db_routed_queries_total",
+    "Queries routed by the session router",
+    ["target"]
+)
+
+# 파일 정리 작업 (kind: deleted_document=삭제 문서 파일, orphan=참조되지 않는 파일)
+FILE_REAPER_FILES_REMOVED = Counter(
+    "vouchergpt_file_reaper_files_removed_total",
+    "Upload files removed by the file reaper",
+    ["kind"]
+)
+FILE_REAPER_BYTES_RECLAIMED = Counter(
+    "vouchergpt_file_reaper_reclaimed_bytes_total",
+    "Disk space reclaimed by the file reaper",
+    ["kind"]
+)
+FILE_REAPER_FAILURES = Counter(
+    "vouchergpt_file_reaper_failures_total",
+    "Upload files the file reaper failed to remove",
+    ["kind"]
+)
+
+# LLM 서킷 브레이커
+LLM_CIRCUIT_STATE = Gauge(
+    "vouchergpt_llm_circuit_state",
+    "LLM circuit breaker state (0=closed, 1=half_open, 2=open)",
+    ["model"]
+)
+LLM_CIRCUIT_TRIPS = Counter(
+    "vouchergpt_llm_circuit_trips_total",
+    "Number of times the LLM circuit breaker opened",
+    ["model"]
+)
+LLM_CIRCUIT_REJECTED = Counter(
+    "vouchergpt_llm_circuit_rejected_total",
+    "LLM calls rejected while the circuit breaker was open",
+    ["model"]
+)
+
+# LLM 호출 (호출 위치/모델 단위, 회사별 집계는 llm_usages 테이블)
+LLM_CALL_DURATION = Histogram(
+    "vouchergpt_llm_call_duration_seconds",
+    "Wall time of LLM calls including retries",
+    ["call_site", "model", "outcome"],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+)
+LLM_TIME_TO_FIRST_TOKEN = Histogram(
+    "vouchergpt_llm_time_to_first_token_seconds",
+    "Time until the first streamed token arrives",
+    ["call_site", "model"],
+    buckets=(0.1, 0.25, 0.5, 1, 2, 4, 8, 16)
+)
+LLM_TOKENS = Counter(
+    "vouchergpt_llm_tokens_total",
+    "Tokens consumed by LLM calls",
+    ["call_site", "model", "kind"]
+)
+LLM_RETRIES = Counter(
+    "vouchergpt_llm_retries_total",
+    "Retried LLM call attempts",
+    ["call_site", "model"]
+)
+LLM_VALIDATION_FAILURES = Counter(
+    "vouchergpt_llm_validation_failures_total",
+    "Generated responses rejected by validation",
+    ["call_site", "model", "reason"]
+)
+LLM_ESTIMATED_COST = Counter(
+    "vouchergpt_llm_estimated_cost_usd_total",
+    "Estimated LLM spend in USD",
+    ["call_site", "model"]
+)
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from .metrics import DB_REPLICA_HEALTHY, DB_REPLICA_LAG
+
+logger = logging.getLogger(__name__)
+
+# 복제 지연 (WAL을 모두 재생했으면 0, 복제본이 아닌 서버에서는 NULL → 0)
+REPLICA_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class ReplicaRouter:
+    """
+    읽기 전용 복제본 선택
+
+    - 사용 가능한 복제본을 라운드 로빈으로 선택
+    - 연결 실패/끊김이 발생하거나 헬스 체크에서 지연이 max_lag_seconds를 넘은 복제본은
+      retry_seconds 동안 제외 (이후 자동으로 다시 시도)
+    - 사용 가능한 복제본이 없으면 None (호출 측에서 primary 사용)
+
+    엔진은 처음 선택될 때 engine_factory(url, index)로 생성합니다.
+    """
+
+    def __init__(
+        self,
+        urls: List[str],
+        engine_factory: Callable[[str, int], AsyncEngine],
+        *,
+        retry_seconds: float,
+        max_lag_seconds: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.urls = list(urls)
+        self.retry_seconds = retry_seconds
+        self.max_lag_seconds = max_lag_seconds
+        self._engine_factory = engine_factory
+        self._clock = clock
+        self._engines: Dict[int, AsyncEngine] = {}
+        self._down_until = [0.0] * len(self.urls)
+        self._next = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.urls)
+
+    def engine(self, index: int) -> AsyncEngine:
+        """복제본 엔진 조회 (첫 사용 시 생성)"""
+        if index not in self._engines:
+            engine = self._engine_factory(self.urls[index], index)
+
+            @event.listens_for(engine.sync_engine, "handle_error")
+            def _on_error(context: ExceptionContext) -> None:
+                # 연결 수립 실패(connection 없음) 또는 연결 끊김만 복제본 장애로 간주
+                if context.is_disconnect or context.connection is None:
+                    self.mark_down(index, str(context.original_exception))
+
+            self._engines[index] = engine
+            DB_REPLICA_HEALTHY.labels(replica=str(index)).set(1)
+        return self._engines[index]
+
+    def is_available(self, index: int) -> bool:
+        return self._down_until[index] <= self._clock()
+
+    def choose(self) -> Optional[AsyncEngine]:
+        """다음 사용 가능한 복제본 엔진 (없으면 None)"""
+        for _ in range(len(self.urls)):
+            index = self._next
+            self._next = (self._next + 1) % len(self.urls)
+            if self.is_available(index):
+                return self.engine(index)
+        return None
+
+    def mark_down(self, index: int, reason: str) -> None:
+        """복제본을 retry_seconds 동안 라우팅에서 제외"""
+        if self.is_available(index):
+            logger.warning(f"Excluding read replica {index} for {self.retry_seconds:.0f}s: {reason}")
+        self._down_until[index] = self._clock() + self.retry_seconds
+        DB_REPLICA_HEALTHY.labels(replica=str(index)).set(0)
+
+    def mark_up(self, index: int) -> None:
+        if not self.is_available(index):
+            logger.info(f"Read replica {index} is back in rotation")
+        self._down_until[index] = 0.0
+        DB_REPLICA_HEALTHY.labels(replica=str(index)).set(1)
+
+    async def check(self) -> None:
+        """모든 복제본의 연결 및 복제 지연 확인"""
+        for index in range(len(self.urls)):
+            try:
+                async with self.engine(index).connect() as conn:
+                    lag = float(await conn.scalar(REPLICA_LAG_QUERY) or 0)
+            except Exception as e:
+                self.mark_down(index, f"health check failed: {str(e)}")
+                continue
+
+            DB_REPLICA_LAG.labels(replica=str(index)).set(lag)
+            if lag > self.max_lag_seconds:
+                self.mark_down(index, f"replication lag {lag:.1f}s")
+            else:
+                self.mark_up(index)
+
+    async def run_health_checks(self, interval: float) -> None:
+        """주기적으로 복제본 상태 확인 (백그라운드 태스크)"""
+        while True:
+            await self.check()
+            await asyncio.sleep(interval)
+
+    async def dispose(self) -> None:
+        """생성된 복제본 엔진의 커넥션 풀 종료"""
+        for engine in self._engines.values():
+            await engine.dispose()
+        self._engines.clear()
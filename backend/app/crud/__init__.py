@@ -3,7 +3,15 @@ from .base import CRUDBase
 from .company import company  # 별칭 없이 직접 import
 from .document import document  # 아직 구현되지 않은 것들은 주석처리
 from .section import section
-from .chat import chat_history, chat_reference, chat_feedback
+from .chat import chat_session, chat_history, chat_reference, chat_feedback
+from .llm_usage import llm_usage
+from .feedback_stat import feedback_stat
+from .batch_job import batch_job
+
+# 서비스 계층에서 사용하는 별칭
+crud_company = company
+crud_document = document
+crud_section = section
 
 # Export all CRUD instances and base class
 __all__ = [
@@ -12,7 +20,14 @@ __all__ = [
     "company",
     "document",
     "section",
+    "chat_session",
     "chat_history",
     "chat_reference",
     "chat_feedback",
+    "llm_usage",
+    "feedback_stat",
+    "batch_job",
+    "crud_company",
+    "crud_document",
+    "crud_section",
 ]
\ No newline at end of file
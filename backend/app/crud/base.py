@@ -1,16 +1,57 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+import functools
+from datetime import datetime
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type, TypeVar, Union
 from fastapi.encoders import jsonable_encoder
 from pydantic import  BaseModel
-from sqlalchemy import select, update, delete, desc
+from sqlalchemy import Float, Row, Select, asc, func, literal, or_, select, update, delete, desc
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlalchemy.orm.util import identity_key
 
-from app.core.database import Base
+from app.core.database import Base, pin_primary, use_replica
+from app.crud.pagination import Page, decode_cursor, encode_cursor, keyset_condition
+from app.crud.search import (
+    HEADLINE_OPTIONS,
+    SEARCH_CONFIG,
+    SearchFields,
+    build_prefix_tsquery,
+    escape_like
+)
+from app.models.soft_delete import SoftDeleteMixin
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
+# 관계 로딩 계획: loading_plans에 정의된 이름 또는 ORM 로더 옵션 목록
+LoadPlan = Optional[Union[str, Sequence[ORMOption]]]
+
+# 세션(요청) 단위로 존재가 확인된 ID를 보관하는 session.info 키
+KNOWN_IDS_KEY = "crud_known_ids"
+
+
+def replica_read(method):
+    """
+    읽기 전용 CRUD 메서드 표시: 복제본이 설정되어 있으면 복제본에서 조회
+
+    쓰기 요청이거나 같은 세션에서 이미 쓰기가 있었다면 primary에서 조회합니다.
+    복제 지연으로 방금 쓴 데이터가 보이지 않으면 안 되는 조회에는 사용하지 않습니다.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, db: AsyncSession, *args, **kwargs):
+        with use_replica(db):
+            return await method(self, db, *args, **kwargs)
+    return wrapper
+
+
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    # 이름별 관계 로딩 계획 (하위 클래스에서 selectinload/joinedload 옵션으로 정의)
+    loading_plans: Dict[str, Tuple[ORMOption, ...]] = {}
+    # 목록 조회 기본 정렬 (컬럼, 방향) - id가 항상 보조 정렬 기준으로 붙음
+    default_sort: Tuple[str, str] = ("id", "asc")
+    # 전문 검색 대상 컬럼 (검색을 지원하는 모델만 정의)
+    search_fields: Optional[SearchFields] = None
+
     def __init__(self, model: Type[ModelType]):
         """
         CRUD 객체 초기화
@@ -20,20 +61,90 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
 
-    async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
-        """ID로 단일 객체 조회"""
-        query = select(self.model).where(self.model.id == id)
+    def loader_options(self, load: LoadPlan = None) -> List[ORMOption]:
+        """
+        로딩 계획을 ORM 로더 옵션으로 변환
+
+        Raises:
+            ValueError: 정의되지 않은 로딩 계획 이름인 경우
+        """
+        if load is None:
+            return []
+        if isinstance(load, str):
+            if load not in self.loading_plans:
+                raise ValueError(f"Unknown loading plan '{load}' for {self.model.__name__}")
+            return list(self.loading_plans[load])
+        return list(load)
+
+    def _known_ids(self, db: AsyncSession) -> set:
+        """세션에서 존재가 확인된 이 모델의 ID 집합"""
+        return db.info.setdefault(KNOWN_IDS_KEY, {}).setdefault(self.model, set())
+
+    @replica_read
+    async def get(self, db: AsyncSession, id: Any, *, load: LoadPlan = None) -> Optional[ModelType]:
+        """
+        ID로 단일 객체 조회 (load 지정 시 관계 함께 로딩)
+
+        로딩 계획 없이 조회하면 같은 세션(요청)에서 이미 로딩된 객체를
+        쿼리 없이 반환합니다 (세션 identity map 사용).
+        """
+        if load is None:
+            return await db.get(self.model, id)
+        query = (
+            select(self.model)
+            .options(*self.loader_options(load))
+            .where(self.model.id == id)
+        )
         result = await db.execute(query)
-        return result.scalar_one_or_none()
+        return result.unique().scalar_one_or_none()
 
+    @replica_read
+    async def get_version(self, db: AsyncSession, id: Any) -> Optional[datetime]:
+        """객체 버전(updated_at) 조회 (조건부 GET용, 행 본문은 읽지 않음)"""
+        return await db.scalar(select(self.model.updated_at).where(self.model.id == id))
+
+    @replica_read
+    async def exists(self, db: AsyncSession, id: Any, **attrs: Any) -> bool:
+        """
+        객체 존재 여부 확인 (attrs 지정 시 해당 컬럼 값까지 일치해야 함)
+
+        같은 세션에서 이미 로딩했거나 존재를 확인한 객체는 쿼리 없이 판단하고,
+        그 외에는 행 데이터를 읽지 않는 EXISTS 쿼리 한 번으로 확인합니다.
+        """
+        obj = db.identity_map.get(identity_key(self.model, id))
+        if obj is not None and all(name in obj.__dict__ for name in attrs):
+            return all(getattr(obj, name) == value for name, value in attrs.items())
+
+        known_ids = self._known_ids(db)
+        if not attrs and id in known_ids:
+            return True
+
+        conditions = [self.model.id == id]
+        conditions.extend(getattr(self.model, name) == value for name, value in attrs.items())
+        found = bool(await db.scalar(select(select(self.model.id).where(*conditions).exists())))
+        if found:
+            known_ids.add(id)
+        return found
+
+    @replica_read
     async def get_multi(
-        self, db: AsyncSession, *, skip: int = 0, limit: int = 100
-    ) -> List[ModelType]:
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        load: LoadPlan = None,
+        sort_by: Optional[str] = None,
+        order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> Page[ModelType]:
         """객체 목록 조회"""
-        query = select(self.model).offset(skip).limit(limit)
-        result = await db.execute(query)
-        return result.scalars().all()
+        query = select(self.model).options(*self.loader_options(load))
+        return await self.paginate(
+            db, query, sort_by=sort_by, order=order, cursor=cursor, skip=skip, limit=limit
+        )
 
+    @replica_read
     async def get_sorted(
         self,
         db: AsyncSession,
@@ -41,23 +152,146 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         sort_by: str,
         order: str = "asc",
         skip: int = 0,
-        limit: int = 100
-    ) -> List[ModelType]:
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Page[ModelType]:
         """정렬된 객체 목록 조회"""
-        if hasattr(self.model, sort_by):
-            order_col = getattr(self.model, sort_by)
-            query = select(self.model)
-
-            if order.lower() == "desc":
-                query = query.order_by(desc(order_col))
-            else:
-                query = query.order_by(order_col)
-            query = query.offset(skip).limit(limit)
-            result = await db.execute(query)
-            return result.scalars().all()
-        else:
-            # 정렬 기준이 없는 경우 기본 정렬
-            return await self.get_multi(db, skip=skip, limit=limit)
+        return await self.get_multi(
+            db, sort_by=sort_by, order=order, cursor=cursor, skip=skip, limit=limit
+        )
+
+    def sort_column(self, sort_by: Optional[str]) -> Tuple[str, Any]:
+        """정렬 기준 컬럼 (모델 컬럼이 아니면 기본 정렬 기준 사용)"""
+        if sort_by and sort_by in self.model.__table__.columns:
+            return sort_by, getattr(self.model, sort_by)
+        sort_by = self.default_sort[0]
+        return sort_by, getattr(self.model, sort_by)
+
+    async def paginate(
+        self,
+        db: AsyncSession,
+        query: Select,
+        *,
+        sort_by: Optional[str] = None,
+        order: Optional[str] = None,
+        cursor: Optional[str] = None,
+        skip: int = 0,
+        limit: Optional[int] = 100
+    ) -> Page[ModelType]:
+        """
+        (정렬 컬럼, id) 키셋 페이지네이션
+
+        cursor가 주어지면 직전 페이지의 마지막 행 이후부터 인덱스 범위 조회로 읽고,
+        없으면 첫 페이지(또는 하위 호환용 skip 오프셋)부터 조회합니다.
+        limit이 None이면 나머지 전체를 조회하며 next_cursor는 None입니다.
+
+        Raises:
+            InvalidCursorError: 커서가 잘못되었거나 정렬 조건이 다른 경우
+        """
+        sort_by, column = self.sort_column(sort_by)
+        order = (order or self.default_sort[1]).lower()
+        if order not in ("asc", "desc"):
+            order = self.default_sort[1]
+        id_column = self.model.id
+
+        if cursor:
+            query = query.where(
+                keyset_condition(column, id_column, order, decode_cursor(cursor, column, sort_by, order))
+            )
+        elif skip:
+            query = query.offset(skip)
+
+        direction = desc if order == "desc" else asc
+        order_by = [direction(id_column)]
+        if column is not id_column:
+            order_by.insert(0, direction(column).nulls_last())
+
+        query = query.order_by(*order_by)
+        if limit is not None:
+            # 다음 페이지 존재 여부 확인을 위해 한 건 더 조회
+            query = query.limit(limit + 1)
+        result = await db.execute(query)
+        rows = result.unique().scalars().all()
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(sort_by, order, getattr(last, sort_by), last.id)
+        return Page(rows, next_cursor)
+
+    @replica_read
+    async def search(
+        self,
+        db: AsyncSession,
+        *,
+        query: str,
+        where: Sequence[Any] = (),
+        load: LoadPlan = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Page[ModelType]:
+        """
+        전문 검색 (관련도순)
+
+        tsvector 접두사 일치 또는 pg_trgm 부분 일치로 후보를 찾고
+        ts_rank + 유사도로 정렬합니다. 각 결과에는 rank(관련도)와
+        snippet(<mark>로 강조된 본문 발췌) 속성이 설정됩니다.
+
+        Raises:
+            InvalidCursorError: 커서가 잘못된 경우
+        """
+        if self.search_fields is None:
+            raise NotImplementedError(f"{self.model.__name__} does not support search")
+
+        vector = getattr(self.model, self.search_fields.vector)
+        trigram = getattr(self.model, self.search_fields.trigram)
+        headline = getattr(self.model, self.search_fields.headline)
+
+        partial_match = trigram.ilike(f"%{escape_like(query)}%", escape="\\")
+        rank = func.similarity(trigram, query, type_=Float)
+        snippet = literal(None)
+
+        tsquery_text = build_prefix_tsquery(query)
+        if tsquery_text:
+            tsquery = func.to_tsquery(SEARCH_CONFIG, tsquery_text)
+            partial_match = or_(vector.op("@@")(tsquery), partial_match)
+            rank = func.ts_rank(vector, tsquery, type_=Float) + rank
+            snippet = func.ts_headline(
+                SEARCH_CONFIG, func.coalesce(headline, ""), tsquery, HEADLINE_OPTIONS
+            )
+
+        id_column = self.model.id
+        statement = (
+            select(self.model, rank.label("rank"), snippet.label("snippet"))
+            .options(*self.loader_options(load))
+            .where(partial_match, *where)
+        )
+        if cursor:
+            statement = statement.where(
+                keyset_condition(rank, id_column, "desc", decode_cursor(cursor, rank, "rank", "desc"))
+            )
+        elif skip:
+            statement = statement.offset(skip)
+
+        result = await db.execute(
+            statement.order_by(rank.desc(), id_column.desc()).limit(limit + 1)
+        )
+        rows = result.unique().all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last, last_rank, _ = rows[-1]
+            next_cursor = encode_cursor("rank", "desc", last_rank, last.id)
+
+        items = []
+        for obj, obj_rank, obj_snippet in rows:
+            obj.rank = obj_rank
+            obj.snippet = obj_snippet
+            items.append(obj)
+        return Page(items, next_cursor)
 
     async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
         """새 객체 생성"""
@@ -100,6 +334,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj_in: Union[UpdateSchemaType, Dict[str, Any]]
     ) -> Optional[ModelType]:
         """ID로 객체 수정"""
+        pin_primary(db)
         db_obj = await self.get(db, id)
         if db_obj:
             return await self.update(db, db_obj=db_obj, obj_in=obj_in)
@@ -107,15 +342,67 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
     async def remove(self, db: AsyncSession, *, id: int) -> ModelType:
         """객체 삭제"""
+        pin_primary(db)
         obj = await self.get(db, id)
         if obj:
             await db.delete(obj)
             await db.commit()
+            self._known_ids(db).discard(id)
         return obj
 
-    async def remove_multi(self, db: AsyncSession, *, ids: List[int]) -> int:
-        """여러 객체 삭제"""
-        stmt = delete(self.model).where(self.model.id.in_(ids))
-        result = await db.execute(stmt)
+    async def bulk_update(
+        self,
+        db: AsyncSession,
+        *,
+        ids: List[int],
+        values: Dict[str, Any],
+        returning: Sequence[str] = ()
+    ) -> List[Row]:
+        """
+        여러 객체를 같은 값으로 수정
+
+        UPDATE ... WHERE id IN 한 번으로 처리하고, 실제로 수정된 행의
+        (id, *returning) 목록을 반환합니다.
+        """
+        pin_primary(db)
+        stmt = (
+            update(self.model)
+            .where(self.model.id.in_(ids), *self.bulk_criteria())
+            .values(**values)
+            .returning(self.model.id, *(getattr(self.model, name) for name in returning))
+            .execution_options(synchronize_session=False)
+        )
+        rows = (await db.execute(stmt)).all()
+        await db.commit()
+        return rows
+
+    async def remove_multi(
+        self,
+        db: AsyncSession,
+        *,
+        ids: List[int],
+        returning: Sequence[str] = ()
+    ) -> List[Row]:
+        """
+        여러 객체 삭제
+
+        DELETE ... WHERE id IN 한 번으로 처리하고, 실제로 삭제된 행의
+        (id, *returning) 목록을 반환합니다.
+        """
+        pin_primary(db)
+        stmt = (
+            delete(self.model)
+            .where(self.model.id.in_(ids), *self.bulk_criteria())
+            .returning(self.model.id, *(getattr(self.model, name) for name in returning))
+            .execution_options(synchronize_session=False)
+        )
+        rows = (await db.execute(stmt)).all()
         await db.commit()
-        return result.rowcount
+        self._known_ids(db).difference_update(ids)
+        return rows
+
+    def bulk_criteria(self) -> List[Any]:
+        """일괄 수정/삭제 대상 조건 (soft delete 모델은 삭제된 행 제외)"""
+        if issubclass(self.model, SoftDeleteMixin):
+            return [self.model.deleted_at.is_(None)]
+        return []
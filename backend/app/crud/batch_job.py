@@ -0,0 +1,60 @@
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.crud.base import CRUDBase
+from app.models import BatchJob, BatchJobItem, BatchJobStatus
+from app.schemas.batch_job import BatchJobCreate
+
+
+class CRUDBatchJob(CRUDBase[BatchJob, BatchJobCreate, BatchJobCreate]):
+    async def create_with_items(
+        self,
+        db: AsyncSession,
+        *,
+        obj_in: BatchJobCreate
+    ) -> BatchJob:
+        """회사별 항목과 함께 배치 작업 생성 (중복 회사 ID 제거)"""
+        company_ids = list(dict.fromkeys(obj_in.company_ids))
+        db_obj = BatchJob(
+            template_id=obj_in.template_id,
+            status=BatchJobStatus.PENDING,
+            total_items=len(company_ids),
+            items=[BatchJobItem(company_id=company_id) for company_id in company_ids]
+        )
+        db.add(db_obj)
+        await db.commit()
+        return await self.get_with_items(db, id=db_obj.id)
+
+    async def get_with_items(self, db: AsyncSession, *, id: int) -> Optional[BatchJob]:
+        """항목을 포함한 배치 작업 조회"""
+        query = (
+            select(BatchJob)
+            .options(selectinload(BatchJob.items))
+            .where(BatchJob.id == id)
+        )
+        result = await db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def get_unfinished_items(
+        self,
+        db: AsyncSession,
+        *,
+        job_id: int
+    ) -> List[BatchJobItem]:
+        """완료되지 않은 항목 조회 (대기/실행 중/실패 항목은 재개 대상)"""
+        query = (
+            select(BatchJobItem)
+            .where(
+                BatchJobItem.job_id == job_id,
+                BatchJobItem.status != BatchJobStatus.COMPLETED
+            )
+            .order_by(BatchJobItem.id)
+        )
+        result = await db.execute(query)
+        return result.scalars().all()
+
+
+# CRUD 객체 인스턴스 생성
+batch_job = CRUDBatchJob(BatchJob)
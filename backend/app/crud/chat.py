@@ -1,36 +1,197 @@
 from typing import List, Optional, Dict, Any
-from sqlalchemy import select, and_, desc, func, case
+from sqlalchemy import select, insert, and_, desc, func, case
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+from sqlalchemy.orm.attributes import set_committed_value
 from datetime import datetime
 
-from app.crud.base import CRUDBase
-from app.models import ChatHistory, ChatReference, ChatFeedback
+from app.core.database import pin_primary
+from app.crud.base import CRUDBase, LoadPlan, replica_read
+from app.crud.feedback_stat import feedback_counters, feedback_stat, utc_day
+from app.crud.pagination import Page
+from app.crud.search import SearchFields
+from app.models import ChatSession, ChatHistory, ChatReference, ChatFeedback
 from app.schemas.chat import (
+    ChatSessionCreate,
     ChatHistoryCreate, ChatHistoryUpdate,
     ChatReferenceCreate, ChatReferenceUpdate,
     ChatFeedbackCreate, ChatFeedbackUpdate
 )
 
-class CRUDChatHistory(CRUDBase[ChatHistory, ChatHistoryCreate, ChatHistoryUpdate]):
+def _clamp_score(score: Optional[float]) -> Optional[float]:
+    """관련성 점수를 0~1 범위로 제한"""
+    if score is None:
+        return None
+    return min(max(score, 0.0), 1.0)
+
+def _detach(db: AsyncSession, *objs) -> None:
+    """커밋 시 만료되지 않도록 세션에서 분리 (RETURNING으로 받은 값 유지)"""
+    for obj in objs:
+        db.expunge(obj)
+
+class CRUDChatSession(CRUDBase[ChatSession, ChatSessionCreate, ChatSessionCreate]):
+    default_sort = ("updated_at", "desc")
+
+    @replica_read
     async def get_by_company(
         self,
         db: AsyncSession,
         *,
         company_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        sort_by: Optional[str] = None,
+        order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> Page[ChatSession]:
+        """기업별 대화 세션 조회 (최근 대화 순)"""
+        query = select(ChatSession).where(ChatSession.company_id == company_id)
+        return await self.paginate(
+            db, query, sort_by=sort_by, order=order, cursor=cursor, skip=skip, limit=limit
+        )
+
+    async def update_summary(
+        self,
+        db: AsyncSession,
+        *,
+        session: ChatSession,
+        summary: str,
+        summarized_until_id: int
+    ) -> ChatSession:
+        """대화 요약 갱신"""
+        session.summary = summary
+        session.summarized_until_id = summarized_until_id
+        db.add(session)
+        await db.commit()
+        await db.refresh(session)
+        return session
+
+class CRUDChatHistory(CRUDBase[ChatHistory, ChatHistoryCreate, ChatHistoryUpdate]):
+    default_sort = ("created_at", "desc")
+    search_fields = SearchFields(vector="search_vector", trigram="query", headline="response")
+    loading_plans = {
+        # 목록 응답용: 응답 본문은 상세 조회에서만 로딩
+        "summary": (defer(ChatHistory.response, raiseload=True),),
+    }
+
+    async def create_with_references(
+        self,
+        db: AsyncSession,
+        *,
+        obj_in: ChatHistoryCreate,
+        scores: Optional[Dict[int, Optional[float]]] = None
+    ) -> ChatHistory:
+        """
+        채팅 이력과 참조 문서를 하나의 트랜잭션으로 저장
+
+        INSERT ... RETURNING으로 생성된 행을 바로 받아 커밋 후 refresh 쿼리를 생략합니다.
+
+        Args:
+            obj_in: 채팅 이력 데이터
+            scores: 참조 문서 ID별 관련성 점수
+        """
+        now = datetime.utcnow()
+        try:
+            chat = await db.scalar(
+                insert(ChatHistory)
+                .values(**obj_in.model_dump(), created_at=now, updated_at=now)
+                .returning(ChatHistory)
+            )
+            references = await chat_reference.insert_many(db, chat_id=chat.id, scores=scores or {})
+            set_committed_value(chat, "references", references)
+            _detach(db, chat, *references)
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        return chat
+
+    async def remove(self, db: AsyncSession, *, id: int) -> Optional[ChatHistory]:
+        """
+        채팅 이력 삭제 (CASCADE로 함께 삭제되는 피드백의 기여분을 같은 트랜잭션에서 통계에서 차감)
+
+        채팅 행을 잠가 동시에 저장되는 피드백이 차감에서 빠지지 않도록 합니다.
+        """
+        pin_primary(db)
+        chat = await db.get(ChatHistory, id, with_for_update=True)
+        if not chat:
+            return None
+
+        result = await db.execute(select(ChatFeedback).where(ChatFeedback.chat_id == id))
+        feedback = result.scalar_one_or_none()
+        if feedback:
+            await feedback_stat.increment(
+                db,
+                chat_id=id,
+                day=utc_day(feedback.created_at),
+                delta={column: -value for column, value in feedback_counters(feedback).items()}
+            )
+        await db.delete(chat)
+        await db.commit()
+        self._known_ids(db).discard(id)
+        return chat
+
+    async def get_recent_by_session(
+        self,
+        db: AsyncSession,
+        *,
+        session_id: int,
+        limit: int
     ) -> List[ChatHistory]:
-        """기업별 채팅 이력 조회"""
+        """세션의 최근 대화 조회 (오래된 순으로 반환)"""
         query = (
             select(ChatHistory)
-            .where(ChatHistory.company_id == company_id)
-            .order_by(desc(ChatHistory.created_at))
-            .offset(skip)
+            .where(ChatHistory.session_id == session_id)
+            .order_by(desc(ChatHistory.id))
             .limit(limit)
         )
         result = await db.execute(query)
+        return list(reversed(result.scalars().all()))
+
+    async def get_by_session_after(
+        self,
+        db: AsyncSession,
+        *,
+        session_id: int,
+        after_id: Optional[int] = None
+    ) -> List[ChatHistory]:
+        """세션에서 지정 ID 이후의 대화 조회 (오래된 순)"""
+        conditions = [ChatHistory.session_id == session_id]
+        if after_id is not None:
+            conditions.append(ChatHistory.id > after_id)
+
+        query = (
+            select(ChatHistory)
+            .where(and_(*conditions))
+            .order_by(ChatHistory.id)
+        )
+        result = await db.execute(query)
         return result.scalars().all()
 
+    @replica_read
+    async def get_by_company(
+        self,
+        db: AsyncSession,
+        *,
+        company_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: Optional[str] = None,
+        order: Optional[str] = None,
+        cursor: Optional[str] = None,
+        load: LoadPlan = None
+    ) -> Page[ChatHistory]:
+        """기업별 채팅 이력 조회"""
+        query = (
+            select(ChatHistory)
+            .options(*self.loader_options(load))
+            .where(ChatHistory.company_id == company_id)
+        )
+        return await self.paginate(
+            db, query, sort_by=sort_by, order=order, cursor=cursor, skip=skip, limit=limit
+        )
+
+    @replica_read
     async def search_history(
         self,
         db: AsyncSession,
@@ -38,25 +199,18 @@ class CRUDChatHistory(CRUDBase[ChatHistory, ChatHistoryCreate, ChatHistoryUpdate
         query: str,
         company_id: Optional[int] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[ChatHistory]:
-        """채팅 이력 검색"""
-        conditions = [
-            ChatHistory.query.ilike(f"%{query}%") |
-            ChatHistory.response.ilike(f"%{query}%")
-        ]
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        load: LoadPlan = None
+    ) -> Page[ChatHistory]:
+        """채팅 이력 검색 (관련도순, 강조 스니펫 포함)"""
+        conditions = []
         if company_id:
             conditions.append(ChatHistory.company_id == company_id)
 
-        query = (
-            select(ChatHistory)
-            .where(and_(*conditions))
-            .order_by(desc(ChatHistory.created_at))
-            .offset(skip)
-            .limit(limit)
+        return await self.search(
+            db, query=query, where=conditions, load=load, skip=skip, limit=limit, cursor=cursor
         )
-        result = await db.execute(query)
-        return result.scalars().all()
 
     async def toggle_bookmark(
         self,
@@ -66,6 +220,7 @@ class CRUDChatHistory(CRUDBase[ChatHistory, ChatHistoryCreate, ChatHistoryUpdate
         is_bookmarked: bool
     ) -> Optional[ChatHistory]:
         """북마크 토글"""
+        pin_primary(db)
         chat = await self.get(db, id=chat_id)
         if chat:
             chat.is_bookmarked = is_bookmarked
@@ -75,6 +230,7 @@ class CRUDChatHistory(CRUDBase[ChatHistory, ChatHistoryCreate, ChatHistoryUpdate
 
 
 class CRUDChatReference(CRUDBase[ChatReference, ChatReferenceCreate, ChatReferenceUpdate]):
+    @replica_read
     async def get_by_chat(
         self,
         db: AsyncSession,
@@ -98,24 +254,45 @@ class CRUDChatReference(CRUDBase[ChatReference, ChatReferenceCreate, ChatReferen
         document_ids: List[int],
         scores: Optional[Dict[int, float]] = None
     ) -> List[ChatReference]:
-        """여러 참조 문서 한 번에 생성"""
-        references = []
-        for doc_id in document_ids:
-            reference = ChatReference(
-                chat_id=chat_id,
-                document_id=doc_id,
-                relevance_score=scores.get(doc_id) if scores else None
-            )
-            db.add(reference)
-            references.append(reference)
-
+        """여러 참조 문서 한 번에 생성 (bulk INSERT ... RETURNING)"""
+        references = await self.insert_many(
+            db,
+            chat_id=chat_id,
+            scores={doc_id: scores.get(doc_id) if scores else None for doc_id in document_ids}
+        )
+        _detach(db, *references)
         await db.commit()
-        for ref in references:
-            await db.refresh(ref)
         return references
 
+    async def insert_many(
+        self,
+        db: AsyncSession,
+        *,
+        chat_id: int,
+        scores: Dict[int, Optional[float]]
+    ) -> List[ChatReference]:
+        """참조 문서 일괄 INSERT (커밋하지 않음, 생성된 행을 RETURNING으로 반환)"""
+        if not scores:
+            return []
+
+        now = datetime.utcnow()
+        rows = [
+            {
+                "chat_id": chat_id,
+                "document_id": document_id,
+                "is_auto_referenced": True,
+                "relevance_score": _clamp_score(score),
+                "created_at": now,
+                "updated_at": now
+            }
+            for document_id, score in scores.items()
+        ]
+        result = await db.scalars(insert(ChatReference).returning(ChatReference), rows)
+        return result.all()
+
 
 class CRUDChatFeedback(CRUDBase[ChatFeedback, ChatFeedbackCreate, ChatFeedbackUpdate]):
+    @replica_read
     async def get_by_chat(
         self,
         db: AsyncSession,
@@ -127,32 +304,15 @@ class CRUDChatFeedback(CRUDBase[ChatFeedback, ChatFeedbackCreate, ChatFeedbackUp
         result = await db.execute(query)
         return result.scalar_one_or_none()
 
+    @replica_read
     async def get_company_stats(
         self,
         db: AsyncSession,
         *,
         company_id: int
     ) -> Dict[str, Any]:
-        """회사별 피드백 통계"""
-        query = (
-            select(
-                func.count(ChatFeedback.id).label('total_count'),
-                func.avg(ChatFeedback.rating).label('avg_rating'),
-                func.avg(
-                    case((ChatFeedback.is_accurate == True, 1.0), else_=0.0)
-                ).label('accuracy_rate')
-            )
-            .join(ChatHistory)
-            .where(ChatHistory.company_id == company_id)
-        )
-        result = await db.execute(query)
-        stats = result.mappings().first()
-
-        return {
-            "total_count": int(stats['total_count']),
-            "average_rating": float(stats['avg_rating']) if stats['avg_rating'] else 0.0,
-            "accuracy_rate": float(stats['accuracy_rate']) if stats['accuracy_rate'] else 0.0
-        }
+        """회사별 피드백 통계 (집계 테이블에서 조회)"""
+        return await feedback_stat.get_company_stats(db, company_id=company_id)
 
     async def update_or_create(
         self,
@@ -161,15 +321,35 @@ class CRUDChatFeedback(CRUDBase[ChatFeedback, ChatFeedbackCreate, ChatFeedbackUp
         chat_id: int,
         feedback_in: ChatFeedbackCreate
     ) -> ChatFeedback:
-        """피드백 업데이트 또는 생성"""
-        existing = await self.get_by_chat(db, chat_id=chat_id)
-        if existing:
-            update_data = feedback_in.model_dump(exclude={'chat_id'})
-            return await self.update(db, db_obj=existing, obj_in=update_data)
-        return await self.create(db, obj_in=feedback_in)
+        """피드백 업데이트 또는 생성 (피드백 통계도 같은 트랜잭션에서 갱신)"""
+        # 동시 수정 시 변경분이 중복 반영되지 않도록 기존 피드백 잠금
+        result = await db.execute(
+            select(ChatFeedback).where(ChatFeedback.chat_id == chat_id).with_for_update()
+        )
+        db_obj = result.scalar_one_or_none()
+        before = feedback_counters(db_obj)
+
+        if db_obj:
+            for field, value in feedback_in.model_dump(exclude={'chat_id'}).items():
+                setattr(db_obj, field, value)
+        else:
+            db_obj = ChatFeedback(**feedback_in.model_dump(), created_at=datetime.utcnow())
+            db.add(db_obj)
+
+        after = feedback_counters(db_obj)
+        await feedback_stat.increment(
+            db,
+            chat_id=chat_id,
+            day=utc_day(db_obj.created_at),
+            delta={column: after[column] - before[column] for column in after}
+        )
+        await db.commit()
+        await db.refresh(db_obj)
+        return db_obj
 
 
 # CRUD 객체 인스턴스 생성
+chat_session = CRUDChatSession(ChatSession)
 chat_history = CRUDChatHistory(ChatHistory)
 chat_reference = CRUDChatReference(ChatReference)
 chat_feedback = CRUDChatFeedback(ChatFeedback)
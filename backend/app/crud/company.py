@@ -1,27 +1,68 @@
 from typing import List, Optional
 from sqlalchemy import select, desc
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.crud.base import CRUDBase
-from app.models import Company
+from app.core.database import pin_primary
+from app.crud.base import CRUDBase, LoadPlan, replica_read
+from app.crud.pagination import Page
+from app.crud.search import SearchFields
+from app.models import Company, Document
 from app.schemas.company import CompanyCreate, CompanyUpdate
 
 
 class CRUDCompany(CRUDBase[Company, CompanyCreate, CompanyUpdate]):
+    # 컬렉션 관계는 selectinload로 관계당 1회 추가 쿼리
+    loading_plans = {
+        "documents": (selectinload(Company.documents),),
+        "relations": (
+            selectinload(Company.documents).selectinload(Document.sections),
+            selectinload(Company.chat_histories),
+        ),
+    }
+    search_fields = SearchFields(vector="search_vector", trigram="name", headline="description")
+
+    @replica_read
+    async def get_with_relations(
+        self,
+        db: AsyncSession,
+        *,
+        id: int,
+        load: LoadPlan = "relations"
+    ) -> Optional[Company]:
+        """
+        관계를 포함한 회사 조회
+
+        기본 계획(relations)은 문서와 문서별 섹션, 채팅 이력을 함께 로딩하며
+        문서/섹션 수와 관계없이 쿼리 4회로 끝납니다.
+        """
+        return await self.get(db, id, load=load)
+
+    @replica_read
     async def get_by_business_number(self, db: AsyncSession, *, business_number: str) -> Optional[Company]:
         """사업자등록번호로 회사 조회"""
         query = select(Company).where(Company.business_number == business_number)
         result = await db.execute(query)
         return result.scalar_one_or_none()
 
+    @replica_read
     async def get_active_companies(
-        self, db: AsyncSession, *, skip: int = 0, limit: int = 100
-    ) -> List[Company]:
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: Optional[str] = None,
+        order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> Page[Company]:
         """활성화된 회사 목록 조회"""
-        query = select(Company).where(Company.is_active == True).offset(skip).limit(limit)
-        result = await db.execute(query)
-        return result.scalars().all()
+        query = select(Company).where(Company.is_active == True)
+        return await self.paginate(
+            db, query, sort_by=sort_by, order=order, cursor=cursor, skip=skip, limit=limit
+        )
 
+    @replica_read
     async def get_sorted_companies(
         self,
         db: AsyncSession,
@@ -30,40 +71,41 @@ class CRUDCompany(CRUDBase[Company, CompanyCreate, CompanyUpdate]):
         order: str = "asc",
         skip: int = 0,
         limit: int = 100,
-        active_only: bool = False
-    ) -> List[Company]:
+        active_only: bool = False,
+        cursor: Optional[str] = None
+    ) -> Page[Company]:
         """정렬된 회사 목록 조회"""
-        if hasattr(Company, sort_by):
-            order_col = getattr(Company, sort_by)
-            query = select(Company)
-
-            if active_only:
-                query = query.where(Company.is_active == True)
-
-            if order.lower() == "desc":
-                query = query.order_by(desc(order_col))
-            else:
-                query = query.order_by(order_col)
-
-            query = query.offset(skip).limit(limit)
-            result = await db.execute(query)
-            return result.scalars().all()
-        else:
-            # 정렬 기준이 없는 경우 기본 정렬
-            return await self.get_multi(db, skip=skip, limit=limit)
+        if active_only:
+            return await self.get_active_companies(
+                db, sort_by=sort_by, order=order, cursor=cursor, skip=skip, limit=limit
+            )
+        return await self.get_sorted(
+            db, sort_by=sort_by, order=order, cursor=cursor, skip=skip, limit=limit
+        )
 
+    @replica_read
     async def get_by_industry(
-        self, db: AsyncSession, *, industry: str, skip: int = 0, limit: int = 100
-    ) -> List[Company]:
+        self,
+        db: AsyncSession,
+        *,
+        industry: str,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: Optional[str] = None,
+        order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> Page[Company]:
         """산업 분류별 기업 목록 조회"""
-        query = select(Company).where(Company.industry == industry).offset(skip).limit(limit)
-        result = await db.execute(query)
-        return result.scalars().all()
+        query = select(Company).where(Company.industry == industry)
+        return await self.paginate(
+            db, query, sort_by=sort_by, order=order, cursor=cursor, skip=skip, limit=limit
+        )
 
     async def update_company_status(
         self, db: AsyncSession, *, company_id: int, is_active: bool
     ) -> Optional[Company]:
         """회사 활성화 상태 변경"""
+        pin_primary(db)
         company = await self.get(db, id=company_id)
         if company:
             company.is_active = is_active
@@ -72,17 +114,17 @@ class CRUDCompany(CRUDBase[Company, CompanyCreate, CompanyUpdate]):
             await db.refresh(company)
         return company
 
+    @replica_read
     async def search_companies(
-        self, db: AsyncSession, *, query: str, skip: int = 0, limit: int = 100
-    ) -> List[Company]:
-        """회사 검색"""
-        search = f"%{query}%"
-        query = select(Company).where(
-            (Company.name.ilike(search)) |
-            (Company.industry.ilike(search)) |
-            (Company.description.ilike(search))
-        ).offset(skip).limit(limit)
-        result = await db.execute(query)
-        return result.scalars().all()
+        self,
+        db: AsyncSession,
+        *,
+        query: str,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Page[Company]:
+        """회사 검색 (관련도순, 강조 스니펫 포함)"""
+        return await self.search(db, query=query, skip=skip, limit=limit, cursor=cursor)
 
 company = CRUDCompany(Company)
@@ -1,36 +1,61 @@
-from typing import List, Optional, Dict, Any, Union
-from sqlalchemy import select, and_
+from typing import List, Optional, Dict, Any, Sequence, Set, Tuple, Union
+from sqlalchemy import Row, select, and_, or_, delete, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, joinedload, selectinload
 from fastapi import UploadFile
 import os
 import shutil
-from datetime import datetime
+from datetime import datetime, timezone
 
-from app.crud.base import CRUDBase
-from app.models import Document, DocumentType
+from app.core.database import pin_primary
+from app.crud.base import CRUDBase, LoadPlan, replica_read
+from app.crud.pagination import Page
+from app.crud.search import SearchFields
+from app.models import Document, DocumentType, Section
 from app.schemas.document import DocumentCreate, DocumentUpdate
 from app.core.config import settings
 
 
 class CRUDDocument(CRUDBase[Document, DocumentCreate, DocumentUpdate]):
+    # 섹션은 문서당 1회 추가 쿼리(IN 조회), 회사는 JOIN으로 함께 로딩
+    loading_plans = {
+        "sections": (selectinload(Document.sections),),
+        "company": (joinedload(Document.company),),
+        "detail": (selectinload(Document.sections), joinedload(Document.company)),
+        # 목록 응답용: 추출된 본문은 상세 조회에서만 로딩
+        "summary": (defer(Document.content, raiseload=True),),
+    }
+    search_fields = SearchFields(vector="search_vector", trigram="title", headline="content")
+
+    @replica_read
+    async def get_with_sections(self, db: AsyncSession, *, id: int) -> Optional[Document]:
+        """섹션을 포함한 문서 조회 (섹션 수와 관계없이 쿼리 2회)"""
+        return await self.get(db, id, load="sections")
+
+    @replica_read
     async def get_by_company(
         self,
         db: AsyncSession,
         *,
         company_id: int,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[Document]:
+        limit: int = 100,
+        load: LoadPlan = None,
+        sort_by: Optional[str] = None,
+        order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> Page[Document]:
         """회사별 문서 목록 조회"""
         query = (
             select(Document)
+            .options(*self.loader_options(load))
             .where(Document.company_id == company_id)
-            .offset(skip)
-            .limit(limit)
         )
-        result = await db.execute(query)
-        return result.scalars().all()
+        return await self.paginate(
+            db, query, sort_by=sort_by, order=order, cursor=cursor, skip=skip, limit=limit
+        )
 
+    @replica_read
     async def get_by_type(
         self,
         db: AsyncSession,
@@ -38,8 +63,12 @@ class CRUDDocument(CRUDBase[Document, DocumentCreate, DocumentUpdate]):
         doc_type: DocumentType,
         company_id: Optional[int] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[Document]:
+        limit: int = 100,
+        load: LoadPlan = None,
+        sort_by: Optional[str] = None,
+        order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> Page[Document]:
         """문서 유형별 조회"""
         conditions = [Document.type == doc_type]
         if company_id:
@@ -47,12 +76,32 @@ class CRUDDocument(CRUDBase[Document, DocumentCreate, DocumentUpdate]):
 
         query = (
             select(Document)
+            .options(*self.loader_options(load))
             .where(and_(*conditions))
-            .offset(skip)
-            .limit(limit)
+        )
+        return await self.paginate(
+            db, query, sort_by=sort_by, order=order, cursor=cursor, skip=skip, limit=limit
+        )
+
+    async def get_context_version(
+        self,
+        db: AsyncSession,
+        *,
+        company_id: int
+    ) -> Tuple[int, Optional[datetime]]:
+        """채팅 컨텍스트에 사용되는 문서(회사 문서 + 학습 데이터)의 개수와 최종 수정 시각 조회"""
+        query = select(
+            func.count(Document.id),
+            func.max(Document.updated_at)
+        ).where(
+            or_(
+                Document.company_id == company_id,
+                Document.type == DocumentType.TRAINING_DATA
+            )
         )
         result = await db.execute(query)
-        return result.scalars().all()
+        count, last_updated = result.one()
+        return count, last_updated
 
     async def create_with_file(
         self,
@@ -106,53 +155,45 @@ class CRUDDocument(CRUDBase[Document, DocumentCreate, DocumentUpdate]):
         obj_in: Union[DocumentUpdate, Dict[str, Any]],
         file: Optional[UploadFile] = None
     ) -> Document:
-        """파일과 함께 문서 정보 수정"""
-        try:
-            # 기존 데이터로 update_data 초기화
-            if isinstance(obj_in, dict):
-                update_data = obj_in
-            else:
-                update_data = obj_in.model_dump(exclude_unset=True)
-
-            if file:
-                # 이전 파일 경로 저장
-                old_file_path = db_obj.file_path
-
-                # 새 파일 저장
-                company_upload_dir = os.path.join(settings.UPLOAD_DIR, str(db_obj.company_id))
-                os.makedirs(company_upload_dir, exist_ok=True)
-
-                # 파일명 생성 (타임스탬프 추가)
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                file_name = f"{timestamp}_{file.filename}"
-                new_file_path = os.path.join(company_upload_dir, file_name)
-
-                # 새 파일 저장
-                with open(new_file_path, "wb") as buffer:
-                    shutil.copyfileobj(file.file, buffer)
-
-                # 파일 관련 정보 업데이트
-                update_data.update({
-                    "file_path": new_file_path,
-                    "file_name": file.filename,
-                    "mime_type": file.content_type
-                })
-
-                # DB 업데이트 성공 후 이전 파일 삭제
-                db_obj = await super().update(db, db_obj=db_obj, obj_in=update_data)
-                if old_file_path and os.path.exists(old_file_path):
-                    os.remove(old_file_path)
-            else:
-                # 파일 없이 문서 정보만 업데이트
-                db_obj = await super().update(db, db_obj=db_obj, obj_in=update_data)
+        """
+        파일과 함께 문서 정보 수정
 
-            return db_obj
+        교체된 이전 파일과 DB 반영에 실패한 새 파일은 어떤 문서도 참조하지 않는
+        고아 파일이 되며, 정리 작업(file_reaper)이 요청 밖에서 회수합니다.
+        """
+        # 기존 데이터로 update_data 초기화
+        if isinstance(obj_in, dict):
+            update_data = obj_in
+        else:
+            update_data = obj_in.model_dump(exclude_unset=True)
 
-        except Exception as e:
-            # 새 파일이 저장된 경우 삭제
-            if file and 'new_file_path' in locals() and os.path.exists(new_file_path):
-                os.remove(new_file_path)
-            raise e
+        if file:
+            # 새 파일 저장
+            company_upload_dir = os.path.join(settings.UPLOAD_DIR, str(db_obj.company_id))
+            os.makedirs(company_upload_dir, exist_ok=True)
+
+            # 파일명 생성 (타임스탬프 추가)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            file_name = f"{timestamp}_{file.filename}"
+            new_file_path = os.path.join(company_upload_dir, file_name)
+
+            # 새 파일 저장
+            with open(new_file_path, "wb") as buffer:
+                shutil.copyfileobj(file.file, buffer)
+
+            # 파일 관련 정보 업데이트
+            update_data.update({
+                "file_path": new_file_path,
+                "file_name": file.filename,
+                "mime_type": file.content_type
+            })
+
+            db_obj = await super().update(db, db_obj=db_obj, obj_in=update_data)
+        else:
+            # 파일 없이 문서 정보만 업데이트
+            db_obj = await super().update(db, db_obj=db_obj, obj_in=update_data)
+
+        return db_obj
 
     async def remove_with_file(
         self,
@@ -160,22 +201,87 @@ class CRUDDocument(CRUDBase[Document, DocumentCreate, DocumentUpdate]):
         *,
         id:int
     ) -> Optional[Document]:
-        """문서와 파일 함께 삭제"""
+        """
+        문서 삭제 (soft delete)
+
+        deleted_at을 설정하고 섹션을 삭제합니다. 업로드 파일과 문서 행은
+        요청 밖에서 정리 작업(file_reaper)이 제거하므로, 파일 삭제가 실패해도
+        삭제 문서로 남아 다음 정리 때 다시 시도됩니다.
+        """
+        pin_primary(db)
         document = await self.get(db, id=id)
         if document:
-            # 파일 삭제
-            if document.file_path and os.path.exists(document.file_path):
-                try:
-                    os.remove(document.file_path)
-                except Exception as e:
-                    # 파일 삭제 실패 로깅
-                    print(f"Error deleting file {document.file_path}: {str(e)}")
-
-            # DB에서 문서 정보 삭제
-            await db.delete(document)
+            document.deleted_at = datetime.now(timezone.utc)
+            await db.execute(delete(Section).where(Section.document_id == id))
             await db.commit()
+            self._known_ids(db).discard(id)
         return document
 
+    async def remove_multi(
+        self,
+        db: AsyncSession,
+        *,
+        ids: List[int],
+        returning: Sequence[str] = ()
+    ) -> List[Row]:
+        """
+        여러 문서 삭제 (soft delete)
+
+        deleted_at 설정과 섹션 삭제를 한 트랜잭션의 일괄 UPDATE/DELETE로 처리합니다.
+        파일과 문서 행은 remove_with_file과 마찬가지로 정리 작업(file_reaper)이 제거합니다.
+        """
+        pin_primary(db)
+        rows = (await db.execute(
+            update(Document)
+            .where(Document.id.in_(ids), Document.deleted_at.is_(None))
+            .values(deleted_at=datetime.now(timezone.utc))
+            .returning(Document.id, *(getattr(Document, name) for name in returning))
+            .execution_options(synchronize_session=False)
+        )).all()
+        deleted_ids = [row.id for row in rows]
+        if deleted_ids:
+            await db.execute(delete(Section).where(Section.document_id.in_(deleted_ids)))
+        await db.commit()
+        self._known_ids(db).difference_update(ids)
+        return rows
+
+    async def get_deleted_batch(self, db: AsyncSession, *, limit: int) -> List[Tuple[int, Optional[str]]]:
+        """
+        정리 대기 중인 삭제 문서의 (ID, 파일 경로) 목록
+
+        여러 워커가 동시에 정리해도 겹치지 않도록 행을 잠그고(SKIP LOCKED) 조회합니다.
+        """
+        result = await db.execute(
+            select(Document.id, Document.file_path)
+            .where(Document.deleted_at.isnot(None))
+            .order_by(Document.deleted_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .execution_options(include_deleted=True)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def purge(self, db: AsyncSession, *, ids: List[int]) -> int:
+        """삭제 문서 행 영구 삭제 (커밋은 호출 측에서)"""
+        if not ids:
+            return 0
+        result = await db.execute(
+            delete(Document)
+            .where(Document.id.in_(ids), Document.deleted_at.isnot(None))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    async def get_file_paths(self, db: AsyncSession) -> Set[str]:
+        """문서가 참조하는 모든 업로드 파일 경로 (삭제 문서 포함)"""
+        result = await db.scalars(
+            select(Document.file_path)
+            .where(Document.file_path.isnot(None))
+            .execution_options(include_deleted=True)
+        )
+        return set(result.all())
+
+    @replica_read
     async def search_documents(
         self,
         db: AsyncSession,
@@ -183,25 +289,18 @@ class CRUDDocument(CRUDBase[Document, DocumentCreate, DocumentUpdate]):
         query: str,
         company_id: Optional[int] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[Document]:
-        """문서 검색"""
-        search_term = f"%{query}%"
-        conditions = [
-            Document.title.ilike(f"%{query}%") |
-            Document.content.ilike(f"%{query}%")
-        ]
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        load: LoadPlan = None
+    ) -> Page[Document]:
+        """문서 검색 (관련도순, 강조 스니펫 포함)"""
+        conditions = []
         if company_id:
             conditions.append(Document.company_id == company_id)
 
-        query = (
-            select(Document)
-            .where(and_(*conditions))
-            .offset(skip)
-            .limit(limit)
+        return await self.search(
+            db, query=query, where=conditions, load=load, skip=skip, limit=limit, cursor=cursor
         )
-        result = await db.execute(query)
-        return result.scalars().all()
 
 # CRUD 객체 인스턴스 생성
 document = CRUDDocument(Document)
@@ -0,0 +1,198 @@
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional
+from sqlalchemy import select, delete, func, literal_column
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import CRUDBase, replica_read
+from app.models import ChatFeedback, ChatHistory, CompanyFeedbackStat, DailyFeedbackStat
+
+# 누적 집계 컬럼
+COUNTER_COLUMNS = (
+    "feedback_count",
+    "rating_count",
+    "rating_sum",
+    "accurate_count",
+)
+
+
+def feedback_counters(feedback: Optional[ChatFeedback]) -> Dict[str, int]:
+    """피드백 한 건이 통계에 기여하는 값 (피드백이 없으면 0)"""
+    if feedback is None:
+        return dict.fromkeys(COUNTER_COLUMNS, 0)
+    return {
+        "feedback_count": 1,
+        "rating_count": 1 if feedback.rating is not None else 0,
+        "rating_sum": feedback.rating or 0,
+        "accurate_count": 1 if feedback.is_accurate else 0,
+    }
+
+
+def utc_day(value: datetime) -> date:
+    """통계 집계 일자 (UTC 기준)"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.date()
+
+
+def stats_summary(stat: Any) -> Dict[str, Any]:
+    """누적 값으로 건수, 평균 평점, 정확도 비율 계산"""
+    if stat is None:
+        return {"total_count": 0, "average_rating": 0.0, "accuracy_rate": 0.0}
+    return {
+        "total_count": stat.feedback_count,
+        "average_rating": stat.rating_sum / stat.rating_count if stat.rating_count else 0.0,
+        "accuracy_rate": stat.accurate_count / stat.feedback_count if stat.feedback_count else 0.0,
+    }
+
+
+class CRUDFeedbackStat(CRUDBase[CompanyFeedbackStat, Any, Any]):
+    """
+    피드백 통계 집계
+
+    피드백 저장/채팅 이력 삭제 시 변경분만 회사별/일자별 행에 누적하므로 조회는 한 행만 읽습니다.
+    SQL로 직접 수정하는 등 집계를 거치지 않은 변경은 rebuild로 재계산합니다.
+    """
+
+    async def increment(
+        self,
+        db: AsyncSession,
+        *,
+        chat_id: int,
+        day: date,
+        delta: Dict[str, int]
+    ) -> None:
+        """
+        피드백 변경분을 회사/일자 통계에 누적
+
+        커밋하지 않으므로 피드백 저장과 같은 트랜잭션에서 호출해야 합니다.
+        """
+        if not any(delta.values()):
+            return
+
+        company_id = (
+            select(ChatHistory.company_id)
+            .where(ChatHistory.id == chat_id)
+            .scalar_subquery()
+        )
+        now = datetime.utcnow()
+        targets = (
+            (CompanyFeedbackStat, {}, {"index_elements": ["company_id"]}),
+            (DailyFeedbackStat, {"day": day}, {"constraint": "uq_daily_feedback_stats_company_day"}),
+        )
+        for model, keys, conflict_target in targets:
+            stmt = insert(model).values(company_id=company_id, updated_at=now, **keys, **delta)
+            stmt = stmt.on_conflict_do_update(
+                **conflict_target,
+                set_={
+                    **{
+                        column: getattr(model, column) + getattr(stmt.excluded, column)
+                        for column in delta
+                    },
+                    "updated_at": stmt.excluded.updated_at
+                }
+            )
+            await db.execute(stmt)
+
+    @replica_read
+    async def get_company_stats(
+        self,
+        db: AsyncSession,
+        *,
+        company_id: int
+    ) -> Dict[str, Any]:
+        """회사별 피드백 통계"""
+        result = await db.execute(
+            select(CompanyFeedbackStat).where(CompanyFeedbackStat.company_id == company_id)
+        )
+        return stats_summary(result.scalar_one_or_none())
+
+    @replica_read
+    async def get_daily_stats(
+        self,
+        db: AsyncSession,
+        *,
+        company_id: int,
+        start_day: Optional[date] = None,
+        end_day: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """회사별 일자별 피드백 통계 (일자순)"""
+        conditions = [DailyFeedbackStat.company_id == company_id]
+        if start_day:
+            conditions.append(DailyFeedbackStat.day >= start_day)
+        if end_day:
+            conditions.append(DailyFeedbackStat.day <= end_day)
+
+        result = await db.execute(
+            select(DailyFeedbackStat).where(*conditions).order_by(DailyFeedbackStat.day)
+        )
+        return [
+            {"day": stat.day, **stats_summary(stat)}
+            for stat in result.scalars().all()
+        ]
+
+    async def rebuild(
+        self,
+        db: AsyncSession,
+        *,
+        company_id: Optional[int] = None
+    ) -> int:
+        """
+        원본 피드백으로 통계 재계산 (company_id가 없으면 전체)
+
+        기존 집계 삭제와 재계산을 한 트랜잭션으로 처리합니다.
+
+        Returns:
+            재계산된 일자별 통계 행 수
+        """
+        def scoped(model):
+            return [model.company_id == company_id] if company_id is not None else []
+
+        for model in (DailyFeedbackStat, CompanyFeedbackStat):
+            await db.execute(delete(model).where(*scoped(model)))
+
+        now = func.now()
+        # GROUP BY 식과 일치하도록 시간대는 바인드 파라미터 대신 리터럴로 지정
+        day = func.date(func.timezone(literal_column("'UTC'"), ChatFeedback.created_at))
+        daily = (
+            select(
+                ChatHistory.company_id,
+                day,
+                func.count(ChatFeedback.id),
+                func.count(ChatFeedback.rating),
+                func.coalesce(func.sum(ChatFeedback.rating), 0),
+                func.count().filter(ChatFeedback.is_accurate.is_(True)),
+                now
+            )
+            .join(ChatHistory, ChatFeedback.chat_id == ChatHistory.id)
+            .where(*scoped(ChatHistory))
+            .group_by(ChatHistory.company_id, day)
+        )
+        result = await db.execute(
+            insert(DailyFeedbackStat).from_select(
+                ["company_id", "day", *COUNTER_COLUMNS, "updated_at"],
+                daily
+            )
+        )
+
+        totals = (
+            select(
+                DailyFeedbackStat.company_id,
+                *(func.sum(getattr(DailyFeedbackStat, column)) for column in COUNTER_COLUMNS),
+                now
+            )
+            .where(*scoped(DailyFeedbackStat))
+            .group_by(DailyFeedbackStat.company_id)
+        )
+        await db.execute(
+            insert(CompanyFeedbackStat).from_select(
+                ["company_id", *COUNTER_COLUMNS, "updated_at"],
+                totals
+            )
+        )
+        await db.commit()
+        return result.rowcount
+
+
+# CRUD 객체 인스턴스 생성
+feedback_stat = CRUDFeedbackStat(CompanyFeedbackStat)
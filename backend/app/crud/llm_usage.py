@@ -0,0 +1,97 @@
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import column, exists, select, desc, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import CRUDBase, replica_read
+from app.crud.pagination import Page
+from app.models import Company, LLMUsage
+from app.schemas.llm_usage import LLMUsageBase
+
+# 누적 집계 컬럼
+COUNTER_COLUMNS = (
+    "call_count",
+    "error_count",
+    "retry_count",
+    "validation_failure_count",
+    "prompt_tokens",
+    "completion_tokens",
+    "total_duration_ms",
+    "estimated_cost",
+)
+
+
+class CRUDLLMUsage(CRUDBase[LLMUsage, LLMUsageBase, LLMUsageBase]):
+    default_sort = ("day", "desc")
+
+    async def increment_many(
+        self,
+        db: AsyncSession,
+        *,
+        rows: List[Dict[str, Any]]
+    ) -> List[Tuple[int, date, str, str]]:
+        """
+        집계 행 누적 (company_id, day, call_site, model 단위 upsert)
+
+        누적하는 사이 삭제된 회사의 행은 외래 키 오류로 전체가 실패하지 않도록
+        INSERT ... SELECT ... WHERE EXISTS로 제외합니다.
+
+        Returns:
+            반영된 행의 (company_id, day, call_site, model) 목록
+        """
+        if not rows:
+            return []
+
+        names = list(rows[0])
+        pending = values(
+            *(column(name, LLMUsage.__table__.c[name].type) for name in names),
+            name="pending"
+        ).data([tuple(row[name] for name in names) for row in rows])
+        stmt = insert(LLMUsage).from_select(
+            names,
+            select(*pending.c).where(exists().where(Company.id == pending.c.company_id))
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_llm_usages_company_day_site_model",
+            set_={
+                **{
+                    name: getattr(LLMUsage, name) + getattr(stmt.excluded, name)
+                    for name in COUNTER_COLUMNS
+                },
+                "updated_at": stmt.excluded.updated_at
+            }
+        ).returning(LLMUsage.company_id, LLMUsage.day, LLMUsage.call_site, LLMUsage.model)
+        written = [tuple(row) for row in (await db.execute(stmt)).all()]
+        await db.commit()
+        return written
+
+    @replica_read
+    async def get_by_company(
+        self,
+        db: AsyncSession,
+        *,
+        company_id: int,
+        start_day: Optional[date] = None,
+        end_day: Optional[date] = None,
+        skip: int = 0,
+        limit: int = 100,
+        sort_by: Optional[str] = None,
+        order: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> Page[LLMUsage]:
+        """회사별 LLM 사용량 조회 (최근 일자 순)"""
+        conditions = [LLMUsage.company_id == company_id]
+        if start_day:
+            conditions.append(LLMUsage.day >= start_day)
+        if end_day:
+            conditions.append(LLMUsage.day <= end_day)
+
+        query = select(LLMUsage).where(*conditions)
+        return await self.paginate(
+            db, query, sort_by=sort_by, order=order, cursor=cursor, skip=skip, limit=limit
+        )
+
+
+# CRUD 객체 인스턴스 생성
+llm_usage = CRUDLLMUsage(LLMUsage)
@@ -0,0 +1,89 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# 순서 값 간격: 이동 시 이웃 사이 값을 사용하므로 대부분 한 행만 갱신됨
+ORDER_GAP = 1024
+
+
+def _is_increasing(ranks: Sequence[Optional[int]]) -> bool:
+    return all(rank is not None and rank > 0 for rank in ranks) and all(
+        before < after for before, after in zip(ranks, ranks[1:])
+    )
+
+
+def plan_reorder(
+    ranks: Sequence[Tuple[int, Optional[int]]],
+    moves: Dict[int, int]
+) -> Dict[int, int]:
+    """
+    순서 변경 계획 수립
+
+    이동하지 않는 섹션은 그대로 두고, 이동한 섹션에만 새 이웃 사이의 값을 배정합니다.
+    사이에 남은 간격이 없거나 기존 순서 값이 중복된 경우 전체를 ORDER_GAP 간격으로
+    다시 매깁니다.
+
+    Args:
+        ranks: 현재 순서대로 정렬된 (섹션 ID, 순서 값) 목록
+        moves: 섹션 ID별 새 위치 (1부터 시작)
+
+    Returns:
+        순서 값이 바뀌는 섹션 ID별 새 순서 값
+
+    Raises:
+        ValueError: ranks에 없는 섹션 ID가 moves에 포함된 경우
+    """
+    current = dict(ranks)
+    unknown = set(moves) - set(current)
+    if unknown:
+        raise ValueError(f"Unknown section ids: {sorted(unknown)}")
+
+    sequence: List[int] = [id for id, _ in ranks if id not in moves]
+    for id, position in sorted(moves.items(), key=lambda item: item[1]):
+        index = min(max(position, 1), len(sequence) + 1) - 1
+        sequence.insert(index, id)
+
+    new_ranks = _place_moved(sequence, current, moves)
+    if new_ranks is None:
+        new_ranks = {id: (index + 1) * ORDER_GAP for index, id in enumerate(sequence)}
+
+    return {id: rank for id, rank in new_ranks.items() if current[id] != rank}
+
+
+def _place_moved(
+    sequence: List[int],
+    current: Dict[int, Optional[int]],
+    moves: Dict[int, int]
+) -> Optional[Dict[int, int]]:
+    """이동한 섹션을 이웃 사이 값으로 배치 (간격이 부족하면 None)"""
+    stationary = [current[id] for id in sequence if id not in moves]
+    if not _is_increasing(stationary):
+        return None
+
+    new_ranks: Dict[int, int] = {}
+    index = 0
+    while index < len(sequence):
+        id = sequence[index]
+        if id not in moves:
+            new_ranks[id] = current[id]
+            index += 1
+            continue
+
+        # 연속으로 이동한 섹션 묶음을 앞뒤 이웃 사이에 균등 배치
+        end = index
+        while end < len(sequence) and sequence[end] in moves:
+            end += 1
+        count = end - index
+        lower = new_ranks[sequence[index - 1]] if index > 0 else 0
+        upper = current[sequence[end]] if end < len(sequence) else None
+
+        if upper is None:
+            ranks = [lower + ORDER_GAP * (step + 1) for step in range(count)]
+        else:
+            if upper - lower <= count:
+                return None
+            ranks = [lower + (upper - lower) * (step + 1) // (count + 1) for step in range(count)]
+
+        for moved_id, rank in zip(sequence[index:end], ranks):
+            new_ranks[moved_id] = rank
+        index = end
+
+    return new_ranks
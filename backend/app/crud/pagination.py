@@ -0,0 +1,116 @@
+import base64
+import enum
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Generic, List, Optional, TypeVar
+
+from sqlalchemy import and_, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+T = TypeVar("T")
+
+
+class InvalidCursorError(ValueError):
+    """해석할 수 없거나 현재 정렬 조건과 맞지 않는 커서"""
+
+
+class Page(list, Generic[T]):
+    """
+    키셋 페이지네이션 결과
+
+    목록처럼 사용할 수 있으며, 다음 페이지가 있으면 next_cursor에
+    마지막 행의 (정렬 값, id)를 담은 불투명 커서가 설정됩니다.
+    """
+
+    def __init__(self, items: List[T], next_cursor: Optional[str] = None):
+        super().__init__(items)
+        self.next_cursor = next_cursor
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """디코딩된 커서 (정렬 기준, 정렬 방향, 마지막 행의 정렬 값과 id)"""
+    sort_by: str
+    order: str
+    value: Any
+    id: int
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _load_value(column: ColumnElement, value: Any) -> Any:
+    """JSON 값을 컬럼 타입에 맞게 복원 (asyncpg는 문자열 날짜를 받지 않음)"""
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if issubclass(python_type, datetime):
+        return datetime.fromisoformat(value)
+    if issubclass(python_type, date):
+        return date.fromisoformat(value)
+    if issubclass(python_type, (enum.Enum, Decimal)):
+        return python_type(value)
+    return value
+
+
+def encode_cursor(sort_by: str, order: str, value: Any, id: int) -> str:
+    """다음 페이지 조회용 커서 생성"""
+    payload = json.dumps([sort_by, order, _dump_value(value), id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, column: ColumnElement, sort_by: str, order: str) -> Cursor:
+    """
+    커서 해석
+
+    Raises:
+        InvalidCursorError: 형식이 잘못되었거나 다른 정렬 조건으로 발급된 커서인 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_sort_by, cursor_order, value, last_id = json.loads(base64.urlsafe_b64decode(padded))
+        decoded = Cursor(cursor_sort_by, cursor_order, _load_value(column, value), int(last_id))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursorError("잘못된 커서입니다") from e
+
+    if (decoded.sort_by, decoded.order) != (sort_by, order):
+        raise InvalidCursorError("커서의 정렬 조건이 요청과 다릅니다")
+    return decoded
+
+
+def keyset_condition(
+    column: ColumnElement,
+    id_column: ColumnElement,
+    order: str,
+    cursor: Cursor
+) -> ColumnElement:
+    """
+    (정렬 값, id) 기준으로 커서 이후의 행만 선택하는 조건
+
+    정렬 값이 NULL인 행은 방향과 관계없이 마지막(NULLS LAST)에 위치합니다.
+    """
+    descending = order == "desc"
+    id_after = id_column < cursor.id if descending else id_column > cursor.id
+    if column is id_column:
+        return id_after
+    if cursor.value is None:
+        return and_(column.is_(None), id_after)
+
+    value_after = column < cursor.value if descending else column > cursor.value
+    return or_(
+        value_after,
+        and_(column == cursor.value, id_after),
+        column.is_(None)
+    )
@@ -0,0 +1,42 @@
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+from app.models.search import SEARCH_CONFIG
+
+# ts_headline 강조 표시 옵션
+HEADLINE_OPTIONS = (
+    "StartSel=<mark>, StopSel=</mark>, "
+    "MaxWords=35, MinWords=15, MaxFragments=2, FragmentDelimiter=\" … \""
+)
+
+# tsquery 연산자 및 구분 문자 (검색어에서 제거)
+_TSQUERY_SEPARATORS = re.compile(r"[\s&|!():*<>'\\]+")
+_LIKE_SPECIAL = re.compile(r"([%_\\])")
+
+
+@dataclass(frozen=True)
+class SearchFields:
+    """모델별 검색 대상 컬럼"""
+    vector: str  # tsvector 생성 컬럼
+    trigram: str  # pg_trgm 부분 일치 컬럼
+    headline: str  # 강조 스니펫을 만들 본문 컬럼
+
+
+def build_prefix_tsquery(text: str) -> Optional[str]:
+    """
+    검색어를 접두사 일치 tsquery 문자열로 변환
+
+    'simple' 설정은 조사를 분리하지 못하므로 각 단어를 접두사(:*)로 검색하여
+    "시장 규모"가 "시장은", "규모가" 같은 어절에도 일치하도록 합니다.
+    """
+    terms = [term for term in _TSQUERY_SEPARATORS.split(text) if term]
+    if not terms:
+        return None
+    return " & ".join(f"'{term}':*" for term in terms)
+
+
+def escape_like(text: str) -> str:
+    """LIKE 패턴 특수문자 이스케이프"""
+    return _LIKE_SPECIAL.sub(r"\\\1", text)
+
@@ -1,30 +1,41 @@
 from typing import List, Optional, Dict, Any
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, case, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 
-from app.crud.base import CRUDBase
+from app.core.database import pin_primary
+from app.crud.base import CRUDBase, LoadPlan, replica_read
+from app.crud.ordering import ORDER_GAP, plan_reorder
+from app.crud.pagination import Page
+from app.crud.search import SearchFields
 from app.models import Section, SectionType
 from app.schemas.section import SectionCreate, SectionUpdate
 
 
 class CRUDSection(CRUDBase[Section, SectionCreate, SectionUpdate]):
+    default_sort = ("order", "asc")
+    search_fields = SearchFields(vector="search_vector", trigram="title", headline="content")
+    loading_plans = {
+        # 목록 응답용: 섹션 본문은 상세 조회에서만 로딩
+        "summary": (defer(Section.content, raiseload=True),),
+    }
+
     async def create_with_order(
         self,
         db: AsyncSession,
         *,
         obj_in: SectionCreate
     ) -> Section:
-        """순서 자동 할당하여 섹션 생성"""
-        # 현재 문서의 최대 순서 값 조회
-        query = select(func.max(Section.order)).where(
-            Section.document_id == obj_in.document_id
+        """문서 마지막 순서로 섹션 생성 (순서 값은 INSERT 안에서 계산)"""
+        last_order = (
+            select(func.coalesce(func.max(Section.order), 0) + ORDER_GAP)
+            .where(Section.document_id == obj_in.document_id)
+            .scalar_subquery()
         )
-        result = await db.execute(query)
-        max_order = result.scalar() or 0
 
         # 데이터 준비
         db_data = obj_in.model_dump()
-        db_data["order"] == max_order + 1
+        db_data["order"] = last_order
 
         # 섹션 생성
         db_obj = Section(**db_data)
@@ -33,25 +44,30 @@ class CRUDSection(CRUDBase[Section, SectionCreate, SectionUpdate]):
         await db.refresh(db_obj)
         return db_obj
 
+    @replica_read
     async def get_by_document(
         self,
         db: AsyncSession,
         *,
         document_id: int,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[Section]:
-        """문서별 섹션 목록 조회"""
+        limit: Optional[int] = 100,
+        sort_by: Optional[str] = None,
+        order: Optional[str] = None,
+        cursor: Optional[str] = None,
+        load: LoadPlan = None
+    ) -> Page[Section]:
+        """문서별 섹션 목록 조회 (limit=None이면 전체)"""
         query = (
             select(Section)
+            .options(*self.loader_options(load))
             .where(Section.document_id == document_id)
-            .order_by(Section.order)
-            .offset(skip)
-            .limit(limit)
         )
-        result = await db.execute(query)
-        return result.scalars().all()
+        return await self.paginate(
+            db, query, sort_by=sort_by, order=order, cursor=cursor, skip=skip, limit=limit
+        )
 
+    @replica_read
     async def get_by_type(
         self,
         db: AsyncSession,
@@ -60,8 +76,12 @@ class CRUDSection(CRUDBase[Section, SectionCreate, SectionUpdate]):
         document_id: Optional[int] = None,
         company_id: Optional[int] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[Section]:
+        limit: int = 100,
+        sort_by: Optional[str] = None,
+        order: Optional[str] = None,
+        cursor: Optional[str] = None,
+        load: LoadPlan = None
+    ) -> Page[Section]:
         """섹션 유형별 조회"""
         conditions = [Section.type == section_type]
         if document_id:
@@ -69,15 +89,10 @@ class CRUDSection(CRUDBase[Section, SectionCreate, SectionUpdate]):
         if company_id:
             conditions.append(Section.company_id == company_id)
 
-        query = (
-            select(Section)
-            .where(and_(*conditions))
-            .order_by(Section.order)
-            .offset(skip)
-            .limit(limit)
+        query = select(Section).options(*self.loader_options(load)).where(and_(*conditions))
+        return await self.paginate(
+            db, query, sort_by=sort_by, order=order, cursor=cursor, skip=skip, limit=limit
         )
-        result = await db.execute(query)
-        return result.scalars().all()
 
     async def update_order(
         self,
@@ -86,54 +101,67 @@ class CRUDSection(CRUDBase[Section, SectionCreate, SectionUpdate]):
         section_id: int,
         new_order: int
     ) -> Optional[Section]:
-        """섹션 순서 변경"""
-        # 현재 섹션 조회
+        """섹션 순서 변경 (new_order: 문서 내 새 위치, 1부터 시작)"""
+        pin_primary(db)
         section = await self.get(db, id=section_id)
         if not section:
             return None
 
-        old_order = section.order
-
-        # 같은 문서 내의 다른 섹션들 순서 조정
-        if new_order > old_order:
-            # 위로 이동: 중간 섹션들의 순서를 하나씩 감소
-            query = (
-                select(Section)
-                .where(
-                    and_(
-                        Section.document_id == section.document_id,
-                        Section.order <= new_order,
-                        Section.order > old_order
-                    )
-                )
-            )
-            result = await db.execute(query)
-            affected_sections = result.scalars().all()
-            for affected in affected_sections:
-                affected.order -= 1
-        else:
-            # 아래로 이동: 중간 섹션들의 순서를 하나씩 증가
-            query = (
-                select(Section)
-                .where(
-                    and_(
-                        Section.document_id == section.document_id,
-                        Section.order >= new_order,
-                        Section.order < old_order
-                    )
-                )
-            )
-            result = await db.execute(query)
-            affected_sections = result.scalars().all()
-            for affected in affected_sections:
-                affected.order += 1
-
-        # 현재 섹션 순서 업데이트
-        section.order = new_order
-        await db.commit()
+        await self.reorder_sections(
+            db,
+            document_id=section.document_id,
+            section_orders={section_id: new_order}
+        )
         await db.refresh(section)
         return section
 
+    async def reorder_sections(
+        self,
+        db: AsyncSession,
+        *,
+        document_id: int,
+        section_orders: Dict[int, int]
+    ) -> Optional[List[Section]]:
+        """
+        여러 섹션 순서 일괄 변경
+
+        이동한 섹션에는 이웃 사이의 순서 값을 배정하므로 보통 이동한 행만 갱신되며,
+        간격이 부족하면 문서 전체를 다시 매깁니다. 어느 경우든 UPDATE는 한 번입니다.
+
+        Args:
+            document_id: 문서 ID
+            section_orders: 섹션 ID별 새 위치 (1부터 시작)
+
+        Returns:
+            새 순서대로 정렬된 문서의 섹션 목록 (문서에 없는 섹션이 포함되면 None)
+        """
+        result = await db.execute(
+            select(Section.id, Section.order)
+            .where(Section.document_id == document_id)
+            .order_by(Section.order.asc().nulls_last(), Section.id)
+        )
+        try:
+            changes = plan_reorder(result.all(), section_orders)
+        except ValueError:
+            return None
+
+        if changes:
+            await db.execute(
+                update(Section)
+                .where(Section.id.in_(list(changes)))
+                .values(order=case(changes, value=Section.id))
+                .execution_options(synchronize_session=False)
+            )
+            await db.commit()
+
+        result = await db.execute(
+            select(Section)
+            .where(Section.document_id == document_id)
+            .order_by(Section.order, Section.id)
+        )
+        return list(result.scalars().all())
+
+    @replica_read
     async def search_sections(
         self,
         db: AsyncSession,
@@ -142,28 +170,20 @@ class CRUDSection(CRUDBase[Section, SectionCreate, SectionUpdate]):
         document_id: Optional[int] = None,
         company_id: Optional[int] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[Section]:
-        """색션 검색"""
-        search_term = f"%{query}%"
-        conditions = [
-            Section.title.ilike(search_term) |
-            Section.content.ilike(search_term)
-        ]
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        load: LoadPlan = None
+    ) -> Page[Section]:
+        """섹션 검색 (관련도순, 강조 스니펫 포함)"""
+        conditions = []
         if document_id:
             conditions.append(Section.document_id == document_id)
         if company_id:
             conditions.append(Section.company_id == company_id)
 
-        query = (
-            select(Section)
-            .where(and_(*conditions))
-            .order_by(Section.order)
-            .offset(skip)
-            .limit(limit)
+        return await self.search(
+            db, query=query, where=conditions, load=load, skip=skip, limit=limit, cursor=cursor
         )
-        result = await db.execute(query)
-        return result.scalars().all()
 
 # CRUD 객체 인스턴스 생성
 section = CRUDSection(Section)
@@ -1,17 +1,53 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 import uvicorn
+import asyncio
 import os
 
+from app.api.deps import NEXT_CURSOR_HEADER
 from app.core.config import settings
+from app.core.database import dispose_engines, replica_router
+from app.services.file_reaper import file_reaper
+from app.services.llm_gateway import llm_gateway
+from app.services.llm_telemetry import llm_telemetry
 #from app.api.endpoints import companies, documents, sections
 
 # 업로드 디렉토리 생성
 os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    애플리케이션 수명 주기 관리
+
+    시작 시 LLM 사용량 주기적 반영 태스크, 업로드 파일 정리 작업(과 읽기 복제본 헬스 체크)을 띄우고,
+    종료 시 남은 사용량을 반영한 뒤 실제로 생성된 OpenAI 커넥션 풀과 DB 엔진만 정리합니다.
+    (엔진/클라이언트 자체는 첫 사용 시점에 생성)
+    """
+    app.state.llm_usage_flusher = asyncio.create_task(llm_telemetry.run_flusher())
+    app.state.file_reaper = asyncio.create_task(file_reaper.run(settings.FILE_REAPER_INTERVAL_SECONDS))
+    replica_checker = None
+    if replica_router.enabled:
+        replica_checker = asyncio.create_task(
+            replica_router.run_health_checks(settings.DB_REPLICA_HEALTH_CHECK_SECONDS)
+        )
+    try:
+        yield
+    finally:
+        if replica_checker is not None:
+            replica_checker.cancel()
+        app.state.file_reaper.cancel()
+        app.state.llm_usage_flusher.cancel()
+        await llm_telemetry.flush()
+        await llm_gateway.aclose()
+        await dispose_engines()
+
 app = FastAPI(
     title=settings.APP_NAME,
     version="0.1.0",
@@ -20,6 +56,7 @@ app = FastAPI(
     openapi_url="/api/v1/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS 미들웨어 설정
@@ -29,6 +66,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
     max_age=3600,
 )
 
@@ -63,6 +101,11 @@ async def validation_exception_handler(request, exc):
         }
     )
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 메트릭 엔드포인트"""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
 @app.get("/")
 async def root():
     """API 루트 엔드포인트"""
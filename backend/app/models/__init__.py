@@ -1,7 +1,10 @@
 from .company import Company
 from .document import Document, DocumentType
 from .section import Section, SectionType
-from .chat import ChatHistory, ChatReference, ChatFeedback
+from .chat import ChatSession, ChatHistory, ChatReference, ChatFeedback
+from .llm_usage import LLMUsage
+from .feedback_stat import CompanyFeedbackStat, DailyFeedbackStat
+from .batch_job import BatchJob, BatchJobItem, BatchJobStatus
 
 # 명시적으로 __all__ 정의
 __all__ = [
@@ -10,7 +13,14 @@ __all__ = [
     'DocumentType',
     'Section',
     'SectionType',
+    'ChatSession',
     'ChatHistory',
     'ChatReference',
-    'ChatFeedback'
+    'ChatFeedback',
+    'LLMUsage',
+    'CompanyFeedbackStat',
+    'DailyFeedbackStat',
+    'BatchJob',
+    'BatchJobItem',
+    'BatchJobStatus'
 ]
\ No newline at end of file
@@ -0,0 +1,53 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Text, Float, ForeignKey, Enum, DateTime, UniqueConstraint
+from sqlalchemy.orm import relationship
+import enum
+
+from app.core.database import Base  # database.py에서 Base 직접 import
+
+class BatchJobStatus(str, enum.Enum):
+    """배치 작업/항목 상태 Enum"""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class BatchJob(Base):
+    """템플릿 기반 문서 일괄 생성 작업 모델"""
+    __tablename__ = "batch_jobs"
+
+    id = Column(Integer, primary_key=True)
+    template_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
+    status = Column(Enum(BatchJobStatus), nullable=False, default=BatchJobStatus.PENDING, index=True)
+    total_items = Column(Integer, nullable=False, default=0)
+    completed_items = Column(Integer, nullable=False, default=0)
+    failed_items = Column(Integer, nullable=False, default=0)
+    completed_sections = Column(Integer, nullable=False, default=0)
+    sections_per_minute = Column(Float)  # 마지막 실행의 처리량
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # Relationships
+    items = relationship("BatchJobItem", back_populates="job", cascade="all, delete-orphan")
+
+class BatchJobItem(Base):
+    """배치 작업의 회사별 항목 모델 (재개 시점 체크포인트)"""
+    __tablename__ = "batch_job_items"
+    __table_args__ = (
+        UniqueConstraint("job_id", "company_id", name="uq_batch_job_items_job_company"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    job_id = Column(Integer, ForeignKey("batch_jobs.id", ondelete="CASCADE"), nullable=False, index=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    document_id = Column(Integer, ForeignKey("documents.id", ondelete="SET NULL"))  # 생성된 문서
+    status = Column(Enum(BatchJobStatus), nullable=False, default=BatchJobStatus.PENDING)
+    completed_sections = Column(Integer, nullable=False, default=0)
+    error = Column(Text)
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # Relationships
+    job = relationship("BatchJob", back_populates="items")
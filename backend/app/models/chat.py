@@ -1,23 +1,52 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, Boolean, Float, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, Boolean, Float, ForeignKey, DateTime, Index, text
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base  # database.py에서 Base 직접 import
+from app.models.search import search_indexes, search_vector_column
+
+class ChatSession(Base):
+    """회사별 대화 세션 모델 (대화 메모리 요약 저장)"""
+    __tablename__ = "chat_sessions"
+
+    id = Column(Integer, primary_key=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True)
+    title = Column(String(255))
+    summary = Column(Text)  # 최근 대화 이전 내용의 누적 요약
+    summarized_until_id = Column(Integer)  # 요약에 반영된 마지막 채팅 이력 ID
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    # Relationships
+    chat_histories = relationship("ChatHistory", back_populates="session")
 
 class ChatHistory(Base):
     """채팅 이력 모델"""
     __tablename__ = "chat_histories"
+    __table_args__ = (
+        *search_indexes("chat_histories", "query"),
+        # 회사별 최근 채팅 이력 (created_at DESC NULLS LAST, id DESC 키셋 페이지네이션과 같은 순서)
+        Index(
+            "ix_chat_histories_company_id_created_at",
+            "company_id",
+            text("created_at DESC NULLS LAST"),
+            text("id DESC")
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    session_id = Column(Integer, ForeignKey("chat_sessions.id", ondelete="SET NULL"), index=True)
     query = Column(Text, nullable=False)
     response = Column(Text, nullable=False)
     is_bookmarked = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    search_vector = search_vector_column(("query", "A"), ("response", "B"))
 
     # Relationships
     company = relationship("Company", back_populates="chat_histories")
+    session = relationship("ChatSession", back_populates="chat_histories")
     references = relationship("ChatReference", back_populates="chat_history", cascade="all, delete-orphan")
     feedback = relationship("ChatFeedback", back_populates="chat_history", uselist=False)
 
@@ -26,8 +55,8 @@ class ChatReference(Base):
     __tablename__ = "chat_references"
 
     id = Column(Integer, primary_key=True)
-    chat_id = Column(Integer, ForeignKey("chat_histories.id", ondelete="CASCADE"), nullable=False)
-    document_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
+    chat_id = Column(Integer, ForeignKey("chat_histories.id", ondelete="CASCADE"), nullable=False, index=True)
+    document_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False, index=True)
     is_auto_referenced = Column(Boolean, default=True)
     relevance_score = Column(Float)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
@@ -3,11 +3,13 @@ from sqlalchemy import Column, Integer, String, Text, Boolean, ARRAY, JSON, Date
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
+from app.models.search import search_indexes, search_vector_column
 
 
 class Company(Base):
     """기업 정보 모델"""
     __tablename__ = "companies"
+    __table_args__ = search_indexes("companies", "name")
 
     # 나머지 코드는 그대로 유지
     id = Column(Integer, primary_key=True)
@@ -24,6 +26,7 @@ class Company(Base):
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    search_vector = search_vector_column(("name", "A"), ("industry", "B"), ("description", "C"))
 
     # Relationships
     documents = relationship("Document", back_populates="company")
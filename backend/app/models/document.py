@@ -1,9 +1,11 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Enum, JSON, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Enum, JSON, DateTime, Index, text
 from sqlalchemy.orm import relationship
 import enum
 
 from app.core.database import Base  # database.py에서 Base 직접 import
+from app.models.search import search_indexes, search_vector_column
+from app.models.soft_delete import SoftDeleteMixin
 
 class DocumentType(str, enum.Enum):
     """문서 유형 Enum"""
@@ -12,9 +14,20 @@ class DocumentType(str, enum.Enum):
     PRODUCT_CATALOG = "product_catalog"
     TRAINING_DATA = "training_data"
 
-class Document(Base):
-    """문서 모델"""
+class Document(SoftDeleteMixin, Base):
+    """문서 모델 (삭제 시 deleted_at만 설정하고, 행과 파일은 정리 작업이 제거)"""
     __tablename__ = "documents"
+    __table_args__ = (
+        *search_indexes("documents", "title"),
+        # 회사별 문서 목록/유형 필터
+        Index("ix_documents_company_id_type", "company_id", "type"),
+        # 정리 대기 중인 삭제 문서 조회
+        Index(
+            "ix_documents_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL")
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
@@ -27,8 +40,14 @@ class Document(Base):
     doc_metadata = Column(JSON)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    search_vector = search_vector_column(("title", "A"), ("content", "B"))
 
     # Relationships
     company = relationship("Company", back_populates="documents")
-    sections = relationship("Section", back_populates="document", cascade="all, delete-orphan")
+    sections = relationship(
+        "Section",
+        back_populates="document",
+        cascade="all, delete-orphan",
+        order_by="Section.order"
+    )
     chat_references = relationship("ChatReference", back_populates="document")
@@ -0,0 +1,33 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, BigInteger, ForeignKey, Date, DateTime, UniqueConstraint
+
+from app.core.database import Base  # database.py에서 Base 직접 import
+
+
+class FeedbackStatCounters:
+    """피드백 집계 누적 컬럼 (평균/비율은 조회 시 계산)"""
+    feedback_count = Column(Integer, nullable=False, default=0)
+    rating_count = Column(Integer, nullable=False, default=0)  # 평점이 있는 피드백 수
+    rating_sum = Column(BigInteger, nullable=False, default=0)
+    accurate_count = Column(Integer, nullable=False, default=0)  # is_accurate가 참인 피드백 수
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+class CompanyFeedbackStat(FeedbackStatCounters, Base):
+    """회사별 피드백 통계 (피드백 저장과 같은 트랜잭션에서 갱신)"""
+    __tablename__ = "company_feedback_stats"
+
+    id = Column(Integer, primary_key=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, unique=True)
+
+
+class DailyFeedbackStat(FeedbackStatCounters, Base):
+    """회사/일자별 피드백 통계 (피드백 작성일 기준, UTC)"""
+    __tablename__ = "daily_feedback_stats"
+    __table_args__ = (
+        UniqueConstraint("company_id", "day", name="uq_daily_feedback_stats_company_day"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False)
+    day = Column(Date, nullable=False)
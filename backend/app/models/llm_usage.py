@@ -0,0 +1,27 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, Float, BigInteger, ForeignKey, Date, DateTime, UniqueConstraint
+
+from app.core.database import Base  # database.py에서 Base 직접 import
+
+class LLMUsage(Base):
+    """LLM 호출 사용량 집계 모델 (회사/일자/호출 위치/모델 단위)"""
+    __tablename__ = "llm_usages"
+    __table_args__ = (
+        UniqueConstraint("company_id", "day", "call_site", "model", name="uq_llm_usages_company_day_site_model"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    company_id = Column(Integer, ForeignKey("companies.id", ondelete="CASCADE"), nullable=False, index=True)
+    day = Column(Date, nullable=False)
+    call_site = Column(String(100), nullable=False)
+    model = Column(String(100), nullable=False)
+    call_count = Column(Integer, nullable=False, default=0)
+    error_count = Column(Integer, nullable=False, default=0)
+    retry_count = Column(Integer, nullable=False, default=0)
+    validation_failure_count = Column(Integer, nullable=False, default=0)
+    prompt_tokens = Column(BigInteger, nullable=False, default=0)
+    completion_tokens = Column(BigInteger, nullable=False, default=0)
+    total_duration_ms = Column(BigInteger, nullable=False, default=0)
+    estimated_cost = Column(Float, nullable=False, default=0.0)  # USD
+    created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
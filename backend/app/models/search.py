@@ -0,0 +1,39 @@
+from typing import Tuple
+
+from sqlalchemy import Column, Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
+
+# 전문 검색 설정: 한국어 형태소 사전이 없으므로 공백 단위 'simple' 설정을 사용하고,
+# 조사가 붙은 어절("시장은")은 접두사 검색(시장:*)과 pg_trgm 부분 일치로 보완
+SEARCH_CONFIG = "simple"
+
+
+def search_vector_expression(*weighted: Tuple[str, str]) -> str:
+    """(컬럼, 가중치) 목록으로 tsvector 생성식 작성"""
+    return " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({column}, '')), '{weight}')"
+        for column, weight in weighted
+    )
+
+
+def search_vector_column(*weighted: Tuple[str, str]):
+    """
+    검색용 tsvector 생성 컬럼 (STORED)
+
+    목록/상세 조회에는 필요 없으므로 지연 로딩합니다.
+    """
+    return deferred(Column(TSVECTOR, Computed(search_vector_expression(*weighted), persisted=True)))
+
+
+def search_indexes(table: str, trigram_column: str) -> Tuple[Index, Index]:
+    """tsvector GIN 인덱스와 부분 일치용 pg_trgm GIN 인덱스"""
+    return (
+        Index(f"ix_{table}_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            f"ix_{table}_{trigram_column}_trgm",
+            trigram_column,
+            postgresql_using="gin",
+            postgresql_ops={trigram_column: "gin_trgm_ops"}
+        ),
+    )
@@ -1,9 +1,10 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Enum, JSON, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Enum, JSON, DateTime, Index
 from sqlalchemy.orm import relationship
 import enum
 
 from app.core.database import Base  # database.py에서 Base 직접 import
+from app.models.search import search_indexes, search_vector_column
 
 class SectionType(str, enum.Enum):
     """섹션 유형 Enum"""
@@ -18,6 +19,12 @@ class SectionType(str, enum.Enum):
 class Section(Base):
     """문서 섹션 모델"""
     __tablename__ = "sections"
+    __table_args__ = (
+        *search_indexes("sections", "title"),
+        # 문서별 섹션 목록 (order, id 순 키셋 페이지네이션)
+        Index("ix_sections_document_id_order", "document_id", "order", "id"),
+        Index("ix_sections_company_id", "company_id"),
+    )
 
     id = Column(Integer, primary_key=True)
     document_id = Column(Integer, ForeignKey("documents.id", ondelete="CASCADE"), nullable=False)
@@ -29,6 +36,7 @@ class Section(Base):
     meta_data = Column(JSON)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    search_vector = search_vector_column(("title", "A"), ("content", "B"))
 
     # Relationships
     document = relationship("Document", back_populates="sections")
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, DateTime, event
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+# 삭제된 행까지 조회할 때 지정하는 실행 옵션 (예: 파일 정리 작업)
+INCLUDE_DELETED = "include_deleted"
+
+
+class SoftDeleteMixin:
+    """soft delete 지원 모델 (deleted_at이 설정된 행은 일반 조회에서 제외)"""
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_soft_deleted(orm_execute_state: ORMExecuteState) -> None:
+    """
+    모든 ORM SELECT에 deleted_at IS NULL 조건 추가
+
+    관계 로딩(lazy/selectin)에는 with_loader_criteria가 자동으로 전파됩니다.
+    execution_options(include_deleted=True)로 조회하면 삭제된 행도 포함합니다.
+    """
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+        and not orm_execute_state.execution_options.get(INCLUDE_DELETED, False)
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            with_loader_criteria(
+                SoftDeleteMixin,
+                lambda cls: cls.deleted_at.is_(None),
+                include_aliases=True
+            )
+        )
@@ -1,5 +1,11 @@
 # schemas/__init__.py
-from .base import BaseSchema
+from .base import (
+    BaseSchema,
+    BulkStatus,
+    BulkIds,
+    BulkItemResult,
+    BulkResult
+)
 from .company import (
     CompanyBase,
     CompanyCreate,
@@ -12,35 +18,63 @@ from .document import (
     DocumentBase,
     DocumentCreate,
     DocumentUpdate,
-    DocumentInDB
+    DocumentInDB,
+    DocumentSummary,
+    DocumentSearchResult,
+    DocumentBulkUpdate
 )
 from .section import (
     SectionType,
     SectionBase,
     SectionCreate,
     SectionUpdate,
-    SectionInDB
+    SectionInDB,
+    SectionSummary,
+    SectionReorder,
+    SectionBulkUpdate
 )
 from .chat import (
+    ChatSessionBase,
+    ChatSessionCreate,
+    ChatSessionInDB,
     ChatHistoryBase,
     ChatHistoryCreate,
     ChatHistoryUpdate,
     ChatHistoryInDB,
+    ChatRequest,
     ChatReferenceBase,
     ChatReferenceCreate,
     ChatReferenceUpdate,
     ChatReferenceInDB,
+    ChatHistoryWithReferences,
+    ChatHistorySummary,
+    ChatHistorySearchResult,
     ChatFeedbackBase,
     ChatFeedbackCreate,
     ChatFeedbackUpdate,
     ChatFeedbackInDB
 )
+from .llm_usage import (
+    LLMUsageBase,
+    LLMUsageInDB
+)
+from .batch_job import (
+    BatchJobStatus,
+    BatchJobCreate,
+    BatchJobItemInDB,
+    BatchJobInDB,
+    BatchJobWithItems
+)
 
 # 순환 참조 해결을 위한 모델 재빌드
 CompanyWithRelations.model_rebuild()
 
 __all__ = [
     'BaseSchema',
+    'BulkStatus',
+    'BulkIds',
+    'BulkItemResult',
+    'BulkResult',
     # Company schemas
     'CompanyBase',
     'CompanyCreate',
@@ -53,23 +87,45 @@ __all__ = [
     'DocumentCreate',
     'DocumentUpdate',
     'DocumentInDB',
+    'DocumentSummary',
+    'DocumentSearchResult',
+    'DocumentBulkUpdate',
     # Section schemas
     'SectionType',
     'SectionBase',
     'SectionCreate',
     'SectionUpdate',
     'SectionInDB',
+    'SectionSummary',
+    'SectionReorder',
+    'SectionBulkUpdate',
     # Chat schemas
+    'ChatSessionBase',
+    'ChatSessionCreate',
+    'ChatSessionInDB',
     'ChatHistoryBase',
     'ChatHistoryCreate',
     'ChatHistoryUpdate',
     'ChatHistoryInDB',
+    'ChatRequest',
     'ChatReferenceBase',
     'ChatReferenceCreate',
     'ChatReferenceUpdate',
     'ChatReferenceInDB',
+    'ChatHistoryWithReferences',
+    'ChatHistorySummary',
+    'ChatHistorySearchResult',
     'ChatFeedbackBase',
     'ChatFeedbackCreate',
     'ChatFeedbackUpdate',
-    'ChatFeedbackInDB'
+    'ChatFeedbackInDB',
+    # LLM usage schemas
+    'LLMUsageBase',
+    'LLMUsageInDB',
+    # Batch job schemas
+    'BatchJobStatus',
+    'BatchJobCreate',
+    'BatchJobItemInDB',
+    'BatchJobInDB',
+    'BatchJobWithItems'
 ]
@@ -1,6 +1,32 @@
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict
+from enum import Enum
+from typing import List
+from pydantic import BaseModel, ConfigDict, Field
+
+# 일괄 작업 한 번에 지정할 수 있는 최대 ID 수
+BULK_MAX_IDS = 500
 
 class BaseSchema(BaseModel):
     """Base schema with common configurations"""
     model_config = ConfigDict(from_attributes=True)
+
+class BulkStatus(str, Enum):
+    """일괄 작업 ID별 결과"""
+    DELETED = "deleted"
+    UPDATED = "updated"
+    NOT_FOUND = "not_found"
+
+class BulkIds(BaseSchema):
+    """일괄 작업 대상 ID 목록"""
+    ids: List[int] = Field(..., min_length=1, max_length=BULK_MAX_IDS)
+
+class BulkItemResult(BaseSchema):
+    """일괄 작업 ID별 결과"""
+    id: int
+    status: BulkStatus
+
+class BulkResult(BaseSchema):
+    """일괄 작업 결과 (요청한 ID 순서대로)"""
+    succeeded: int
+    not_found: int
+    results: List[BulkItemResult]
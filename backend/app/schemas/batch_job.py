@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import List, Optional
+from enum import Enum
+from pydantic import Field
+
+from .base import BaseSchema
+
+class BatchJobStatus(str, Enum):
+    """배치 작업/항목 상태 Enum"""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class BatchJobCreate(BaseSchema):
+    """배치 생성 작업 요청 스키마"""
+    template_id: int = Field(..., description="템플릿 문서 ID")
+    company_ids: List[int] = Field(..., min_length=1, description="문서를 생성할 회사 ID 목록")
+
+class BatchJobItemInDB(BaseSchema):
+    """배치 작업 항목 DB 응답 스키마"""
+    id: int
+    company_id: int
+    document_id: Optional[int] = None
+    status: BatchJobStatus
+    completed_sections: int
+    error: Optional[str] = None
+    updated_at: datetime
+
+class BatchJobInDB(BaseSchema):
+    """배치 작업 DB 응답 스키마"""
+    id: int
+    template_id: int
+    status: BatchJobStatus
+    total_items: int
+    completed_items: int
+    failed_items: int
+    completed_sections: int
+    sections_per_minute: Optional[float] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+
+class BatchJobWithItems(BatchJobInDB):
+    """항목을 포함한 배치 작업 응답 스키마"""
+    items: List[BatchJobItemInDB] = []
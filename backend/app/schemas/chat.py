@@ -4,6 +4,22 @@ from pydantic import Field, confloat
 
 from .base import BaseSchema
 
+class ChatSessionBase(BaseSchema):
+    """대화 세션 기본 스키마"""
+    title: Optional[str] = Field(None, max_length=255)
+
+class ChatSessionCreate(ChatSessionBase):
+    """대화 세션 생성 스키마"""
+    company_id: int
+
+class ChatSessionInDB(ChatSessionBase):
+    """대화 세션 DB 응답 스키마"""
+    id: int
+    company_id: int
+    summary: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
 class ChatHistoryBase(BaseSchema):
     """채팅 이력 기본 스키마"""
     query: str = Field(..., min_length=1)
@@ -13,6 +29,7 @@ class ChatHistoryBase(BaseSchema):
 class ChatHistoryCreate(ChatHistoryBase):
     """채팅 이력 생성 스키마"""
     company_id: int
+    session_id: Optional[int] = None
 
 class ChatHistoryUpdate(ChatHistoryBase):
     """채팅 이력 수정 스키마"""
@@ -24,8 +41,15 @@ class ChatHistoryInDB(ChatHistoryBase):
     """채팅 이력 DB 응답 스키마"""
     id: int
     company_id: int
+    session_id: Optional[int] = None
     created_at: datetime
 
+class ChatRequest(BaseSchema):
+    """채팅 질문 요청 스키마"""
+    company_id: int
+    query: str = Field(..., min_length=1)
+    session_id: Optional[int] = Field(None, description="대화 세션 ID (이전 대화 맥락 유지)")
+
 class ChatReferenceBase(BaseSchema):
     """채팅 참조 기본 스키마"""
     is_auto_referenced: bool = True
@@ -48,6 +72,24 @@ class ChatReferenceInDB(ChatReferenceBase):
     document_id: int
     created_at: datetime
 
+class ChatHistoryWithReferences(ChatHistoryInDB):
+    """참조 문서를 포함한 채팅 이력 응답 스키마"""
+    references: List[ChatReferenceInDB] = []
+
+class ChatHistorySummary(BaseSchema):
+    """채팅 이력 목록 응답 스키마 (응답 본문 제외)"""
+    id: int
+    company_id: int
+    session_id: Optional[int] = None
+    query: str
+    is_bookmarked: Optional[bool] = False
+    created_at: datetime
+
+class ChatHistorySearchResult(ChatHistorySummary):
+    """채팅 이력 검색 결과 스키마"""
+    rank: float = Field(..., description="관련도 점수")
+    snippet: Optional[str] = Field(None, description="검색어가 <mark>로 강조된 응답 발췌")
+
 class ChatFeedbackBase(BaseSchema):
     """채팅 피드백 기본 스키마"""
     rating: Optional[int] = Field(None, ge=1, le=5)
@@ -3,7 +3,7 @@ from typing import Optional
 from enum import Enum
 from pydantic import Field
 
-from .base import BaseSchema
+from .base import BaseSchema, BulkIds
 
 class DocumentType(str, Enum):
     """문서 유형 Enum"""
@@ -35,4 +35,26 @@ class DocumentInDB(DocumentBase):
     id: int
     company_id: int
     created_at: datetime
-    updated_at: datetime
\ No newline at end of file
+    updated_at: datetime
+
+class DocumentSummary(BaseSchema):
+    """문서 목록 응답 스키마 (본문 제외)"""
+    id: int
+    company_id: int
+    title: str
+    type: DocumentType
+    file_name: Optional[str] = None
+    mime_type: Optional[str] = None
+    doc_metadata: Optional[dict] = None
+    created_at: datetime
+    updated_at: datetime
+
+class DocumentSearchResult(DocumentSummary):
+    """문서 검색 결과 스키마"""
+    rank: float = Field(..., description="관련도 점수")
+    snippet: Optional[str] = Field(None, description="검색어가 <mark>로 강조된 본문 발췌")
+
+class DocumentBulkUpdate(BulkIds):
+    """문서 메타데이터 일괄 수정 스키마 (지정한 값을 모든 문서에 같이 적용)"""
+    type: Optional[DocumentType] = None
+    doc_metadata: Optional[dict] = Field(None, description="기존 메타데이터를 대체")
@@ -0,0 +1,24 @@
+from datetime import date, datetime
+from pydantic import Field
+
+from .base import BaseSchema
+
+class LLMUsageBase(BaseSchema):
+    """LLM 사용량 집계 기본 스키마"""
+    company_id: int
+    day: date
+    call_site: str = Field(..., max_length=100)
+    model: str = Field(..., max_length=100)
+    call_count: int = 0
+    error_count: int = 0
+    retry_count: int = 0
+    validation_failure_count: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_duration_ms: int = 0
+    estimated_cost: float = Field(0.0, description="추정 비용 (USD)")
+
+class LLMUsageInDB(LLMUsageBase):
+    """LLM 사용량 집계 DB 응답 스키마"""
+    id: int
+    updated_at: datetime
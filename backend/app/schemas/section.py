@@ -1,9 +1,9 @@
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 from enum import Enum
 from pydantic import Field
 
-from .base import BaseSchema
+from .base import BaseSchema, BulkIds
 
 class SectionType(str, Enum):
     """섹션 유형 Enum"""
@@ -40,3 +40,28 @@ class SectionInDB(SectionBase):
     company_id: int
     created_at: datetime
     updated_at: datetime
+
+class SectionSummary(BaseSchema):
+    """섹션 목록 응답 스키마 (본문 제외)"""
+    id: int
+    document_id: int
+    company_id: int
+    type: SectionType
+    title: str
+    order: Optional[int] = None
+    meta_data: Optional[dict] = None
+    created_at: datetime
+    updated_at: datetime
+
+class SectionReorder(BaseSchema):
+    """섹션 순서 일괄 변경 스키마"""
+    section_orders: Dict[int, int] = Field(
+        ...,
+        min_length=1,
+        description="섹션 ID별 새 위치 (1부터 시작)"
+    )
+
+class SectionBulkUpdate(BulkIds):
+    """섹션 메타데이터 일괄 수정 스키마 (지정한 값을 모든 섹션에 같이 적용)"""
+    type: Optional[SectionType] = None
+    meta_data: Optional[dict] = Field(None, description="기존 메타데이터를 대체")
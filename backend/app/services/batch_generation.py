@@ -0,0 +1,299 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from fastapi import HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.crud import batch_job, crud_company, crud_document, crud_section
+from app.models import BatchJob, BatchJobItem, BatchJobStatus, Company, Document, Section
+from app.schemas.batch_job import BatchJobCreate
+from app.schemas.document import DocumentCreate
+from app.services.document_service import DocumentService, document_service
+from app.utils.worker_pool import run_worker_pool
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchReport:
+    """배치 실행 결과"""
+    job_id: int
+    status: BatchJobStatus
+    completed_items: int
+    failed_items: int
+    completed_sections: int
+    elapsed_seconds: float
+
+    @property
+    def sections_per_minute(self) -> float:
+        """이번 실행의 분당 섹션 처리량"""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.completed_sections * 60 / self.elapsed_seconds
+
+
+@dataclass
+class _SectionTask:
+    """섹션 1개 커스터마이징 작업"""
+    item: BatchJobItem
+    company: Company
+    template_section: Section
+
+
+@dataclass
+class _RunState:
+    """배치 1회 실행 상태 (체크포인트 기록은 lock으로 직렬화)"""
+    db: AsyncSession
+    job: BatchJob
+    remaining: Dict[int, int] = field(default_factory=dict)  # 항목 ID -> 남은 섹션 수
+    completed_items: int = 0
+    failed_items: int = 0
+    completed_sections: int = 0  # 이번 실행에서 생성한 섹션 수
+    sections_before: int = 0  # 이전 실행까지 생성한 섹션 수
+    started_at: float = field(default_factory=time.monotonic)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+
+class BatchGenerationService:
+    """
+    템플릿 기반 문서 일괄 생성
+
+    모든 회사의 섹션 커스터마이징을 하나의 워커 풀에서 처리하고,
+    섹션이 생성될 때마다 진행 상황을 DB에 기록하여 중단 후에도 이어서 실행할 수 있습니다.
+    """
+
+    def __init__(self, document_service: DocumentService):
+        self.document_service = document_service
+        self._running_jobs: Set[int] = set()
+
+    async def create_job(self, db: AsyncSession, *, obj_in: BatchJobCreate) -> BatchJob:
+        """배치 작업 생성"""
+        template = await crud_document.get(db, id=obj_in.template_id)
+        if not template:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Template document not found"
+            )
+        return await batch_job.create_with_items(db, obj_in=obj_in)
+
+    async def run_job(self, job_id: int, concurrency: Optional[int] = None) -> BatchReport:
+        """
+        배치 작업 실행 (완료되지 않은 항목부터 재개)
+
+        Args:
+            job_id: 배치 작업 ID
+            concurrency: 동시 작업 수 (기본값: BATCH_GENERATION_CONCURRENCY)
+
+        Returns:
+            실행 결과와 처리량
+        """
+        if job_id in self._running_jobs:
+            raise ValueError(f"Batch job {job_id} is already running")
+
+        self._running_jobs.add(job_id)
+        try:
+            # 작업 중 커밋 후에도 회사/항목 속성을 읽을 수 있도록 만료하지 않음
+            async with AsyncSessionLocal(expire_on_commit=False) as db:
+                return await self._run(db, job_id, concurrency or settings.BATCH_GENERATION_CONCURRENCY)
+        finally:
+            self._running_jobs.discard(job_id)
+
+    async def _run(self, db: AsyncSession, job_id: int, concurrency: int) -> BatchReport:
+        job = await batch_job.get(db, id=job_id)
+        if not job:
+            raise ValueError(f"Batch job {job_id} not found")
+
+        template = await crud_document.get(db, id=job.template_id)
+        if not template:
+            raise ValueError(f"Template document {job.template_id} not found")
+        template_sections = await crud_section.get_by_document(
+            db,
+            document_id=template.id,
+            limit=None
+        )
+
+        unfinished = await batch_job.get_unfinished_items(db, job_id=job.id)
+        state = _RunState(
+            db=db,
+            job=job,
+            completed_items=job.total_items - len(unfinished),
+            sections_before=job.completed_sections
+        )
+
+        job.status = BatchJobStatus.RUNNING
+        job.started_at = datetime.utcnow()
+        job.finished_at = None
+        await db.commit()
+
+        # 1. 항목별 대상 문서 준비 후 남은 섹션 작업 예약
+        tasks: List[_SectionTask] = []
+        for item in unfinished:
+            tasks.extend(await self._prepare_item(state, template, template_sections, item))
+        await self._checkpoint(state)
+
+        logger.info(
+            f"Batch job {job.id}: {len(unfinished)} items, "
+            f"{len(tasks)} sections to generate with {concurrency} workers"
+        )
+
+        # 2. 공유 워커 풀에서 섹션 커스터마이징
+        await run_worker_pool(tasks, lambda task: self._process(state, task), concurrency)
+
+        # 3. 최종 상태 기록
+        job.status = BatchJobStatus.FAILED if state.failed_items else BatchJobStatus.COMPLETED
+        job.finished_at = datetime.utcnow()
+        await self._checkpoint(state)
+
+        report = BatchReport(
+            job_id=job.id,
+            status=job.status,
+            completed_items=state.completed_items,
+            failed_items=state.failed_items,
+            completed_sections=state.completed_sections,
+            elapsed_seconds=state.elapsed
+        )
+        logger.info(
+            f"Batch job {job.id} {job.status.value}: "
+            f"{report.completed_items}/{job.total_items} items, "
+            f"{report.completed_sections} sections in {report.elapsed_seconds:.1f}s "
+            f"({report.sections_per_minute:.1f} sections/min)"
+        )
+        return report
+
+    async def _prepare_item(
+        self,
+        state: _RunState,
+        template: Document,
+        template_sections: List[Section],
+        item: BatchJobItem
+    ) -> List[_SectionTask]:
+        """항목의 대상 문서를 준비하고 아직 생성되지 않은 섹션 작업 반환"""
+        db = state.db
+        company = await crud_company.get(db, id=item.company_id)
+        if not company:
+            self._mark_failed(state, item, "Company not found")
+            return []
+
+        done_section_ids: Set[int] = set()
+        if item.document_id is None:
+            new_document = await crud_document.create(
+                db,
+                obj_in=DocumentCreate(
+                    title=f"{company.name} - {template.title}",
+                    type=template.type,
+                    content=template.content,
+                    company_id=company.id,
+                    doc_metadata={"template_id": template.id, "batch_job_id": state.job.id}
+                )
+            )
+            item.document_id = new_document.id
+        else:
+            # 이전 실행에서 생성된 섹션은 건너뜀
+            sections = await crud_section.get_by_document(
+                db,
+                document_id=item.document_id,
+                limit=None
+            )
+            done_section_ids = {
+                section.meta_data.get("template_section_id")
+                for section in sections
+                if section.meta_data
+            }
+
+        pending = [
+            section for section in template_sections
+            if section.id not in done_section_ids
+        ]
+        item.completed_sections = len(template_sections) - len(pending)
+        item.error = None
+        if pending:
+            item.status = BatchJobStatus.RUNNING
+            state.remaining[item.id] = len(pending)
+        else:
+            self._mark_completed(state, item)
+
+        return [_SectionTask(item=item, company=company, template_section=section) for section in pending]
+
+    async def _process(self, state: _RunState, task: _SectionTask) -> None:
+        """섹션 1개 커스터마이징 후 체크포인트 기록"""
+        item = task.item
+        # 같은 항목의 다른 섹션이 실패했으면 나머지는 다음 실행에서 재시도
+        if item.status == BatchJobStatus.FAILED:
+            return
+
+        template_section = task.template_section
+        try:
+            content = await self.document_service.customize_section_content(
+                template_section.content,
+                task.company,
+                call_site="batch_generation"
+            )
+        except Exception as e:
+            logger.error(f"Batch job {state.job.id}: company {item.company_id} failed: {str(e)}")
+            async with state.lock:
+                self._mark_failed(state, item, str(e))
+                await self._checkpoint(state)
+            return
+
+        async with state.lock:
+            if item.status == BatchJobStatus.FAILED:
+                return
+            state.db.add(Section(
+                type=template_section.type,
+                title=template_section.title,
+                content=content,
+                order=template_section.order,
+                document_id=item.document_id,
+                company_id=item.company_id,
+                meta_data={"template_section_id": template_section.id}
+            ))
+            item.completed_sections += 1
+            state.completed_sections += 1
+            state.remaining[item.id] -= 1
+            if state.remaining[item.id] == 0:
+                self._mark_completed(state, item)
+            await self._checkpoint(state)
+
+        if state.completed_sections % settings.BATCH_PROGRESS_LOG_INTERVAL == 0:
+            logger.info(
+                f"Batch job {state.job.id}: {state.completed_sections} sections, "
+                f"{state.completed_items}/{state.job.total_items} items "
+                f"({state.completed_sections * 60 / state.elapsed:.1f} sections/min)"
+            )
+
+    @staticmethod
+    def _mark_completed(state: _RunState, item: BatchJobItem) -> None:
+        item.status = BatchJobStatus.COMPLETED
+        state.completed_items += 1
+
+    @staticmethod
+    def _mark_failed(state: _RunState, item: BatchJobItem, error: str) -> None:
+        if item.status != BatchJobStatus.FAILED:
+            state.failed_items += 1
+        item.status = BatchJobStatus.FAILED
+        item.error = error
+
+    @staticmethod
+    async def _checkpoint(state: _RunState) -> None:
+        """진행 상황과 처리량을 DB에 반영"""
+        job = state.job
+        job.completed_items = state.completed_items
+        job.failed_items = state.failed_items
+        job.completed_sections = state.sections_before + state.completed_sections
+        if state.elapsed > 0:
+            job.sections_per_minute = state.completed_sections * 60 / state.elapsed
+        await state.db.commit()
+
+
+batch_generation_service = BatchGenerationService(document_service)
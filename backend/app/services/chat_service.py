@@ -1,16 +1,25 @@
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime
 from sqlalchemy import desc
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from openai import AsyncOpenAI
-
 from app.models.chat import ChatHistory, ChatReference
 
 from app.core.config import settings
-from app.crud import crud_company
+from app.crud import crud_company, crud_document
+from app.crud.chat import chat_history
 from app.models import Company, Document
-from app.services.document_service import DocumentService
+from app.schemas.chat import ChatHistoryCreate
+from app.services.document_service import DocumentService, document_service
+from app.services.context_packer import ContextPacker, PackedContext
+from app.services.conversation_memory import ConversationMemory, conversation_memory
+from app.services.llm_gateway import llm_gateway
+from app.services.llm_telemetry import llm_telemetry
+from app.services.response_cache import CacheKey, ResponseCache, response_cache
+from app.services.response_validator import StreamingValidator, ValidationResult, Verdict
+from app.utils.singleflight import SingleFlight, make_key
+from app.utils.text_processor import count_tokens
 
 import logging
 
@@ -18,70 +27,340 @@ import logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# GPT 응답 생성 파라미터 (일반/스트리밍 공통)
+COMPLETION_PARAMS: Dict[str, Any] = {
+    "temperature": 0.7,
+    "max_tokens": 1500,
+    "top_p": 0.9,
+    "frequency_penalty": 0.3,
+    "presence_penalty": 0.3
+}
+
+
+@dataclass
+class StreamEvent:
+    """스트리밍 응답 이벤트"""
+    event: str
+    data: Any
+
 
 class ChatService:
     def __init__(self, document_service: DocumentService):
         self.document_service = document_service
-        self.client = AsyncOpenAI()
+        self.llm = llm_gateway
+        self.context_packer = ContextPacker(
+            model=settings.GPT_MODEL,
+            max_tokens=settings.CONTEXT_MAX_TOKENS,
+            profile_max_tokens=settings.CONTEXT_PROFILE_MAX_TOKENS
+        )
+        self._completion_flight = SingleFlight()
+        self.memory = conversation_memory
 
     async def generate_response(
         self,
         company_id: int,
         query: str,
-        db: AsyncSession
-    ) -> str:
-        # 1. 회사 데이터 조회
-        company = await crud_company.get_with_relations(db, id=company_id)
+        db: AsyncSession,
+        session_id: Optional[int] = None
+    ) -> ChatHistory:
+        """
+        사용자 질문에 대한 응답 생성 후 채팅 이력과 참조 문서를 함께 저장
+
+        Returns:
+            저장된 채팅 이력 (references에 참조 문서와 관련성 점수 포함)
+        """
+        # 업스트림 장애로 서킷이 열려 있으면 즉시 기본 응답 반환
+        if not self.llm.is_available(settings.GPT_MODEL):
+            return await self._save_chat(
+                db, company_id, session_id, query, self._generate_fallback_response(query)
+            )
+
+        # 1. 회사 데이터 및 대화 메모리 조회
+        company = await crud_company.get(db, id=company_id)
+        memory = await self._load_memory(db, session_id)
+
+        # 2. 유사 질문 응답 캐시 조회 (이전 대화에 따라 답이 달라지므로 첫 질문만)
+        cache_key = await self._get_cache_key(company, query, db)
+        if cache_key and memory.is_empty:
+            cached = response_cache.lookup(company_id, cache_key)
+            if cached:
+                return await self._save_chat(
+                    db, company_id, session_id, query, cached.response, cached.references
+                )
+
+        # 3. 관련 문서로 컨텍스트 구성
+        packed_context = await self._prepare_context(company, query, db, cache_key)
+        history = memory.to_messages()
+
+        # 4. GPT 응답 생성 (동일 프롬프트의 동시 요청은 하나의 호출로 병합)
+        response = await self._completion_flight.do(
+            make_key(
+                settings.GPT_MODEL,
+                self._build_messages(query, packed_context.text, history),
+                COMPLETION_PARAMS
+            ),
+            lambda: self._generate_gpt_response(
+                query,
+                packed_context.text,
+                company_id=company_id,
+                history=history
+            )
+        )
 
-        # 2. 관련 문서 검색
-        relevant_docs = await self.document_service.search_relevant_documents(
+        # 5. 응답 캐시 저장
+        if memory.is_empty:
+            self._store_cache(company_id, cache_key, query, response, packed_context)
+
+        return await self._save_chat(
+            db,
+            company_id,
+            session_id,
+            query,
+            response,
+            self._reference_scores(query, response, packed_context)
+        )
+
+    async def _load_memory(
+        self,
+        db: AsyncSession,
+        session_id: Optional[int]
+    ) -> ConversationMemory:
+        """대화 세션 메모리 조회 (세션이 없으면 빈 메모리)"""
+        if session_id is None:
+            return ConversationMemory()
+        return await self.memory.load(db, session_id)
+
+    async def _save_chat(
+        self,
+        db: AsyncSession,
+        company_id: int,
+        session_id: Optional[int],
+        query: str,
+        response: str,
+        reference_scores: Optional[Dict[int, float]] = None
+    ) -> ChatHistory:
+        """채팅 이력과 참조 문서를 한 번에 저장하고 대화 요약 갱신 예약"""
+        chat = await chat_history.create_with_references(
             db,
-            company_id=company_id,
-            query=query
+            obj_in=ChatHistoryCreate(
+                company_id=company_id,
+                session_id=session_id,
+                query=query,
+                response=response
+            ),
+            scores=reference_scores
         )
+        if session_id is not None:
+            self.memory.schedule_update(session_id)
+        return chat
 
-        # 3. 컨텍스트 구성
-        context = self._build_context(company, relevant_docs)
+    def _reference_scores(
+        self,
+        query: str,
+        response: str,
+        packed_context: Optional[PackedContext]
+    ) -> Dict[int, float]:
+        """응답 생성에 사용된 문서별 관련성 점수 (기본 응답은 참조 없음)"""
+        if packed_context is None or response == self._generate_fallback_response(query):
+            return {}
+        return packed_context.reference_scores
+
+    async def _prepare_context(
+        self,
+        company: Company,
+        query: str,
+        db: AsyncSession,
+        cache_key: Optional[CacheKey] = None
+    ) -> PackedContext:
+        """관련 문서 검색 후 컨텍스트 구성"""
+        # 1. 관련 문서 검색 (관련성 점수 포함, 캐시 조회 시 계산한 임베딩 재사용)
+        scored_docs = await self.document_service.search_scored_documents(
+            db,
+            company_id=company.id,
+            query=query,
+            query_embedding=cache_key.embedding if cache_key else None
+        )
 
-        # 4. GPT 응답 생성
-        response = await self._generate_gpt_response(query, context)
+        # 2. 컨텍스트 구성 (토큰 예산 내)
+        return self._build_context(company, scored_docs)
 
-        return response
+    async def _get_cache_key(
+        self,
+        company: Company,
+        query: str,
+        db: AsyncSession
+    ) -> Optional[CacheKey]:
+        """
+        응답 캐시 키 생성
 
-    def _build_context(self, company: Company, documents: List[Document]) -> str:
-        # 컨텍스트 구성 로직
-        context = f"""
-        회사정보:
-        - 회사명: {company.name}
-        - 주력제품: {company.product_categories}
-        - 수출국가: {', '.join(company.export_countries)}
-        - 목표시장: {', '.join(company.target_markets)}
-        
-        관련 문서 정보:
+        회사 정보와 컨텍스트 문서의 변경 상태로 지문을 만들어
+        회사 정보나 문서가 바뀌면 이전 캐시 항목이 사용되지 않도록 합니다.
         """
+        if not settings.RESPONSE_CACHE_ENABLED:
+            return None
 
-        for doc in documents:
-            context += f"\n{doc.content}\n"
+        try:
+            document_count, documents_updated_at = await crud_document.get_context_version(
+                db,
+                company_id=company.id
+            )
+            embedding = await self.document_service._get_embedding(query, company_id=company.id)
+        except Exception as e:
+            logger.error(f"Error building response cache key: {str(e)}")
+            return None
+
+        fingerprint = ResponseCache.fingerprint(
+            company.id,
+            company.updated_at,
+            document_count,
+            documents_updated_at
+        )
+        return CacheKey(context_fingerprint=fingerprint, embedding=embedding)
+
+    def _store_cache(
+        self,
+        company_id: int,
+        cache_key: Optional[CacheKey],
+        query: str,
+        response: str,
+        packed_context: PackedContext
+    ) -> None:
+        """검증을 통과한 응답만 캐시에 저장"""
+        if not cache_key or response == self._generate_fallback_response(query):
+            return
+
+        # 캐시 적중 시 절감되는 토큰 (프롬프트 + 응답)
+        saved_tokens = packed_context.token_count + count_tokens(response, settings.GPT_MODEL)
+        response_cache.store(
+            company_id,
+            cache_key,
+            query,
+            response,
+            saved_tokens=saved_tokens,
+            references=packed_context.reference_scores
+        )
 
-        return context
+    def _build_context(
+        self,
+        company: Company,
+        scored_documents: List[Tuple[Document, Optional[float]]]
+    ) -> PackedContext:
+        """
+        토큰 예산 내에서 회사 정보와 관련 문서로 컨텍스트 구성
+
+        Args:
+            company: 회사 정보
+            scored_documents: (문서, 관련성 점수) 목록
+
+        Returns:
+            컨텍스트 텍스트와 포함된 문서 구간 (ChatReference 생성용 점수 포함)
+        """
+        packed_context = self.context_packer.pack(company, scored_documents)
+        logger.debug(
+            f"Context packed: {packed_context.token_count} tokens, "
+            f"documents={[p.document_id for p in packed_context.passages]}"
+        )
+        return packed_context
 
     async def _generate_gpt_response(
         self,
         query: str,
         context: str,
-        max_retries: int = 2
+        max_retries: int = 2,
+        company_id: Optional[int] = None,
+        history: Optional[List[Dict[str, str]]] = None
     ) -> str:
         """
         GPT를 사용하여 사용자 질의에 대한 응답 생성
 
+        응답을 스트리밍으로 받으면서 검증하여, 생성이 잘못된 방향으로 가면
+        완료를 기다리지 않고 중단한 뒤 보완 지시를 추가해 다시 생성합니다.
+
         Args:
             query: 사용자 질문
             context: 관련 문서와 회사 정보가 포함된 컨텍스트
             max_retries: 최대 재시도 횟수
+            company_id: 사용량을 집계할 회사 ID
+            history: 이전 대화 메시지 (대화 요약 및 최근 대화)
 
          Returns:
              생성된 응답 텍스트
         """
+        messages = self._build_messages(query, context, history)
+
+        # 네트워크/레이트 리밋 오류 재시도는 게이트웨이에서 처리하고,
+        # 여기서는 검증에 실패한 응답만 다시 생성
+        for attempt in range(max_retries + 1):
+            validator = StreamingValidator(query)
+            try:
+                stream = await self.llm.stream_chat_completion(
+                    model=settings.GPT_MODEL,
+                    messages=messages,
+                    call_site="generate_response",
+                    company_id=company_id,
+                    **COMPLETION_PARAMS
+                )
+                result = await self._consume_validated(stream, validator)
+            except Exception as e:
+                logger.error(f"Error generating GPT response: {str(e)}")
+                return self._generate_fallback_response(query)
+
+            if result.verdict == Verdict.ACCEPTED:
+                return self._format_response(result.text)
+
+            logger.info(f"GPT response rejected ({result.reason}) after {len(result.text)} chars")
+            llm_telemetry.record_validation_failure(
+                "generate_response", settings.GPT_MODEL, company_id, reason=result.reason
+            )
+            messages = self._build_retry_messages(query, context, result, history)
+
+        logger.warning(f"GPT response failed validation after {max_retries + 1} attempts")
+        return self._generate_fallback_response(query)
+
+    @staticmethod
+    async def _consume_validated(stream, validator: StreamingValidator) -> ValidationResult:
+        """응답 스트림을 검증하며 수신 (거부 판정 시 즉시 스트림 종료)"""
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta and validator.feed(delta) == Verdict.REJECTED:
+                    break
+        finally:
+            await stream.aclose()
+        return validator.finish()
+
+    def _build_retry_messages(
+        self,
+        query: str,
+        context: str,
+        result: ValidationResult,
+        history: Optional[List[Dict[str, str]]] = None
+    ) -> List[Dict[str, str]]:
+        """검증 실패 사유에 맞는 보완 지시를 추가한 재생성 메시지 구성"""
+        messages = self._build_messages(query, context, history)
+        if result.retry_hint:
+            messages.append({"role": "system", "content": result.retry_hint})
+        return messages
+
+    def _build_messages(
+        self,
+        query: str,
+        context: str,
+        history: Optional[List[Dict[str, str]]] = None
+    ) -> List[Dict[str, str]]:
+        """
+        질문 유형별 템플릿을 적용하여 GPT 요청 메시지 구성
+
+        Args:
+            query: 사용자 질문
+            context: 관련 문서와 회사 정보가 포함된 컨텍스트
+            history: 이전 대화 메시지 (system 프롬프트와 현재 질문 사이에 삽입)
+
+        Returns:
+            system/user 메시지 목록
+        """
         # 시스템 프롬프트 구성
         system_prompt = """
         당신은 수출바우처 사업계획서 작성을 돕는 전문가입니다.
@@ -147,63 +426,135 @@ class ChatService:
         if template:
             user_prompt += f"\n{template}"
 
-        try:
-            for attempt in range(max_retries + 1):
+        return [
+            {"role": "system", "content": system_prompt},
+            *(history or []),
+            {"role": "user", "content": user_prompt}
+        ]
+
+    async def stream_response(
+        self,
+        company_id: int,
+        query: str,
+        db: AsyncSession,
+        session_id: Optional[int] = None
+    ) -> AsyncIterator[StreamEvent]:
+        """
+        GPT 응답을 토큰 단위로 스트리밍하고 완료 시 채팅 이력 저장
+
+        Args:
+            company_id: 회사 ID
+            query: 사용자 질문
+            db: 데이터베이스 세션
+            session_id: 대화 세션 ID (이전 대화 맥락 유지)
+
+        Yields:
+            token 이벤트(생성된 텍스트 조각), 완료 시 done 이벤트(최종 응답, 채팅 ID, 참조 문서)
+            (업스트림 스트림이 도중에 실패하면 기본 응답을 저장하고 done 대신 error 이벤트)
+        """
+        # 1. 대화 메모리 및 유사 질문 응답 캐시 조회 (캐시는 세션의 첫 질문만)
+        company = await crud_company.get(db, id=company_id)
+        memory = await self._load_memory(db, session_id)
+        cache_key = await self._get_cache_key(company, query, db)
+        cached = (
+            response_cache.lookup(company_id, cache_key)
+            if cache_key and memory.is_empty else None
+        )
+
+        # 2. 토큰 스트리밍 (캐시 적중 시 캐시된 응답을 한 번에 전달)
+        chunks: List[str] = []
+        packed_context = None
+        validation: Optional[ValidationResult] = None
+        stream_failed = False
+        if cached:
+            chunks.append(cached.response)
+            yield StreamEvent(event="token", data=cached.response)
+        else:
+            packed_context = await self._prepare_context(company, query, db, cache_key)
+            messages = self._build_messages(query, packed_context.text, memory.to_messages())
+            # 생성 중 검증하여 잘못된 방향이면 업스트림 생성을 즉시 중단
+            validator = StreamingValidator(query)
+            try:
+                stream = await self.llm.stream_chat_completion(
+                    model=settings.GPT_MODEL,
+                    messages=messages,
+                    call_site="stream_response",
+                    company_id=company_id,
+                    **COMPLETION_PARAMS
+                )
                 try:
-                    response = await self.client.chat.completions.create(
-                        model=settings.GPT_MODEL,
-                        messages=[
-                            {"role": "system", "content": system_prompt},
-                            {"role": "user", "content": user_prompt}
-                        ],
-                        temperature=0.7,
-                        max_tokens=1500,
-                        top_p=0.9,
-                        frequency_penalty=0.3,
-                        presence_penalty=0.3
-                    )
-
-                    generated_text = response.choices[0].message.content
-
-                    # 응답 검증
-                    if self._validate_response(generated_text, query):
-                        return self._format_response(generated_text)
-                    elif attempt < max_retries:
-                        continue
-                    else:
-                        return self._generate_fallback_response(query)
-
-                except Exception as e:
-                    if attempt < max_retries:
-                        await asyncio.sleep(1)  # 재시도 전 대기
-                        continue
-                    else:
-                        logger.error(f"Error generating GPT response: {str(e)}")
-                        return self._generate_fallback_response(query)
+                    async for chunk in stream:
+                        if not chunk.choices:
+                            continue
+                        delta = chunk.choices[0].delta.content
+                        if delta:
+                            chunks.append(delta)
+                            yield StreamEvent(event="token", data=delta)
+                            if validator.feed(delta) == Verdict.REJECTED:
+                                break
+                finally:
+                    await stream.aclose()
+            except Exception as e:
+                # 잘린 응답이 검증을 통과해 저장/캐시되지 않도록 실패로 처리
+                logger.error(f"Error streaming GPT response: {str(e)}")
+                stream_failed = True
+            validation = validator.finish()
+
+        # 3. 완료된 응답 검증 및 포맷팅
+        generated_text = "".join(chunks)
+        if validation is None:
+            is_valid = self._validate_response(generated_text, query)
+        else:
+            is_valid = not stream_failed and validation.verdict == Verdict.ACCEPTED
+        if is_valid:
+            final_response = self._format_response(generated_text)
+        else:
+            if validation is not None and not stream_failed:
+                llm_telemetry.record_validation_failure(
+                    "stream_response", settings.GPT_MODEL, company_id, reason=validation.reason
+                )
+            final_response = self._generate_fallback_response(query)
+
+        if packed_context and memory.is_empty and not stream_failed:
+            self._store_cache(company_id, cache_key, query, final_response, packed_context)
+
+        # 4. 채팅 이력과 참조 문서 저장 및 대화 요약 갱신 예약
+        if cached:
+            reference_scores = cached.references
+        else:
+            reference_scores = self._reference_scores(query, final_response, packed_context)
+        chat = await self._save_chat(
+            db,
+            company_id,
+            session_id,
+            query,
+            final_response,
+            reference_scores
+        )
 
-        except Exception as e:
-            logger.error(f"Critical error in GPT response generation: {str(e)}")
-            return self._generate_fallback_response(query)
+        data = {
+            "chat_id": chat.id,
+            "response": final_response,
+            "is_valid": is_valid,
+            "references": [
+                {"document_id": reference.document_id, "relevance_score": reference.relevance_score}
+                for reference in chat.references
+            ]
+        }
+        if stream_failed:
+            yield StreamEvent(event="error", data={"detail": "응답 생성 중 오류가 발생했습니다", **data})
+        else:
+            yield StreamEvent(event="done", data=data)
 
     def _validate_response(self, response: str, query: str) -> bool:
         """
         생성된 응답의 유효성 검증
         """
-        if not response or len(response.strip()) < 50:
+        if not response:
             return False
-
-        # 필수 키워드 포함 여부 확인
-        required_keywords = {
-            "진출시장": ["시장", "규모", "성장"],
-            "선정사유": ["시장", "제품", "경쟁력"],
-        }
-
-        for key, keywords in required_keywords.items():
-            if key in query:
-                if not all(keyword in response for keyword in keywords):
-                    return False
-
-        return True
+        validator = StreamingValidator(query)
+        validator.feed(response)
+        return validator.finish().verdict == Verdict.ACCEPTED
 
     def _format_response(self, response: str) -> str:
         """
@@ -236,3 +587,4 @@ class ChatService:
         """
 
 
+chat_service = ChatService(document_service)
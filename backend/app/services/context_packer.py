@@ -0,0 +1,142 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from app.models import Company, Document
+from app.utils.text_processor import count_tokens, truncate_to_tokens
+
+
+@dataclass
+class PackedPassage:
+    """컨텍스트에 포함된 문서 구간 정보"""
+    document_id: int
+    relevance_score: Optional[float]
+    token_count: int
+    truncated: bool = False
+
+
+@dataclass
+class PackedContext:
+    """토큰 예산 내에서 구성된 컨텍스트"""
+    text: str
+    token_count: int
+    passages: List[PackedPassage] = field(default_factory=list)
+
+    @property
+    def reference_scores(self) -> Dict[int, float]:
+        """ChatReference 생성용 문서 ID별 관련성 점수"""
+        return {
+            passage.document_id: passage.relevance_score
+            for passage in self.passages
+            if passage.relevance_score is not None
+        }
+
+
+class ContextPacker:
+    """회사 정보와 관련 문서를 토큰 예산에 맞춰 컨텍스트로 구성"""
+
+    def __init__(
+        self,
+        model: str,
+        max_tokens: int,
+        profile_max_tokens: int,
+        min_passage_tokens: int = 50
+    ):
+        """
+        Args:
+            model: 토큰 계산에 사용할 모델명
+            max_tokens: 컨텍스트 전체 토큰 예산
+            profile_max_tokens: 회사 정보에 할당할 최대 토큰 수
+            min_passage_tokens: 문서 구간을 포함하기 위한 최소 토큰 수
+        """
+        self.model = model
+        self.max_tokens = max_tokens
+        self.profile_max_tokens = profile_max_tokens
+        self.min_passage_tokens = min_passage_tokens
+
+    def pack(
+        self,
+        company: Company,
+        scored_documents: List[Tuple[Document, Optional[float]]]
+    ) -> PackedContext:
+        """
+        컨텍스트 구성
+
+        Args:
+            company: 회사 정보
+            scored_documents: (문서, 관련성 점수) 목록
+
+        Returns:
+            구성된 컨텍스트와 포함된 문서 구간 목록
+        """
+        # 1. 회사 정보 (별도 예산)
+        profile = truncate_to_tokens(
+            self._render_profile(company),
+            min(self.profile_max_tokens, self.max_tokens),
+            self.model
+        )
+        parts = [profile, "관련 문서 정보:"]
+        used_tokens = count_tokens("\n".join(parts), self.model)
+
+        # 2. 관련 문서 (점수 순으로 남은 예산을 점수 비율로 배분)
+        candidates = sorted(
+            (item for item in scored_documents if item[0].content),
+            key=lambda item: item[1] if item[1] is not None else 0.0,
+            reverse=True
+        )
+        passages: List[PackedPassage] = []
+        for idx, (doc, score) in enumerate(candidates):
+            remaining = self.max_tokens - used_tokens
+            if remaining < self.min_passage_tokens:
+                break
+
+            # 아직 배정되지 않은 문서들 사이에서 점수 비율로 예산 배분
+            weights = [self._weight(s) for _, s in candidates[idx:]]
+            allocation = int(remaining * self._weight(score) / sum(weights))
+            allocation = max(allocation, self.min_passage_tokens)
+
+            # 구분자(줄바꿈) 1토큰 제외
+            passage = truncate_to_tokens(doc.content, allocation - 1, self.model)
+            passage_tokens = count_tokens(passage, self.model)
+            if not passage or passage_tokens + 1 > remaining:
+                continue
+
+            parts.append(passage)
+            used_tokens += passage_tokens + 1
+            passages.append(PackedPassage(
+                document_id=doc.id,
+                relevance_score=self._clamp(score),
+                token_count=passage_tokens,
+                truncated=passage != doc.content
+            ))
+
+        return PackedContext(
+            text="\n".join(parts),
+            token_count=used_tokens,
+            passages=passages
+        )
+
+    def _render_profile(self, company: Company) -> str:
+        """회사 정보 텍스트 생성"""
+        lines = [
+            "회사정보:",
+            f"- 회사명: {company.name}",
+            f"- 업종: {company.industry or ''}",
+            f"- 설명: {company.description or ''}",
+            f"- 수출국가: {', '.join(company.export_countries or [])}",
+            f"- 목표시장: {', '.join(company.target_markets or [])}",
+        ]
+        return "\n".join(lines)
+
+    @staticmethod
+    def _weight(score: Optional[float]) -> float:
+        # 점수가 없는 문서(검색 실패 시 기본 문서)는 동일 가중치
+        if score is None:
+            return 1.0
+        return max(score, 1e-3)
+
+    @staticmethod
+    def _clamp(score: Optional[float]) -> Optional[float]:
+        # ChatReference.relevance_score는 0~1 범위
+        if score is None:
+            return None
+        return max(0.0, min(1.0, score))
@@ -0,0 +1,195 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from weakref import WeakValueDictionary
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, pin_primary
+from app.crud.chat import chat_history, chat_session
+from app.models import ChatHistory
+from app.services.llm_gateway import llm_gateway
+from app.utils.text_processor import truncate_to_tokens
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ConversationMemory:
+    """프롬프트에 포함할 대화 메모리 (누적 요약 + 최근 대화 원문)"""
+    summary: Optional[str] = None
+    turns: List[Tuple[str, str]] = field(default_factory=list)  # (질문, 응답)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.summary and not self.turns
+
+    @classmethod
+    def build(
+        cls,
+        summary: Optional[str],
+        turns: Sequence[ChatHistory],
+        model: str,
+        turn_max_tokens: int
+    ) -> "ConversationMemory":
+        """대화 이력으로 메모리 구성 (대화별 토큰 상한 적용)"""
+        return cls(
+            summary=summary,
+            turns=[
+                (
+                    truncate_to_tokens(turn.query, turn_max_tokens, model),
+                    truncate_to_tokens(turn.response, turn_max_tokens, model)
+                )
+                for turn in turns
+            ]
+        )
+
+    def to_messages(self) -> List[Dict[str, str]]:
+        """GPT 요청 메시지로 변환"""
+        messages: List[Dict[str, str]] = []
+        if self.summary:
+            messages.append({"role": "system", "content": f"이전 대화 요약:\n{self.summary}"})
+        for query, response in self.turns:
+            messages.append({"role": "user", "content": query})
+            messages.append({"role": "assistant", "content": response})
+        return messages
+
+
+class ConversationMemoryService:
+    """
+    대화 세션 메모리 관리
+
+    최근 CHAT_MEMORY_TURNS개의 대화는 원문 그대로 유지하고,
+    그보다 오래된 대화는 세션의 누적 요약에 점진적으로 합쳐
+    대화가 길어져도 프롬프트 크기가 일정하게 유지되도록 합니다.
+    """
+
+    def __init__(self, model: Optional[str] = None):
+        self.llm = llm_gateway
+        self.model = model or settings.GPT_MODEL
+        # 세션별 요약 갱신 lock (사용 중인 코루틴이 없으면 자동으로 제거되어 세션 수만큼 쌓이지 않음)
+        self._locks: "WeakValueDictionary[int, asyncio.Lock]" = WeakValueDictionary()
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, db: AsyncSession, session_id: int) -> ConversationMemory:
+        """세션의 대화 메모리 조회"""
+        session = await chat_session.get(db, id=session_id)
+        if not session:
+            return ConversationMemory()
+
+        turns = await chat_history.get_recent_by_session(
+            db,
+            session_id=session_id,
+            limit=settings.CHAT_MEMORY_TURNS
+        )
+        # 이미 요약에 반영된 대화는 중복으로 넣지 않음
+        if session.summarized_until_id is not None:
+            turns = [turn for turn in turns if turn.id > session.summarized_until_id]
+
+        return ConversationMemory.build(
+            session.summary,
+            turns,
+            self.model,
+            settings.CHAT_MEMORY_TURN_MAX_TOKENS
+        )
+
+    async def update(self, db: AsyncSession, session_id: int) -> bool:
+        """
+        최근 대화 범위를 벗어난 대화를 누적 요약에 반영
+
+        Returns:
+            요약 갱신 여부
+        """
+        lock = self._locks.get(session_id)
+        if lock is None:
+            lock = self._locks[session_id] = asyncio.Lock()
+        async with lock:
+            session = await chat_session.get(db, id=session_id)
+            if not session:
+                return False
+
+            turns = await chat_history.get_by_session_after(
+                db,
+                session_id=session_id,
+                after_id=session.summarized_until_id
+            )
+            to_fold = turns[:-settings.CHAT_MEMORY_TURNS] if settings.CHAT_MEMORY_TURNS else turns
+            if not to_fold:
+                return False
+
+            summary = await self._summarize(session.summary, to_fold, session.company_id)
+            await chat_session.update_summary(
+                db,
+                session=session,
+                summary=summary,
+                summarized_until_id=to_fold[-1].id
+            )
+            return True
+
+    def schedule_update(self, session_id: int) -> None:
+        """응답 지연 없이 백그라운드에서 요약 갱신"""
+        task = asyncio.create_task(self._update_in_background(session_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _update_in_background(self, session_id: int) -> None:
+        try:
+            async with AsyncSessionLocal() as db:
+                # 요약 상태(summary/summarized_until_id)를 복제 지연 없이 읽어야 중복 요약되지 않음
+                pin_primary(db)
+                await self.update(db, session_id)
+        except Exception as e:
+            # 실패한 대화는 다음 갱신 때 다시 요약됨
+            logger.error(f"Error updating conversation summary for session {session_id}: {str(e)}")
+
+    async def _summarize(
+        self,
+        previous_summary: Optional[str],
+        turns: Sequence[ChatHistory],
+        company_id: int
+    ) -> str:
+        """기존 요약과 새 대화를 합쳐 갱신된 요약 생성"""
+        memory = ConversationMemory.build(
+            None,
+            turns,
+            self.model,
+            settings.CHAT_MEMORY_TURN_MAX_TOKENS
+        )
+        conversation = "\n\n".join(
+            f"사용자: {query}\n답변: {response}" for query, response in memory.turns
+        )
+        prompt = f"""
+        기존 대화 요약과 새 대화를 합쳐 하나의 요약으로 갱신해주세요.
+        회사 정보, 검토한 시장과 제품, 사용자가 결정하거나 요청한 사항을 중심으로
+        {settings.CHAT_MEMORY_SUMMARY_MAX_TOKENS} 토큰 이내로 작성하세요.
+
+        기존 요약:
+        {previous_summary or "(없음)"}
+
+        새 대화:
+        {conversation}
+        """
+
+        response = await self.llm.chat_completion(
+            model=self.model,
+            messages=[
+                {"role": "system",
+                 "content": "You summarize business consulting conversations in Korean."},
+                {"role": "user", "content": prompt}
+            ],
+            call_site="conversation_summary",
+            company_id=company_id,
+            temperature=0.3,
+            max_tokens=settings.CHAT_MEMORY_SUMMARY_MAX_TOKENS
+        )
+        return truncate_to_tokens(
+            response.choices[0].message.content.strip(),
+            settings.CHAT_MEMORY_SUMMARY_MAX_TOKENS,
+            self.model
+        )
+
+
+conversation_memory = ConversationMemoryService()
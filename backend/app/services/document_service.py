@@ -1,23 +1,22 @@
-from idlelib.iomenu import encoding
-from typing import TypedDict, List, Optional, Dict, Any
+from typing import TypedDict, List, Optional, Dict, Any, Tuple
 import os
 from fastapi import HTTPException, UploadFile, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
-import PyPDF2
-from docx import Document as DocxDocument
-import magic
 import asyncio
 from functools import partial
 import json
-from openai import AsyncOpenAI
 
 from app.core.config import settings
+from app.core.database import use_replica
 from app.crud import crud_document, crud_section, crud_company
 from app.models.document import DocumentType
 from app.models.section import SectionType
-from app.schemas.document import DocumentCreate, Document
+from app.models import Document
+from app.schemas.document import DocumentCreate
 from app.schemas.section import SectionCreate
+from app.services.llm_gateway import llm_gateway
+from app.utils.singleflight import SingleFlight, make_key
 
 import logging
 
@@ -25,6 +24,21 @@ import logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# 문서 임베딩 모델
+EMBEDDING_MODEL = "text-embedding-ada-002"
+
+
+def _detect_mime_type(file_path: str) -> str:
+    """
+    파일 MIME 타입 감지
+
+    libmagic과 magic 데이터베이스는 로딩 비용이 있어 첫 파일 검사 시점에 로드합니다.
+    (PyPDF2, python-docx도 같은 이유로 사용하는 메서드 안에서 import)
+    """
+    import magic
+
+    return magic.from_file(file_path, mime=True)
+
 
 class SectionData(TypedDict):
     type: SectionType
@@ -41,7 +55,8 @@ class DocumentService:
             'application/vnd.openxmlformats-officedocument.wordprocessingml.document': 'docx',
             'text/plain': 'txt'
         }
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        self.llm = llm_gateway
+        self._embedding_flight = SingleFlight()
 
     async def _extract_from_pdf(self, file_path: str) -> str:
         """
@@ -59,6 +74,8 @@ class DocumentService:
 
     def _extract_from_pdf_sync(self, file_path: str) -> str:
         """PDF 텍스트 추출을 위한 동기 메서드"""
+        import PyPDF2
+
         text_content = []
         with open(file_path, 'rb') as file:
             pdf_reader = PyPDF2.PdfReader(file)
@@ -80,6 +97,8 @@ class DocumentService:
 
     def _extract_from_word_sync(self, file_path: str) -> str:
         """Word 텍스트 추출을 위한 동기 메서드"""
+        from docx import Document as DocxDocument
+
         doc = DocxDocument(file_path)
         return '\n'.join([paragraph.text for paragraph in doc.paragraphs])
 
@@ -102,7 +121,7 @@ class DocumentService:
     async def extract_text_content(self, file_path: str) -> str:
         """파일 형식에 따라 적절한 텍스트 추출 메서드 호출"""
         # MIME 타입 감지
-        mime_type = magic.from_file(file_path, mime=True)
+        mime_type = _detect_mime_type(file_path)
 
         # 파일 확장자 추출
         file_ext = os.path.splitext(file_path)[1].lower()
@@ -125,9 +144,13 @@ class DocumentService:
         """파일 무결성 검사"""
         try:
             if mime_type == 'application/pdf':
+                import PyPDF2
+
                 with open(file_path, 'rb') as file:
                     PyPDF2.PdfReader(file)
             elif mime_type in ['application/msword', 'application/vnd.openxmlformats-officedocument.wordprocessingml.document']:
+                from docx import Document as DocxDocument
+
                 DocxDocument(file_path)
             elif mime_type == 'text/plain':
                 with open(file_path, 'r', encoding='utf-8') as file:
@@ -194,13 +217,14 @@ class DocumentService:
         """
 
         try:
-            response = await self.client.chat.completions.create(
+            response = await self.llm.chat_completion(
                 model=settings.GPT_MODEL,
                 messages=[
                     {"role": "system",
                      "content": "You are a document analyzer that specializes in business plans and company documents."},
                     {"role": "user", "content": prompt}
                 ],
+                call_site="analyze_content",
                 response_format={"type": "json_object"}
             )
 
@@ -318,7 +342,25 @@ class DocumentService:
         template_content: str,
         company: Any
     ) -> str:
-        """회사 정보를 바탕으로 섹션 내용 커스터마이징"""
+        """회사 정보를 바탕으로 섹션 내용 커스터마이징 (실패 시 원본 내용 반환)"""
+        try:
+            return await self.customize_section_content(template_content, company)
+        except Exception as e:
+            # GPT API 호출 실패 시 원본 내용 반환
+            return template_content
+
+    async def customize_section_content(
+        self,
+        template_content: str,
+        company: Any,
+        call_site: str = "customize_section_content"
+    ) -> str:
+        """
+        회사 정보를 바탕으로 섹션 내용 커스터마이징
+
+        Raises:
+            Exception: GPT API 호출이 실패한 경우 (배치 작업에서 재시도 대상으로 기록)
+        """
         prompt = f"""
         다음 템플릿 내용을 주어진 회사 정보에 맞게 수정해주세요:
 
@@ -334,21 +376,18 @@ class DocumentService:
         - 설명: {company.description}
         """
 
-        try:
-            response = await self.client.chat.completions.create(
-                model=settings.GPT_MODEL,
-                messages=[
-                    {"role": "system",
-                     "content": "You are an assistant that specializes in customizing business document content."},
-                    {"role": "user", "content": prompt}
-                ]
-            )
+        response = await self.llm.chat_completion(
+            model=settings.GPT_MODEL,
+            messages=[
+                {"role": "system",
+                 "content": "You are an assistant that specializes in customizing business document content."},
+                {"role": "user", "content": prompt}
+            ],
+            call_site=call_site,
+            company_id=company.id
+        )
 
-            return response.choices[0].message.content.strip()
-
-        except Exception as e:
-            # GPT API 호출 실패 시 원본 내용 반환
-            return template_content
+        return response.choices[0].message.content.strip()
 
     async def create_document_with_sections(
             self,
@@ -467,19 +506,44 @@ class DocumentService:
         query: str
     ) -> List[Document]:
         """관련 문서 검색"""
-        # 1. 회사 관련 문서
-        company_docs = await crud_document.get_by_company(db, company_id=company_id)
-
-        # 2. 학습용 문서 검색
-        training_docs = await crud_document.get_by_type(
+        scored_docs = await self.search_scored_documents(
             db,
-            doc_type=DocumentType.TRAINING_DATA
+            company_id=company_id,
+            query=query
         )
+        return [doc for doc, _ in scored_docs]
+
+    async def search_scored_documents(
+        self,
+        db: AsyncSession,
+        company_id: int,
+        query: str,
+        query_embedding: Optional[List[float]] = None
+    ) -> List[Tuple[Document, Optional[float]]]:
+        """관련 문서 검색 (관련성 점수 내림차순, 점수 포함)"""
+        # 검색 대상 문서는 복제 지연을 허용하므로 쓰기 요청(채팅)에서도 복제본에서 조회
+        with use_replica(db, allow_stale=True):
+            # 1. 회사 관련 문서
+            # 사업계획서는 섹션 내용으로 검색하므로 섹션을 함께 로딩 (문서별 lazy load 방지)
+            company_docs = await crud_document.get_by_company(
+                db,
+                company_id=company_id,
+                load="sections"
+            )
+
+            # 2. 학습용 문서 검색
+            training_docs = await crud_document.get_by_type(
+                db,
+                doc_type=DocumentType.TRAINING_DATA,
+                load="sections"
+            )
 
         # 3. 연관성 점수 계산 및 필터링
-        relevant_docs = self._filter_relevant_documents(
+        relevant_docs = await self._filter_relevant_documents(
             query,
-            company_docs + training_docs
+            company_docs + training_docs,
+            query_embedding=query_embedding,
+            company_id=company_id
         )
 
         return relevant_docs
@@ -489,23 +553,28 @@ class DocumentService:
         query: str,
         documents: List[Document],
         threshold: float = 0.2, # 최소 연관성 점수
-        max_documents: int = 5  # 최대 반환 문서 수
-    ) -> List[Document]:
+        max_documents: int = 5,  # 최대 반환 문서 수
+        query_embedding: Optional[List[float]] = None,
+        company_id: Optional[int] = None
+    ) -> List[Tuple[Document, Optional[float]]]:
         """
-        검색어와 문서들의 연관성을 평가하여 가장 관련성 높은 문서들을 반환
+        검색어와 문서들의 연관성을 평가하여 가장 관련성 높은 문서들을 점수와 함께 반환
 
         Args:
              query: 검색어 또는 사용자 질문
              documents: 검색 대상 문서 리스트
              threshold: 최소 연관성 점수 (0~1)
              max_documents: 최대 반환 문서 수
+             query_embedding: 미리 계산된 검색어 임베딩 (없으면 새로 계산)
+             company_id: 임베딩 사용량을 집계할 회사 ID
 
         Returns:
-            관련성 높은 문서 리스트
+            (문서, 관련성 점수) 리스트 (점수를 계산하지 못한 경우 None)
         """
         try:
             # 1. GPT 임베딩을 사용하여 검색어 벡터화
-            query_embedding = await self._get_embedding(query)
+            if query_embedding is None:
+                query_embedding = await self._get_embedding(query, company_id=company_id)
 
             # 2. 각 문서의 연관성 점수 계산
             scored_documents = []
@@ -514,7 +583,7 @@ class DocumentService:
                 doc_content = self._extract_searchable_content(doc)
 
                 # 2.2 문서 내용 임베딩
-                doc_embedding = await self._get_embedding(doc_content)
+                doc_embedding = await self._get_embedding(doc_content, company_id=company_id)
 
                 # 2.3 코사인 유사도 계산
                 similarity = self._calculate_cosine_similarity(
@@ -533,19 +602,28 @@ class DocumentService:
 
             # 3. 점수순 정렬 및 상위 문서 선택
             scored_documents.sort(key=lambda x: x[1], reverse=True)
-            return [doc for doc, score in scored_documents[:max_documents]]
+            return scored_documents[:max_documents]
 
         except Exception as e:
             logger.error(f"Error in filtering relevant documents: {str(e)}")
             # 오류 발생 시 기본 문서 반환
-            return documents[:max_documents]
+            return [(doc, None) for doc in documents[:max_documents]]
 
-    async def _get_embedding(self, text: str) -> List[float]:
-        """텍스트의 임베딩 벡터 생성"""
+    async def _get_embedding(self, text: str, company_id: Optional[int] = None) -> List[float]:
+        """텍스트의 임베딩 벡터 생성 (동일 입력의 동시 호출은 하나로 병합)"""
+        return await self._embedding_flight.do(
+            make_key(EMBEDDING_MODEL, text),
+            lambda: self._create_embedding(text, company_id)
+        )
+
+    async def _create_embedding(self, text: str, company_id: Optional[int] = None) -> List[float]:
+        """임베딩 API 호출"""
         try:
-            response = await self.client.embeddings.create(
-                model="text-embedding-ada-002",
-                input=text
+            response = await self.llm.embedding(
+                model=EMBEDDING_MODEL,
+                input=text,
+                call_site="embedding",
+                company_id=company_id
             )
             return response.data[0].embedding
 
@@ -0,0 +1,200 @@
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.metrics import (
+    FILE_REAPER_BYTES_RECLAIMED,
+    FILE_REAPER_FAILURES,
+    FILE_REAPER_FILES_REMOVED,
+)
+from app.crud import crud_document
+
+logger = logging.getLogger(__name__)
+
+DELETED_DOCUMENT = "deleted_document"
+ORPHAN = "orphan"
+
+
+@dataclass
+class ReapReport:
+    """정리 결과"""
+    documents_purged: int = 0
+    files_removed: int = 0
+    bytes_reclaimed: int = 0
+    failures: int = 0
+    orphans: List[str] = field(default_factory=list)  # dry-run에서 찾은 고아 파일
+
+    def merge(self, other: "ReapReport") -> "ReapReport":
+        self.documents_purged += other.documents_purged
+        self.files_removed += other.files_removed
+        self.bytes_reclaimed += other.bytes_reclaimed
+        self.failures += other.failures
+        self.orphans.extend(other.orphans)
+        return self
+
+
+def remove_files(paths: Iterable[str]) -> Tuple[int, int, List[str]]:
+    """
+    파일 일괄 삭제 (블로킹 - 이벤트 루프 밖에서 호출)
+
+    이미 없는 파일은 삭제된 것으로 간주합니다.
+    (삭제한 파일 수, 회수한 바이트, 삭제에 실패한 경로)를 반환합니다.
+    """
+    removed = 0
+    reclaimed = 0
+    failed = []
+    for path in paths:
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except FileNotFoundError:
+            removed += 1
+            continue
+        except OSError as e:
+            logger.warning(f"Error deleting file {path}: {str(e)}")
+            failed.append(path)
+            continue
+        removed += 1
+        reclaimed += size
+    return removed, reclaimed, failed
+
+
+def scan_upload_dir(root: str, older_than: float) -> Dict[str, int]:
+    """
+    업로드 디렉토리의 파일 목록 (블로킹 - 이벤트 루프 밖에서 호출)
+
+    업로드 중인 파일을 건드리지 않도록 수정 시각이 older_than 이전인 파일만
+    {절대 경로: 크기}로 반환합니다.
+    """
+    files = {}
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.abspath(os.path.join(dirpath, filename))
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if stat.st_mtime < older_than:
+                files[path] = stat.st_size
+    return files
+
+
+class FileReaper:
+    """
+    업로드 파일 정리 작업
+
+    - 삭제 문서(deleted_at 설정): 파일을 지운 뒤 행을 영구 삭제.
+      파일 삭제에 실패한 문서는 남겨두고 다음 실행에서 다시 시도
+    - 고아 파일: UPLOAD_DIR에 있지만 어떤 문서도 참조하지 않는 파일
+      (파일 교체로 대체된 이전 파일, DB 저장에 실패한 업로드 등)
+
+    파일 시스템 작업은 asyncio.to_thread로 이벤트 루프 밖에서 batch_size 단위로 수행합니다.
+    """
+
+    def __init__(
+        self,
+        upload_dir: str,
+        *,
+        batch_size: int,
+        orphan_grace_seconds: float,
+        session_factory: Callable = AsyncSessionLocal,
+        clock: Callable[[], float] = time.time
+    ):
+        self.upload_dir = str(upload_dir)
+        self.batch_size = batch_size
+        self.orphan_grace_seconds = orphan_grace_seconds
+        self._session_factory = session_factory
+        self._clock = clock
+
+    async def reap_deleted_documents(self) -> ReapReport:
+        """삭제 문서의 파일과 행 정리"""
+        report = ReapReport()
+        while True:
+            async with self._session_factory() as db:
+                batch = await crud_document.get_deleted_batch(db, limit=self.batch_size)
+                if not batch:
+                    break
+
+                paths = [path for _, path in batch if path]
+                removed, reclaimed, failed = await asyncio.to_thread(remove_files, paths)
+                failed = set(failed)
+                purge_ids = [id for id, path in batch if path not in failed]
+                report.documents_purged += await crud_document.purge(db, ids=purge_ids)
+                await db.commit()
+
+            report.files_removed += removed
+            report.bytes_reclaimed += reclaimed
+            report.failures += len(failed)
+            self._record(DELETED_DOCUMENT, removed, reclaimed, len(failed))
+
+            # 실패한 문서만 남은 경우 같은 배치를 반복하지 않도록 다음 실행으로 넘김
+            if len(batch) < self.batch_size or not purge_ids:
+                break
+        return report
+
+    async def reap_orphan_files(self, dry_run: bool = False) -> ReapReport:
+        """UPLOAD_DIR과 Document.file_path를 대조해 참조되지 않는 파일 정리"""
+        report = ReapReport()
+        cutoff = self._clock() - self.orphan_grace_seconds
+        candidates = await asyncio.to_thread(scan_upload_dir, self.upload_dir, cutoff)
+        if not candidates:
+            return report
+
+        # 디렉토리 조회 후에 참조 목록을 읽어야 그 사이 생성된 문서의 파일을 지우지 않음
+        async with self._session_factory() as db:
+            referenced = await crud_document.get_file_paths(db)
+        referenced = {os.path.abspath(path) for path in referenced}
+        orphans = sorted(path for path in candidates if path not in referenced)
+
+        if dry_run:
+            report.orphans = orphans
+            report.bytes_reclaimed = sum(candidates[path] for path in orphans)
+            return report
+
+        for start in range(0, len(orphans), self.batch_size):
+            batch = orphans[start:start + self.batch_size]
+            removed, reclaimed, failed = await asyncio.to_thread(remove_files, batch)
+            report.files_removed += removed
+            report.bytes_reclaimed += reclaimed
+            report.failures += len(failed)
+            self._record(ORPHAN, removed, reclaimed, len(failed))
+        return report
+
+    async def run_once(self) -> ReapReport:
+        """삭제 문서와 고아 파일을 한 번 정리"""
+        report = await self.reap_deleted_documents()
+        report.merge(await self.reap_orphan_files())
+        if report.files_removed or report.documents_purged or report.failures:
+            logger.info(
+                f"File reaper purged {report.documents_purged} documents, "
+                f"removed {report.files_removed} files, reclaimed {report.bytes_reclaimed} bytes "
+                f"({report.failures} failures)"
+            )
+        return report
+
+    async def run(self, interval: float) -> None:
+        """주기적으로 정리 (백그라운드 태스크)"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Error running file reaper: {str(e)}")
+
+    @staticmethod
+    def _record(kind: str, removed: int, reclaimed: int, failures: int) -> None:
+        FILE_REAPER_FILES_REMOVED.labels(kind=kind).inc(removed)
+        FILE_REAPER_BYTES_RECLAIMED.labels(kind=kind).inc(reclaimed)
+        FILE_REAPER_FAILURES.labels(kind=kind).inc(failures)
+
+
+file_reaper = FileReaper(
+    settings.UPLOAD_DIR,
+    batch_size=settings.FILE_REAPER_BATCH_SIZE,
+    orphan_grace_seconds=settings.FILE_REAPER_ORPHAN_GRACE_SECONDS
+)
@@ -0,0 +1,155 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+# 세션에서 쓰기가 발생한 테이블 (커밋 시 해당 테이블에 의존하는 캐시 항목 제거)
+WRITTEN_TABLES_KEY = "list_cache_written_tables"
+
+
+def make_etag(*parts: Any) -> str:
+    """구성 요소로 약한 ETag 생성"""
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest}"'
+
+
+@dataclass
+class CachedList:
+    """직렬화된 목록 응답"""
+    body: bytes
+    etag: str
+    tables: FrozenSet[str]
+    created_at: float
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class ListCache:
+    """
+    목록 응답 캐시 (프로세스 메모리, 짧은 TTL)
+
+    요청 경로+쿼리를 키로 직렬화된 본문과 ETag를 보관합니다.
+    각 항목은 조회에 사용한 테이블을 기록하고, 이 프로세스에서 해당 테이블에 대한
+    쓰기가 커밋되면 즉시 제거됩니다. 다른 워커의 쓰기는 TTL이 지나야 반영됩니다.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._clock = clock
+        self._entries: "OrderedDict[str, CachedList]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Optional[CachedList]:
+        """캐시된 목록 응답 조회 (만료 항목은 제거)"""
+        entry = self._entries.get(key)
+        if entry is not None and self._clock() - entry.created_at > self.ttl_seconds:
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def store(
+        self,
+        key: str,
+        body: bytes,
+        tables: Iterable[str],
+        headers: Optional[Dict[str, str]] = None
+    ) -> CachedList:
+        """목록 응답 저장 (비활성화된 경우 저장하지 않고 항목만 반환)"""
+        entry = CachedList(
+            body=body,
+            etag=make_etag(hashlib.sha1(body).hexdigest()),
+            tables=frozenset(tables),
+            created_at=self._clock(),
+            headers=dict(headers or {})
+        )
+        if self.enabled:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate_tables(self, tables: Iterable[str]) -> None:
+        """테이블에 의존하는 항목 제거"""
+        tables = set(tables)
+        stale = [key for key, entry in self._entries.items() if entry.tables & tables]
+        for key in stale:
+            del self._entries[key]
+        self.invalidations += len(stale)
+
+    def clear(self) -> None:
+        """전체 캐시 삭제"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중률 통계"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations
+        }
+
+
+list_cache = ListCache(
+    ttl_seconds=settings.LIST_CACHE_TTL_SECONDS,
+    max_entries=settings.LIST_CACHE_MAX_ENTRIES,
+    enabled=settings.LIST_CACHE_ENABLED
+)
+
+
+def _written_tables(session: Session) -> set:
+    return session.info.setdefault(WRITTEN_TABLES_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flushed_tables(session: Session, flush_context) -> None:
+    """flush된 객체의 테이블 기록 (after_flush 시점에는 new/dirty/deleted가 flush 전 상태)"""
+    tables = _written_tables(session)
+    for obj in chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__table__", None)
+        if table is not None:
+            tables.add(table.name)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_bulk_tables(orm_execute_state) -> None:
+    """세션으로 실행한 INSERT/UPDATE/DELETE 문의 테이블 기록 (일괄 순서 변경 등)"""
+    statement = orm_execute_state.statement
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        _written_tables(orm_execute_state.session).add(statement.table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_tables(session: Session) -> None:
+    tables = session.info.pop(WRITTEN_TABLES_KEY, None)
+    if tables:
+        list_cache.invalidate_tables(tables)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_rolled_back_tables(session: Session, previous_transaction) -> None:
+    session.info.pop(WRITTEN_TABLES_KEY, None)
@@ -0,0 +1,429 @@
+import asyncio
+import random
+import time
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+from app.core.metrics import (
+    CIRCUIT_STATE_VALUES,
+    LLM_CIRCUIT_REJECTED,
+    LLM_CIRCUIT_STATE,
+    LLM_CIRCUIT_TRIPS
+)
+from app.services.llm_telemetry import LLMCallRecord, llm_telemetry
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from app.utils.rate_limiter import TokenBucket
+from app.utils.text_processor import count_tokens
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+class _EstimatedUsage(NamedTuple):
+    """사용량 정보 없이 종료된 스트림의 추정 사용량"""
+    prompt_tokens: int
+    completion_tokens: int
+
+
+@lru_cache(maxsize=None)
+def retryable_errors() -> Tuple[type, ...]:
+    """
+    재시도 대상 예외 (레이트 리밋, 네트워크 오류, 서버 오류)
+
+    openai SDK는 import 비용이 커서 첫 호출 시점에 로드합니다.
+    """
+    import openai
+
+    return (
+        openai.RateLimitError,
+        openai.APIConnectionError,
+        openai.APITimeoutError,
+        openai.InternalServerError,
+    )
+
+
+class LLMGateway:
+    """
+    애플리케이션 전역 OpenAI 호출 게이트웨이
+
+    - 하나의 httpx 커넥션 풀을 모든 서비스가 공유
+    - 모델별 요청 수(RPM)/토큰 수(TPM) 토큰 버킷으로 호출 속도 제한
+    - 재시도 가능한 오류는 지수 백오프 + 지터로 재시도 (Retry-After 헤더 우선)
+    - 모델별 서킷 브레이커로 업스트림 장애 시 호출을 즉시 거부
+    """
+
+    def __init__(self):
+        # HTTP 커넥션 풀과 SDK 클라이언트는 첫 LLM 호출 시 생성
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._client = None
+        self._limiters: Dict[str, Tuple[TokenBucket, TokenBucket]] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """공유 HTTP 커넥션 풀 (첫 사용 시 생성)"""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.LLM_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY
+                ),
+                timeout=httpx.Timeout(settings.LLM_TIMEOUT_SECONDS, connect=10.0)
+            )
+        return self._http_client
+
+    @property
+    def client(self):
+        """OpenAI SDK 클라이언트 (첫 사용 시 생성)"""
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            # 재시도는 게이트웨이에서 처리하므로 SDK 자체 재시도는 비활성화
+            self._client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY,
+                http_client=self.http_client,
+                max_retries=0
+            )
+        return self._client
+
+    def _get_limiters(self, model: str) -> Tuple[TokenBucket, TokenBucket]:
+        """모델별 (요청, 토큰) 버킷 조회"""
+        if model not in self._limiters:
+            limits = settings.LLM_RATE_LIMITS.get(model, {})
+            self._limiters[model] = (
+                TokenBucket(limits.get("rpm", settings.LLM_DEFAULT_RPM)),
+                TokenBucket(limits.get("tpm", settings.LLM_DEFAULT_TPM))
+            )
+        return self._limiters[model]
+
+    def get_breaker(self, model: str) -> CircuitBreaker:
+        """모델별 서킷 브레이커 조회"""
+        if model not in self._breakers:
+            self._breakers[model] = CircuitBreaker(
+                name=model,
+                failure_threshold=settings.LLM_CIRCUIT_FAILURE_THRESHOLD,
+                recovery_timeout=settings.LLM_CIRCUIT_RECOVERY_SECONDS,
+                half_open_max_calls=settings.LLM_CIRCUIT_HALF_OPEN_MAX_CALLS,
+                on_state_change=_record_circuit_state
+            )
+            LLM_CIRCUIT_STATE.labels(model=model).set(CIRCUIT_STATE_VALUES["closed"])
+        return self._breakers[model]
+
+    def is_available(self, model: str) -> bool:
+        """모델 호출 가능 여부 (서킷이 열려 있으면 False)"""
+        return self.get_breaker(model).is_available()
+
+    async def chat_completion(
+        self,
+        *,
+        model: str,
+        messages: List[Dict[str, str]],
+        call_site: str,
+        company_id: Optional[int] = None,
+        **params: Any
+    ):
+        """채팅 완성 요청"""
+        estimated_tokens = self._estimate_chat_tokens(model, messages, params)
+        started_at = time.monotonic()
+        retries = 0
+        usage = None
+        try:
+            response, retries = await self._call(
+                model,
+                estimated_tokens,
+                lambda: self.client.chat.completions.create(model=model, messages=messages, **params)
+            )
+            usage = response.usage
+            self._refund_unused(model, estimated_tokens, usage)
+            return response
+        except BaseException as e:
+            retries = getattr(e, "llm_retries", retries)
+            raise
+        finally:
+            self._record(call_site, model, company_id, started_at, usage, retries)
+
+    async def stream_chat_completion(
+        self,
+        *,
+        model: str,
+        messages: List[Dict[str, str]],
+        call_site: str,
+        company_id: Optional[int] = None,
+        **params: Any
+    ) -> AsyncIterator[Any]:
+        """
+        채팅 완성 스트리밍 요청 (스트림 연결까지만 재시도)
+
+        Returns:
+            응답 청크 비동기 이터레이터 (첫 토큰 도착 시간과 사용량을 계측)
+        """
+        estimated_tokens = self._estimate_chat_tokens(model, messages, params)
+        prompt_tokens = estimated_tokens - params.get("max_tokens", 0)
+        started_at = time.monotonic()
+        try:
+            stream, retries = await self._call(
+                model,
+                estimated_tokens,
+                lambda: self.client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    stream=True,
+                    stream_options={"include_usage": True},
+                    **params
+                ),
+                defer_success=True
+            )
+        except BaseException as e:
+            self._record(call_site, model, company_id, started_at, None, getattr(e, "llm_retries", 0))
+            raise
+        return self._instrument_stream(
+            stream, call_site, model, company_id, started_at, retries, prompt_tokens, estimated_tokens
+        )
+
+    async def _instrument_stream(
+        self,
+        stream,
+        call_site: str,
+        model: str,
+        company_id: Optional[int],
+        started_at: float,
+        retries: int,
+        prompt_tokens: int,
+        estimated_tokens: int
+    ) -> AsyncIterator[Any]:
+        """
+        스트림 청크를 전달하면서 첫 토큰 시간과 최종 사용량 기록
+
+        호출자가 중간에 aclose()하면 업스트림 연결도 닫아 남은 토큰 생성을 중단하고,
+        사용량은 수신한 텍스트로 추정합니다. 종료 시 사용하지 않은 토큰은 버킷에 반환합니다.
+        서킷 브레이커에는 연결 시점이 아니라 스트림이 끝난 시점의 결과를 기록합니다.
+        """
+        breaker = self.get_breaker(model)
+        time_to_first_token = None
+        usage = None
+        success = False
+        received: List[str] = []
+        try:
+            async for chunk in stream:
+                if time_to_first_token is None and chunk.choices:
+                    time_to_first_token = time.monotonic() - started_at
+                if getattr(chunk, "usage", None):
+                    usage = chunk.usage
+                if chunk.choices and chunk.choices[0].delta.content:
+                    received.append(chunk.choices[0].delta.content)
+                yield chunk
+            success = True
+            breaker.record_success()
+        except GeneratorExit:
+            # 호출자가 의도적으로 중단한 경우는 업스트림 오류가 아님
+            success = True
+            breaker.record_success()
+            raise
+        except asyncio.CancelledError:
+            breaker.record_cancelled()
+            raise
+        except Exception:
+            # 연결 이후 끊김/타임아웃 등 스트림 도중 오류도 서킷 브레이커에 반영
+            breaker.record_failure()
+            raise
+        finally:
+            await stream.close()
+            if usage is None:
+                usage = _EstimatedUsage(
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=count_tokens("".join(received), model)
+                )
+            self._refund_unused(model, estimated_tokens, usage)
+            self._record(
+                call_site, model, company_id, started_at, usage, retries,
+                success=success,
+                time_to_first_token=time_to_first_token
+            )
+
+    async def embedding(
+        self,
+        *,
+        model: str,
+        input: str,
+        call_site: str,
+        company_id: Optional[int] = None
+    ):
+        """임베딩 요청"""
+        estimated_tokens = count_tokens(input, model)
+        started_at = time.monotonic()
+        retries = 0
+        usage = None
+        try:
+            response, retries = await self._call(
+                model,
+                estimated_tokens,
+                lambda: self.client.embeddings.create(model=model, input=input)
+            )
+            usage = response.usage
+            return response
+        except BaseException as e:
+            retries = getattr(e, "llm_retries", retries)
+            raise
+        finally:
+            self._record(call_site, model, company_id, started_at, usage, retries)
+
+    @staticmethod
+    def _record(
+        call_site: str,
+        model: str,
+        company_id: Optional[int],
+        started_at: float,
+        usage,
+        retries: int,
+        success: Optional[bool] = None,
+        time_to_first_token: Optional[float] = None
+    ) -> None:
+        """호출 계측값 기록 (사용량이 없으면 실패로 간주)"""
+        llm_telemetry.record_call(LLMCallRecord(
+            call_site=call_site,
+            model=model,
+            company_id=company_id,
+            duration=time.monotonic() - started_at,
+            success=success if success is not None else usage is not None,
+            retries=retries,
+            prompt_tokens=getattr(usage, "prompt_tokens", 0) or 0,
+            completion_tokens=getattr(usage, "completion_tokens", 0) or 0,
+            time_to_first_token=time_to_first_token
+        ))
+
+    async def _call(
+        self,
+        model: str,
+        estimated_tokens: int,
+        request,
+        defer_success: bool = False
+    ) -> Tuple[Any, int]:
+        """
+        서킷 브레이커와 레이트 리밋 적용 후 재시도 정책에 따라 요청 실행
+
+        defer_success=True이면 응답을 받아도 성공을 기록하지 않습니다
+        (스트리밍처럼 응답이 끝나야 성공 여부를 알 수 있는 경우 호출자가 기록).
+
+        Returns:
+            (응답, 재시도 횟수)
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있는 경우 (재시도 중 열린 경우 포함)
+            (발생한 예외의 llm_retries 속성에 그때까지의 재시도 횟수를 남김)
+        """
+        request_bucket, token_bucket = self._get_limiters(model)
+        breaker = self.get_breaker(model)
+
+        attempt = 0
+        try:
+            for attempt in range(settings.LLM_MAX_RETRIES + 1):
+                try:
+                    breaker.before_call()
+                except CircuitOpenError:
+                    LLM_CIRCUIT_REJECTED.labels(model=model).inc()
+                    raise
+
+                # 레이트 리밋 대기 중 취소(클라이언트 연결 종료 등)되어도 시험 호출 슬롯을 반환하도록 try 안에서 대기
+                try:
+                    await request_bucket.acquire(1)
+                    await token_bucket.acquire(estimated_tokens)
+                    response = await request()
+                except retryable_errors() as e:
+                    breaker.record_failure()
+                    if attempt >= settings.LLM_MAX_RETRIES:
+                        raise
+                    delay = self._retry_delay(attempt, e)
+                    logger.warning(
+                        f"LLM call to {model} failed ({type(e).__name__}), "
+                        f"retrying in {delay:.2f}s (attempt {attempt + 1})"
+                    )
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    breaker.record_cancelled()
+                    raise
+                except Exception:
+                    # 요청 오류(4xx 등)는 업스트림 장애가 아니므로 성공으로 간주
+                    breaker.record_success()
+                    raise
+                else:
+                    if not defer_success:
+                        breaker.record_success()
+                    return response, attempt
+        except BaseException as e:
+            # 실패한 호출도 재시도 횟수를 기록할 수 있도록 예외에 남김
+            e.llm_retries = attempt
+            raise
+
+    @staticmethod
+    def _retry_delay(attempt: int, error: Exception) -> float:
+        """
+        재시도 대기 시간 계산
+
+        Retry-After(-ms) 헤더가 있으면 그 값을 따르고,
+        없으면 지수 백오프에 full jitter를 적용합니다.
+        """
+        response = getattr(error, "response", None)
+        headers = response.headers if response is not None else {}
+
+        retry_after = _parse_retry_after(headers)
+        if retry_after is not None:
+            return min(retry_after, settings.LLM_BACKOFF_MAX_SECONDS)
+
+        backoff = min(
+            settings.LLM_BACKOFF_MAX_SECONDS,
+            settings.LLM_BACKOFF_BASE_SECONDS * (2 ** attempt)
+        )
+        return random.uniform(0, backoff)
+
+    @staticmethod
+    def _estimate_chat_tokens(
+        model: str,
+        messages: List[Dict[str, str]],
+        params: Dict[str, Any]
+    ) -> int:
+        """요청 토큰 추정 (프롬프트 + 최대 응답 토큰)"""
+        prompt_tokens = sum(count_tokens(message["content"], model) + 4 for message in messages)
+        return prompt_tokens + params.get("max_tokens", 0)
+
+    def _refund_unused(self, model: str, estimated_tokens: int, usage) -> None:
+        """실제 사용량이 추정보다 적으면 토큰 버킷에 반환"""
+        if usage is None:
+            return
+        used = (usage.prompt_tokens or 0) + (getattr(usage, "completion_tokens", 0) or 0)
+        _, token_bucket = self._get_limiters(model)
+        token_bucket.refund(estimated_tokens - used)
+
+    async def aclose(self) -> None:
+        """커넥션 풀 종료 (생성된 경우에만)"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+            self._client = None
+
+
+def _record_circuit_state(breaker: CircuitBreaker, state: CircuitState) -> None:
+    """서킷 상태 변경을 메트릭에 기록"""
+    LLM_CIRCUIT_STATE.labels(model=breaker.name).set(CIRCUIT_STATE_VALUES[state.value])
+    if state == CircuitState.OPEN:
+        LLM_CIRCUIT_TRIPS.labels(model=breaker.name).inc()
+        logger.warning(f"LLM circuit for {breaker.name} opened")
+
+
+def _parse_retry_after(headers) -> Optional[float]:
+    """Retry-After / retry-after-ms 헤더를 초 단위로 변환"""
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        # HTTP-date 형식 등은 무시하고 백오프 사용
+        return None
+    return None
+
+
+llm_gateway = LLMGateway()
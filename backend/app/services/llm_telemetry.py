@@ -0,0 +1,183 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.metrics import (
+    LLM_CALL_DURATION,
+    LLM_ESTIMATED_COST,
+    LLM_RETRIES,
+    LLM_TIME_TO_FIRST_TOKEN,
+    LLM_TOKENS,
+    LLM_VALIDATION_FAILURES
+)
+from app.crud.llm_usage import COUNTER_COLUMNS, llm_usage
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LLMCallRecord:
+    """LLM 호출 1건의 측정값"""
+    call_site: str
+    model: str
+    company_id: Optional[int]
+    duration: float
+    success: bool
+    retries: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    time_to_first_token: Optional[float] = None
+
+
+def estimate_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """모델 가격표로 호출 비용 추정 (USD)"""
+    pricing = settings.LLM_PRICING.get(model)
+    if not pricing:
+        return 0.0
+    return (
+        prompt_tokens * pricing.get("prompt", 0.0)
+        + completion_tokens * pricing.get("completion", 0.0)
+    ) / 1000
+
+
+class LLMTelemetry:
+    """
+    LLM 호출 계측
+
+    호출 위치/모델 단위 지표는 Prometheus로 즉시 기록하고,
+    회사별 사용량은 메모리에 누적했다가 주기적으로 llm_usages 테이블에 반영합니다.
+    """
+
+    def __init__(self):
+        self._pending: Dict[Tuple[int, date, str, str], Dict[str, float]] = {}
+        self._flush_lock = asyncio.Lock()
+
+    def record_call(self, record: LLMCallRecord) -> None:
+        """호출 측정값 기록"""
+        labels = {"call_site": record.call_site, "model": record.model}
+        cost = estimate_cost(record.model, record.prompt_tokens, record.completion_tokens)
+
+        LLM_CALL_DURATION.labels(
+            outcome="success" if record.success else "error",
+            **labels
+        ).observe(record.duration)
+        if record.time_to_first_token is not None:
+            LLM_TIME_TO_FIRST_TOKEN.labels(**labels).observe(record.time_to_first_token)
+        if record.retries:
+            LLM_RETRIES.labels(**labels).inc(record.retries)
+        LLM_TOKENS.labels(kind="prompt", **labels).inc(record.prompt_tokens)
+        LLM_TOKENS.labels(kind="completion", **labels).inc(record.completion_tokens)
+        LLM_ESTIMATED_COST.labels(**labels).inc(cost)
+
+        self._accumulate(
+            record.company_id,
+            record.call_site,
+            record.model,
+            call_count=1,
+            error_count=0 if record.success else 1,
+            retry_count=record.retries,
+            prompt_tokens=record.prompt_tokens,
+            completion_tokens=record.completion_tokens,
+            total_duration_ms=int(record.duration * 1000),
+            estimated_cost=cost
+        )
+
+    def record_validation_failure(
+        self,
+        call_site: str,
+        model: str,
+        company_id: Optional[int] = None,
+        reason: str = "invalid"
+    ) -> None:
+        """생성 결과 검증 실패 기록"""
+        LLM_VALIDATION_FAILURES.labels(call_site=call_site, model=model, reason=reason).inc()
+        self._accumulate(company_id, call_site, model, validation_failure_count=1)
+
+    def _accumulate(
+        self,
+        company_id: Optional[int],
+        call_site: str,
+        model: str,
+        **counters: float
+    ) -> None:
+        # 회사가 지정되지 않은 호출은 Prometheus 지표에만 반영
+        if company_id is None:
+            return
+        key = (company_id, date.today(), call_site, model)
+        totals = self._pending.setdefault(key, dict.fromkeys(COUNTER_COLUMNS, 0))
+        for column, value in counters.items():
+            totals[column] += value
+
+    async def flush(self) -> int:
+        """누적된 회사별 사용량을 DB에 반영
+
+        삭제된 회사의 집계는 버리고, 일시적인 오류로 실패하면 다음 주기에 다시 시도합니다.
+
+        Returns:
+            반영된 집계 행 수
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+            pending, self._pending = self._pending, {}
+
+            now = datetime.utcnow()
+            rows: List[Dict[str, Any]] = [
+                {
+                    "company_id": company_id,
+                    "day": day,
+                    "call_site": call_site,
+                    "model": model,
+                    "created_at": now,
+                    "updated_at": now,
+                    **{column: int(value) if column != "estimated_cost" else value
+                       for column, value in totals.items()}
+                }
+                for (company_id, day, call_site, model), totals in pending.items()
+            ]
+            try:
+                async with AsyncSessionLocal() as session:
+                    written = set(await llm_usage.increment_many(session, rows=rows))
+            except IntegrityError as e:
+                # 같은 행으로 다시 시도해도 실패하므로 복원하지 않고 버림
+                logger.error(f"Dropping LLM usage rollups {sorted(pending)}: {str(e)}")
+                return 0
+            except Exception as e:
+                logger.error(f"Error flushing LLM usage rollups: {str(e)}")
+                # 다음 주기에 다시 반영되도록 복원
+                self._restore(pending)
+                return 0
+
+            dropped = [key for key in pending if key not in written]
+            if dropped:
+                logger.warning(f"Dropped LLM usage rollups for deleted companies: {sorted(dropped)}")
+            return len(written)
+
+    def _restore(self, pending: Dict[Tuple[int, date, str, str], Dict[str, float]]) -> None:
+        """반영에 실패한 집계를 되돌림 (보관 한도를 넘으면 오래된 일자부터 버림)"""
+        for key, totals in pending.items():
+            merged = self._pending.setdefault(key, dict.fromkeys(COUNTER_COLUMNS, 0))
+            for column, value in totals.items():
+                merged[column] += value
+
+        overflow = len(self._pending) - settings.LLM_USAGE_MAX_PENDING_ROWS
+        if overflow > 0:
+            dropped = sorted(self._pending, key=lambda key: key[1])[:overflow]
+            for key in dropped:
+                del self._pending[key]
+            logger.error(f"LLM usage backlog over limit, dropped rollups {dropped}")
+
+    async def run_flusher(self) -> None:
+        """주기적으로 사용량 반영 (백그라운드 태스크)"""
+        while True:
+            await asyncio.sleep(settings.LLM_USAGE_FLUSH_SECONDS)
+            await self.flush()
+
+
+llm_telemetry = LLMTelemetry()
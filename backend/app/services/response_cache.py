@@ -0,0 +1,147 @@
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from app.core.config import settings
+
+
+class CacheKey(NamedTuple):
+    """캐시 조회 키 (컨텍스트 지문, 질문 임베딩)"""
+    context_fingerprint: str
+    embedding: List[float]
+
+
+@dataclass
+class CacheEntry:
+    """캐시된 채팅 응답"""
+    query: str
+    embedding: List[float]
+    response: str
+    context_fingerprint: str
+    saved_tokens: int
+    created_at: float
+    references: Dict[int, float] = field(default_factory=dict)  # 참조 문서 ID별 관련성 점수
+
+
+class ResponseCache:
+    """
+    회사별 유사 질문 응답 캐시 (프로세스 메모리)
+
+    (company_id, 컨텍스트 지문, 질문 임베딩)을 키로 사용합니다.
+    컨텍스트 지문이 같고 질문 임베딩의 코사인 유사도가 임계값 이상이면 캐시된 응답을 반환합니다.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float,
+        ttl_seconds: int,
+        max_entries_per_company: int
+    ):
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries_per_company = max_entries_per_company
+        self._entries: Dict[int, "OrderedDict[int, CacheEntry]"] = {}
+        self._next_key = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.saved_tokens = 0
+
+    @staticmethod
+    def fingerprint(
+        company_id: int,
+        company_updated_at: Optional[datetime],
+        document_count: int,
+        documents_updated_at: Optional[datetime]
+    ) -> str:
+        """회사 정보와 문서 변경 상태로 컨텍스트 지문 생성"""
+        raw = f"{company_id}:{company_updated_at}:{document_count}:{documents_updated_at}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def lookup(self, company_id: int, key: CacheKey) -> Optional[CacheEntry]:
+        """유사 질문에 대한 캐시된 응답 조회"""
+        entries = self._entries.get(company_id)
+        best_key, best_entry, best_similarity = None, None, self.similarity_threshold
+        now = time.monotonic()
+
+        for entry_key, entry in list((entries or {}).items()):
+            # 만료되었거나 컨텍스트가 바뀐 항목 제거
+            if now - entry.created_at > self.ttl_seconds or entry.context_fingerprint != key.context_fingerprint:
+                del entries[entry_key]
+                continue
+            similarity = _cosine_similarity(key.embedding, entry.embedding)
+            if similarity >= best_similarity:
+                best_key, best_entry, best_similarity = entry_key, entry, similarity
+
+        if best_entry is None:
+            self.misses += 1
+            return None
+
+        entries.move_to_end(best_key)
+        self.hits += 1
+        self.saved_tokens += best_entry.saved_tokens
+        return best_entry
+
+    def store(
+        self,
+        company_id: int,
+        key: CacheKey,
+        query: str,
+        response: str,
+        saved_tokens: int = 0,
+        references: Optional[Dict[int, float]] = None
+    ) -> None:
+        """응답 캐시 저장 (회사별 최대 개수 초과 시 가장 오래된 항목 제거)"""
+        entries = self._entries.setdefault(company_id, OrderedDict())
+        entries[self._next_key] = CacheEntry(
+            query=query,
+            embedding=key.embedding,
+            response=response,
+            context_fingerprint=key.context_fingerprint,
+            saved_tokens=saved_tokens,
+            created_at=time.monotonic(),
+            references=dict(references or {})
+        )
+        self._next_key += 1
+        while len(entries) > self.max_entries_per_company:
+            entries.popitem(last=False)
+
+    def invalidate_company(self, company_id: int) -> None:
+        """회사 정보 또는 문서 변경 시 해당 회사 캐시 삭제"""
+        if self._entries.pop(company_id, None):
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        """전체 캐시 삭제"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중률 및 절감 토큰 통계"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": sum(len(entries) for entries in self._entries.values()),
+            "companies": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "saved_tokens": self.saved_tokens
+        }
+
+
+def _cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
+    """두 벡터 간의 코사인 유사도 계산"""
+    dot_product = sum(a * b for a, b in zip(vec1, vec2))
+    norm1 = sum(a * a for a in vec1) ** 0.5
+    norm2 = sum(b * b for b in vec2) ** 0.5
+    return dot_product / (norm1 * norm2) if norm1 * norm2 != 0 else 0
+
+
+response_cache = ResponseCache(
+    similarity_threshold=settings.RESPONSE_CACHE_SIMILARITY_THRESHOLD,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    max_entries_per_company=settings.RESPONSE_CACHE_MAX_ENTRIES
+)
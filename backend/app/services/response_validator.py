@@ -0,0 +1,196 @@
+import enum
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+
+# 질문 유형별 필수 키워드
+REQUIRED_KEYWORDS: Dict[str, List[str]] = {
+    "진출시장": ["시장", "규모", "성장"],
+    "선정사유": ["시장", "제품", "경쟁력"],
+}
+
+# 응답 도입부의 답변 거부 패턴
+REFUSAL_PATTERN = re.compile(
+    r"(죄송합니다|답변(을|드리기)? 어렵|제공할 수 없|I'm sorry|I am sorry|I cannot|As an AI)",
+    re.IGNORECASE
+)
+REFUSAL_WINDOW = 200  # 거부 패턴을 확인할 도입부 길이 (문자)
+LANGUAGE_CHECK_MIN_LETTERS = 100  # 언어 비율을 판단하기 위한 최소 글자 수
+MAX_LINE_REPEATS = 3  # 같은 줄이 이 횟수만큼 반복되면 중단
+MIN_REPEATED_LINE_LENGTH = 10  # 반복 검사 대상 줄의 최소 길이
+
+# 재생성 시 추가 지시 (거부 사유별)
+RETRY_HINTS: Dict[str, str] = {
+    "missing_keywords": "다음 내용을 반드시 포함하여 답변하세요: {keywords}",
+    "too_short": "질문에 대해 충분히 구체적으로 답변하세요.",
+    "refusal": "주어진 회사 정보와 문서를 바탕으로 가능한 범위에서 답변하세요.",
+    "language": "반드시 한국어로 답변하세요.",
+    "repetition": "같은 내용을 반복하지 말고 항목별로 새로운 내용을 작성하세요.",
+}
+
+
+class Verdict(str, enum.Enum):
+    """스트리밍 검증 상태"""
+    PENDING = "pending"
+    ACCEPTED = "accepted"
+    REJECTED = "rejected"
+
+
+@dataclass
+class ValidationResult:
+    """검증 결과"""
+    verdict: Verdict
+    text: str
+    reason: Optional[str] = None
+    missing_keywords: List[str] = field(default_factory=list)
+
+    @property
+    def retry_hint(self) -> str:
+        """재생성 프롬프트에 추가할 지시문"""
+        hint = RETRY_HINTS.get(self.reason or "", "")
+        return hint.format(keywords=", ".join(self.missing_keywords))
+
+
+def required_keywords_for(query: str) -> List[str]:
+    """질문 유형에 해당하는 필수 키워드 목록 (중복 제거, 순서 유지)"""
+    keywords: List[str] = []
+    for key, values in REQUIRED_KEYWORDS.items():
+        if key in query:
+            keywords.extend(keyword for keyword in values if keyword not in keywords)
+    return keywords
+
+
+class StreamingValidator:
+    """
+    토큰 스트림 단위 응답 검증
+
+    생성 도중 필수 키워드와 구조 규칙을 점검하여
+    - 명백히 잘못된 방향(답변 거부, 다른 언어, 반복, 키워드 누락)이면 REJECTED로 조기 중단하고
+    - 모든 조건을 만족하는 즉시 ACCEPTED로 확정하여 이후 검사를 생략합니다.
+    스트림이 끝날 때까지 판단이 보류되면 finish()에서 최종 검증합니다.
+    """
+
+    def __init__(
+        self,
+        query: str,
+        min_length: int = 50,
+        keyword_deadline: Optional[int] = None,
+        min_hangul_ratio: Optional[float] = None
+    ):
+        self.required_keywords = required_keywords_for(query)
+        self.min_length = min_length
+        self.keyword_deadline = (
+            keyword_deadline if keyword_deadline is not None
+            else settings.CHAT_VALIDATION_KEYWORD_DEADLINE_CHARS
+        )
+        self.min_hangul_ratio = (
+            min_hangul_ratio if min_hangul_ratio is not None
+            else settings.CHAT_VALIDATION_MIN_HANGUL_RATIO
+        )
+
+        self.verdict = Verdict.PENDING
+        self.reason: Optional[str] = None
+        self._parts: List[str] = []
+        self._length = 0
+        self._found_keywords = set()
+        self._tail = ""  # 청크 경계에 걸친 키워드 검사용
+        self._line = ""  # 작성 중인 줄
+        self._line_counts: Counter = Counter()
+        self._letters = 0
+        self._hangul = 0
+
+    @property
+    def text(self) -> str:
+        return "".join(self._parts)
+
+    @property
+    def missing_keywords(self) -> List[str]:
+        return [keyword for keyword in self.required_keywords if keyword not in self._found_keywords]
+
+    def feed(self, delta: str) -> Verdict:
+        """생성된 텍스트 조각 검사 후 현재 판정 반환"""
+        previous_length = self._length
+        self._parts.append(delta)
+        self._length += len(delta)
+        if self.verdict != Verdict.PENDING:
+            return self.verdict
+
+        self._scan_keywords(delta)
+        self._count_letters(delta)
+
+        if previous_length < REFUSAL_WINDOW and REFUSAL_PATTERN.search(self.text[:REFUSAL_WINDOW]):
+            return self._reject("refusal")
+        if self._is_wrong_language():
+            return self._reject("language")
+        if self._has_repetition(delta):
+            return self._reject("repetition")
+        if self._length >= self.keyword_deadline and self._keywords_off_track():
+            return self._reject("missing_keywords")
+
+        if self._length >= self.min_length and not self.missing_keywords:
+            self.verdict = Verdict.ACCEPTED
+        return self.verdict
+
+    def finish(self) -> ValidationResult:
+        """스트림 종료 후 최종 판정"""
+        text = self.text
+        if self.verdict == Verdict.PENDING:
+            if len(text.strip()) < self.min_length:
+                self._reject("too_short")
+            elif self.missing_keywords:
+                self._reject("missing_keywords")
+            else:
+                self.verdict = Verdict.ACCEPTED
+        return ValidationResult(
+            verdict=self.verdict,
+            text=text,
+            reason=self.reason,
+            missing_keywords=self.missing_keywords
+        )
+
+    def _reject(self, reason: str) -> Verdict:
+        self.verdict = Verdict.REJECTED
+        self.reason = reason
+        return self.verdict
+
+    def _scan_keywords(self, delta: str) -> None:
+        if not self.required_keywords:
+            return
+        window = self._tail + delta
+        for keyword in self.missing_keywords:
+            if keyword in window:
+                self._found_keywords.add(keyword)
+        longest = max(len(keyword) for keyword in self.required_keywords)
+        self._tail = window[-(longest - 1):] if longest > 1 else ""
+
+    def _keywords_off_track(self) -> bool:
+        # 마감 시점까지 필수 키워드의 절반도 나오지 않았으면 방향이 틀린 것으로 판단
+        return len(self._found_keywords) * 2 < len(self.required_keywords)
+
+    def _count_letters(self, delta: str) -> None:
+        for char in delta:
+            if "가" <= char <= "힣":
+                self._hangul += 1
+                self._letters += 1
+            elif char.isalpha():
+                self._letters += 1
+
+    def _is_wrong_language(self) -> bool:
+        if self._letters < LANGUAGE_CHECK_MIN_LETTERS:
+            return False
+        return self._hangul / self._letters < self.min_hangul_ratio
+
+    def _has_repetition(self, delta: str) -> bool:
+        lines = (self._line + delta).split("\n")
+        self._line = lines.pop()
+        for line in lines:
+            line = line.strip()
+            if len(line) < MIN_REPEATED_LINE_LENGTH:
+                continue
+            self._line_counts[line] += 1
+            if self._line_counts[line] >= MAX_LINE_REPEATS:
+                return True
+        return False
@@ -0,0 +1,114 @@
+import enum
+import time
+from typing import Callable, Optional
+
+
+class CircuitState(str, enum.Enum):
+    """서킷 브레이커 상태"""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 호출이 거부된 경우"""
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = retry_after
+        super().__init__(f"Circuit '{name}' is open (retry after {retry_after:.1f}s)")
+
+
+class CircuitBreaker:
+    """
+    연속 실패 기반 서킷 브레이커
+
+    - CLOSED: 정상 호출, 연속 실패가 failure_threshold에 도달하면 OPEN
+    - OPEN: recovery_timeout 동안 호출을 즉시 거부
+    - HALF_OPEN: 최대 half_open_max_calls개의 시험 호출만 허용,
+      성공하면 CLOSED, 실패하면 다시 OPEN
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        recovery_timeout: float,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[Callable[["CircuitBreaker", CircuitState], None]] = None
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.on_state_change = on_state_change
+
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.trip_count = 0
+        self.rejected_count = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+
+    def is_available(self) -> bool:
+        """호출 가능 여부 (시험 호출 슬롯을 점유하지 않음)"""
+        if self.state == CircuitState.OPEN:
+            return self._retry_after() <= 0
+        if self.state == CircuitState.HALF_OPEN:
+            return self._half_open_calls < self.half_open_max_calls
+        return True
+
+    def before_call(self) -> None:
+        """
+        호출 전 상태 확인
+
+        Raises:
+            CircuitOpenError: 서킷이 열려 있거나 시험 호출 슬롯이 없는 경우
+        """
+        if self.state == CircuitState.OPEN:
+            if self._retry_after() > 0:
+                self.rejected_count += 1
+                raise CircuitOpenError(self.name, self._retry_after())
+            self._transition(CircuitState.HALF_OPEN)
+
+        if self.state == CircuitState.HALF_OPEN:
+            if self._half_open_calls >= self.half_open_max_calls:
+                self.rejected_count += 1
+                raise CircuitOpenError(self.name, self.recovery_timeout)
+            self._half_open_calls += 1
+
+    def record_success(self) -> None:
+        """호출 성공 기록"""
+        self.consecutive_failures = 0
+        if self.state == CircuitState.HALF_OPEN:
+            self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """호출 실패 기록"""
+        self.consecutive_failures += 1
+        if self.state == CircuitState.HALF_OPEN or (
+            self.state == CircuitState.CLOSED
+            and self.consecutive_failures >= self.failure_threshold
+        ):
+            self._trip()
+
+    def record_cancelled(self) -> None:
+        """결과 없이 취소된 호출 기록 (시험 호출 슬롯 반환)"""
+        if self.state == CircuitState.HALF_OPEN and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def _trip(self) -> None:
+        self.trip_count += 1
+        self._opened_at = time.monotonic()
+        self._transition(CircuitState.OPEN)
+
+    def _retry_after(self) -> float:
+        return self.recovery_timeout - (time.monotonic() - self._opened_at)
+
+    def _transition(self, state: CircuitState) -> None:
+        self.state = state
+        self._half_open_calls = 0
+        if state == CircuitState.CLOSED:
+            self.consecutive_failures = 0
+        if self.on_state_change:
+            self.on_state_change(self, state)
@@ -0,0 +1,58 @@
+import asyncio
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    비동기 토큰 버킷 레이트 리미터
+
+    분당 rate_per_minute 만큼 토큰이 채워지며, 최대 capacity 만큼 쌓입니다.
+    요청량이 capacity보다 크면 capacity로 제한하여 영원히 대기하지 않도록 합니다.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def available(self) -> float:
+        """현재 사용 가능한 토큰 수"""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+        self._updated_at = now
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """
+        토큰 획득 (부족하면 채워질 때까지 대기)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        # 순서 보장을 위해 대기자는 한 번에 하나씩 토큰을 기다림
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                delay = (amount - self._tokens) / self.rate_per_second
+                await asyncio.sleep(delay)
+                waited += delay
+
+    def refund(self, amount: float) -> None:
+        """예상보다 적게 사용한 토큰 반환"""
+        if amount <= 0:
+            return
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + amount)
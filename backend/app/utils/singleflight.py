@@ -0,0 +1,70 @@
+import asyncio
+import hashlib
+import json
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+def make_key(*parts: Any) -> str:
+    """요청 구성 요소로 정규화된 해시 키 생성"""
+    canonical = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """
+    동일 키로 동시에 들어온 호출을 하나의 업스트림 호출로 합치는 유틸리티
+
+    - 첫 호출만 실제로 실행되고 나머지는 같은 결과를 기다립니다.
+    - 업스트림 예외는 기다리던 모든 호출에 그대로 전달됩니다.
+    - 한 호출자가 취소되어도 다른 호출자는 영향을 받지 않으며,
+      기다리는 호출자가 모두 취소되면 업스트림 호출도 취소합니다.
+    - 호출이 끝나면 키가 제거되므로 이후 호출은 새로 실행됩니다 (결과 캐시 아님).
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, int] = {}
+
+    def in_flight(self, key: str) -> bool:
+        """해당 키의 호출이 진행 중인지 여부"""
+        return key in self._calls
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        키 단위로 호출 병합
+
+        Args:
+            key: 요청 식별 키 (make_key로 생성)
+            fn: 실제 업스트림 호출 (인자 없는 코루틴 함수)
+
+        Returns:
+            업스트림 호출 결과
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # 마지막 대기자가 취소되면 업스트림 호출도 취소
+            if self._waiters.get(key) == 1 and not task.done():
+                task.cancel()
+            raise
+        finally:
+            if self._calls.get(key) is task:
+                self._waiters[key] -= 1
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+            del self._waiters[key]
+        # 대기자가 모두 취소된 경우 처리되지 않은 예외 경고 방지
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,91 @@
+import logging
+import re
+from functools import lru_cache
+from typing import List, Union
+
+import tiktoken
+
+logger = logging.getLogger(__name__)
+
+# 문장 경계: 종결 부호 뒤 공백 또는 줄바꿈
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?。！？])\s+|\n+')
+
+# 모델명으로 인코딩을 찾을 수 없을 때 사용할 기본 인코딩
+DEFAULT_ENCODING = "cl100k_base"
+
+
+# 근사 토큰: 공백, ASCII 단어 4자 단위, 그 외 문자 1자 단위 (실제보다 크게 계산)
+_APPROXIMATE_TOKEN = re.compile(r'\s+|[A-Za-z0-9]{1,4}|\S')
+
+
+class ApproximateEncoding:
+    """BPE 파일을 받을 수 없는 환경(오프라인 등)을 위한 근사 토크나이저"""
+
+    def encode(self, text: str) -> List[str]:
+        return _APPROXIMATE_TOKEN.findall(text)
+
+    def decode(self, tokens: List[str]) -> str:
+        return "".join(tokens)
+
+
+@lru_cache(maxsize=8)
+def get_tokenizer(model: str) -> Union[tiktoken.Encoding, ApproximateEncoding]:
+    """모델별 토크나이저 조회 (프로세스 단위로 캐시)"""
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        logger.warning(f"Falling back to approximate tokenizer for {model}: {str(e)}")
+        return ApproximateEncoding()
+
+
+def count_tokens(text: str, model: str) -> int:
+    """텍스트의 토큰 수 계산"""
+    if not text:
+        return 0
+    return len(get_tokenizer(model).encode(text))
+
+
+def split_sentences(text: str) -> List[str]:
+    """텍스트를 문장 단위로 분할"""
+    if not text:
+        return []
+    return [sentence.strip() for sentence in _SENTENCE_BOUNDARY.split(text) if sentence.strip()]
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str) -> str:
+    """
+    문장 경계를 유지하면서 최대 토큰 수 이내로 텍스트 절단
+
+    Args:
+        text: 원본 텍스트
+        max_tokens: 최대 토큰 수
+        model: 토큰 계산에 사용할 모델명
+
+    Returns:
+        절단된 텍스트 (첫 문장조차 들어가지 않으면 토큰 단위로 절단)
+    """
+    if max_tokens <= 0 or not text:
+        return ""
+
+    tokenizer = get_tokenizer(model)
+    if len(tokenizer.encode(text)) <= max_tokens:
+        return text
+
+    sentences = []
+    used_tokens = 0
+    for sentence in split_sentences(text):
+        # 문장 사이 구분자(공백) 1토큰 포함
+        sentence_tokens = len(tokenizer.encode(sentence)) + (1 if sentences else 0)
+        if used_tokens + sentence_tokens > max_tokens:
+            break
+        sentences.append(sentence)
+        used_tokens += sentence_tokens
+
+    if sentences:
+        return " ".join(sentences)
+
+    # 첫 문장이 예산보다 긴 경우 토큰 단위로 자름
+    return tokenizer.decode(tokenizer.encode(text)[:max_tokens])
@@ -0,0 +1,42 @@
+import asyncio
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+async def run_worker_pool(
+    tasks: Iterable[T],
+    handler: Callable[[T], Awaitable[None]],
+    concurrency: int
+) -> None:
+    """
+    공유 작업 큐를 concurrency개의 워커로 처리
+
+    handler는 자체적으로 예외를 처리해야 하며, 처리되지 않은 예외는 로그만 남기고
+    다음 작업을 계속 처리합니다.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for task in tasks:
+        queue.put_nowait(task)
+
+    async def worker():
+        while True:
+            task = await queue.get()
+            try:
+                await handler(task)
+            except Exception as e:
+                logger.error(f"Unhandled error in worker: {str(e)}")
+            finally:
+                queue.task_done()
+
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, concurrency))]
+    try:
+        await queue.join()
+    finally:
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,87 @@
+import asyncio
+import click
+
+from app.core.database import AsyncSessionLocal
+from app.crud.batch_job import batch_job
+from app.schemas.batch_job import BatchJobCreate
+from app.services.batch_generation import batch_generation_service
+
+
+def _parse_company_ids(value: str):
+    try:
+        return [int(company_id) for company_id in value.split(",") if company_id.strip()]
+    except ValueError:
+        raise click.BadParameter("company ids must be comma separated integers")
+
+
+def _echo_report(report):
+    click.echo(
+        f"Job {report.job_id} {report.status.value}: "
+        f"{report.completed_items} items completed, {report.failed_items} failed, "
+        f"{report.completed_sections} sections in {report.elapsed_seconds:.1f}s "
+        f"({report.sections_per_minute:.1f} sections/min)"
+    )
+
+
+@click.group()
+def cli():
+    pass
+
+
+@cli.command()
+@click.option('--template-id', required=True, type=int, help='Template document ID')
+@click.option('--company-ids', required=True, help='Comma separated company IDs')
+@click.option('--concurrency', type=int, default=None, help='Number of concurrent workers')
+def run(template_id, company_ids, concurrency):
+    """템플릿으로 여러 회사의 문서를 일괄 생성"""
+    async def _run():
+        async with AsyncSessionLocal() as db:
+            job = await batch_generation_service.create_job(
+                db,
+                obj_in=BatchJobCreate(
+                    template_id=template_id,
+                    company_ids=_parse_company_ids(company_ids)
+                )
+            )
+        click.echo(f"Created batch job {job.id} ({job.total_items} companies)")
+        return await batch_generation_service.run_job(job.id, concurrency)
+
+    _echo_report(asyncio.run(_run()))
+
+
+@cli.command()
+@click.argument('job_id', type=int)
+@click.option('--concurrency', type=int, default=None, help='Number of concurrent workers')
+def resume(job_id, concurrency):
+    """중단되었거나 실패한 배치 작업 재개"""
+    _echo_report(asyncio.run(batch_generation_service.run_job(job_id, concurrency)))
+
+
+@cli.command()
+@click.argument('job_id', type=int)
+def status(job_id):
+    """배치 작업 진행 상황 표시"""
+    async def _status():
+        async with AsyncSessionLocal() as db:
+            return await batch_job.get_with_items(db, id=job_id)
+
+    job = asyncio.run(_status())
+    if not job:
+        raise click.ClickException(f"Batch job {job_id} not found")
+
+    click.echo(
+        f"Job {job.id} ({job.status.value}): "
+        f"{job.completed_items}/{job.total_items} items, {job.failed_items} failed, "
+        f"{job.completed_sections} sections"
+    )
+    if job.sections_per_minute is not None:
+        click.echo(f"  Throughput: {job.sections_per_minute:.1f} sections/min")
+    for item in job.items:
+        line = f"  company {item.company_id}: {item.status.value} ({item.completed_sections} sections)"
+        if item.error:
+            line += f" - {item.error}"
+        click.echo(line)
+
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,43 @@
+import asyncio
+import click
+
+from app.core.database import AsyncSessionLocal
+from app.crud.feedback_stat import feedback_stat
+
+
+@click.group()
+def cli():
+    pass
+
+
+@cli.command()
+@click.option('--company-id', type=int, default=None, help='Rebuild only this company')
+def rebuild(company_id):
+    """원본 피드백으로 피드백 통계 재계산 (백필/정합성 복구)"""
+    async def _rebuild():
+        async with AsyncSessionLocal() as db:
+            return await feedback_stat.rebuild(db, company_id=company_id)
+
+    rows = asyncio.run(_rebuild())
+    target = f"company {company_id}" if company_id is not None else "all companies"
+    click.echo(f"Rebuilt feedback stats for {target}: {rows} daily rows")
+
+
+@cli.command()
+@click.argument('company_id', type=int)
+def show(company_id):
+    """회사 피드백 통계 표시"""
+    async def _show():
+        async with AsyncSessionLocal() as db:
+            return await feedback_stat.get_company_stats(db, company_id=company_id)
+
+    stats = asyncio.run(_show())
+    click.echo(
+        f"Company {company_id}: {stats['total_count']} feedbacks, "
+        f"average rating {stats['average_rating']:.2f}, "
+        f"accuracy {stats['accuracy_rate']:.1%}"
+    )
+
+
+if __name__ == '__main__':
+    cli()
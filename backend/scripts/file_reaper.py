@@ -0,0 +1,39 @@
+import asyncio
+import click
+
+from app.services.file_reaper import file_reaper
+
+
+@click.group()
+def cli():
+    pass
+
+
+@cli.command()
+def run():
+    """삭제 문서와 고아 파일을 한 번 정리"""
+    report = asyncio.run(file_reaper.run_once())
+    click.echo(
+        f"Purged {report.documents_purged} documents, removed {report.files_removed} files, "
+        f"reclaimed {report.bytes_reclaimed} bytes ({report.failures} failures)"
+    )
+
+
+@cli.command()
+@click.option('--dry-run', is_flag=True, help='List orphan files without removing them')
+def orphans(dry_run):
+    """UPLOAD_DIR에서 어떤 문서도 참조하지 않는 파일 정리"""
+    report = asyncio.run(file_reaper.reap_orphan_files(dry_run=dry_run))
+    if dry_run:
+        for path in report.orphans:
+            click.echo(path)
+        click.echo(f"{len(report.orphans)} orphan files, {report.bytes_reclaimed} bytes")
+    else:
+        click.echo(
+            f"Removed {report.files_removed} orphan files, "
+            f"reclaimed {report.bytes_reclaimed} bytes ({report.failures} failures)"
+        )
+
+
+if __name__ == '__main__':
+    cli()
@@ -0,0 +1,59 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+import click
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run_import(module: str, importtime: bool = False) -> subprocess.CompletedProcess:
+    """새 인터프리터에서 모듈 import (모듈 캐시 영향을 배제하기 위해 매번 별도 프로세스)"""
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", f"import {module}"]
+    return subprocess.run(command, cwd=BACKEND_DIR, capture_output=True, text=True, check=True)
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[int, int, str]]:
+    """-X importtime 출력에서 (self us, cumulative us, 모듈명) 목록 추출"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # 헤더
+        rows.append((int(self_us), int(cumulative_us), name.strip()))
+    return rows
+
+
+@click.command()
+@click.option('--module', default='app.main', show_default=True, help='Module to import')
+@click.option('--runs', default=5, show_default=True, help='Number of cold imports to time')
+@click.option('--top', default=15, show_default=True, help='Number of slowest modules to list')
+def benchmark(module, runs, top):
+    """애플리케이션 import(워커 기동/테스트 수집) 시간 측정"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        _run_import(module)
+        timings.append(time.perf_counter() - started)
+
+    click.echo(
+        f"import {module}: median {statistics.median(timings) * 1000:.0f}ms, "
+        f"min {min(timings) * 1000:.0f}ms over {runs} runs (interpreter startup included)"
+    )
+
+    rows = _parse_importtime(_run_import(module, importtime=True).stderr)
+    click.echo(f"\nSlowest modules by self time (top {top}):")
+    for self_us, cumulative_us, name in sorted(rows, reverse=True)[:top]:
+        click.echo(f"  {self_us / 1000:8.1f}ms self {cumulative_us / 1000:8.1f}ms cumulative  {name}")
+
+
+if __name__ == '__main__':
+    benchmark()
@@ -92,6 +92,56 @@ class TestCompaniesAPI:
         assert data["name"] == valid_company_data["name"]
         assert data["business_number"] == valid_company_data["business_number"]
 
+    async def test_read_company_conditional_get(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        valid_company_data: dict
+    ):
+        """ETag가 일치하면 304, 수정 후에는 새 ETag로 200"""
+        create_response = await async_client.post(
+            f"{settings.API_V1_STR}/companies/",
+            json=valid_company_data
+        )
+        url = f"{settings.API_V1_STR}/companies/{create_response.json()['id']}"
+
+        response = await async_client.get(url)
+        etag = response.headers["etag"]
+        assert response.headers["last-modified"]
+
+        not_modified = await async_client.get(url, headers={"If-None-Match": etag})
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified.content == b""
+
+        await async_client.put(url, json={"name": "Renamed Company"})
+        modified = await async_client.get(url, headers={"If-None-Match": etag})
+        assert modified.status_code == status.HTTP_200_OK
+        assert modified.headers["etag"] != etag
+        assert modified.json()["name"] == "Renamed Company"
+
+    async def test_read_companies_list_cache_invalidated_on_write(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        valid_company_data: dict
+    ):
+        """목록 캐시는 ETag로 304를 반환하고, 회사 생성 시 무효화됨"""
+        await async_client.post(f"{settings.API_V1_STR}/companies/", json=valid_company_data)
+        url = f"{settings.API_V1_STR}/companies/"
+
+        first = await async_client.get(url)
+        etag = first.headers["etag"]
+        not_modified = await async_client.get(url, headers={"If-None-Match": etag})
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+
+        await async_client.post(
+            f"{settings.API_V1_STR}/companies/",
+            json={**valid_company_data, "business_number": "9999999999"}
+        )
+        refreshed = await async_client.get(url, headers={"If-None-Match": etag})
+        assert refreshed.status_code == status.HTTP_200_OK
+        assert len(refreshed.json()) == len(first.json()) + 1
+
     async def test_update_company(
         self,
         async_client: AsyncClient,
@@ -126,6 +126,29 @@ class TestDocumentsAPI:
         data = response.json()
         assert all(d['type'] == document_data['type'] for d in data)
 
+    async def test_get_company_documents_include_content(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        valid_company_data: dict,
+        valid_document_data: dict
+    ):
+        """문서 목록 본문 포함 여부 테스트"""
+        document_data = await self.test_create_document(
+            async_client, db_session, valid_company_data, valid_document_data
+        )
+        url = f"{settings.API_V1_STR}/documents/company/{document_data['company_id']}"
+
+        # 기본 목록은 본문 제외
+        response = await async_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert all('content' not in d for d in response.json())
+
+        # include=content 지정 시 본문 포함
+        response = await async_client.get(url, params={'include': 'content'})
+        assert response.status_code == status.HTTP_200_OK
+        assert all('content' in d for d in response.json())
+
     async def test_invalid_file_type(
         self,
         async_client: AsyncClient,
@@ -158,6 +181,52 @@ class TestDocumentsAPI:
         )
         assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
 
+    async def test_bulk_update_and_delete_documents(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        valid_company_data: dict,
+        valid_document_data: dict
+    ):
+        """문서 일괄 수정/삭제 테스트 (ID별 결과, 삭제 문서는 조회되지 않음)"""
+        document_data = await self.test_create_document(
+            async_client, db_session, valid_company_data, valid_document_data
+        )
+        ids = [document_data['id'], 99999]
+
+        response = await async_client.patch(
+            f"{settings.API_V1_STR}/documents/bulk",
+            json={'ids': ids, 'doc_metadata': {'status': 'draft'}}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            'succeeded': 1,
+            'not_found': 1,
+            'results': [
+                {'id': document_data['id'], 'status': 'updated'},
+                {'id': 99999, 'status': 'not_found'}
+            ]
+        }
+        response = await async_client.get(f"{settings.API_V1_STR}/documents/{document_data['id']}")
+        assert response.json()['doc_metadata'] == {'status': 'draft'}
+
+        response = await async_client.post(
+            f"{settings.API_V1_STR}/documents/bulk-delete",
+            json={'ids': ids}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [r['status'] for r in response.json()['results']] == ['deleted', 'not_found']
+
+        response = await async_client.get(f"{settings.API_V1_STR}/documents/{document_data['id']}")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        # 이미 삭제된 문서는 다시 삭제되지 않음
+        response = await async_client.post(
+            f"{settings.API_V1_STR}/documents/bulk-delete",
+            json={'ids': ids}
+        )
+        assert response.json()['succeeded'] == 0
+
     async def test_document_not_found(
         self,
         async_client: AsyncClient,
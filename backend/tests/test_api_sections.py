@@ -217,6 +217,46 @@ class TestSectionsAPI:
         assert len(data) >= 1
         assert all(s["type"] == section_data["type"] for s in data)
 
+    async def test_bulk_update_and_delete_sections(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        valid_company_data: dict,
+        valid_document_data: dict,
+        valid_section_data: dict
+    ):
+        """섹션 일괄 수정/삭제 테스트"""
+        section_data = await self.test_create_section(
+            async_client, db_session, valid_company_data,
+            valid_document_data, valid_section_data
+        )
+        ids = [section_data["id"], 99999]
+
+        response = await async_client.patch(
+            f"{settings.API_V1_STR}/sections/bulk",
+            json={"ids": ids, "type": "other"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [r["status"] for r in response.json()["results"]] == ["updated", "not_found"]
+        response = await async_client.get(f"{settings.API_V1_STR}/sections/{section_data['id']}")
+        assert response.json()["type"] == "other"
+
+        # 수정할 항목이 없으면 400
+        response = await async_client.patch(
+            f"{settings.API_V1_STR}/sections/bulk",
+            json={"ids": ids}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = await async_client.post(
+            f"{settings.API_V1_STR}/sections/bulk-delete",
+            json={"ids": ids}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["succeeded"] == 1
+        response = await async_client.get(f"{settings.API_V1_STR}/sections/{section_data['id']}")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
     async def test_section_not_found(
         self,
         async_client: AsyncClient,
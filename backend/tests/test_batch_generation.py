@@ -0,0 +1,87 @@
+from sqlalchemy.dialects import postgresql
+
+from app.crud import batch_job, crud_company, crud_document, crud_section
+from app.models import BatchJob, BatchJobItem, BatchJobStatus, Company, Document, Section
+from app.services.batch_generation import BatchGenerationService
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def unique(self):
+        return self
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return list(self._rows)
+
+
+class FakeSession:
+    """execute마다 준비된 행 목록을 차례로 반환하는 세션"""
+
+    def __init__(self, *results):
+        self.info = {}
+        self.statements = []
+        self._results = list(results)
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return FakeResult(self._results.pop(0))
+
+    async def commit(self):
+        pass
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+async def test_get_by_document_without_limit_returns_all_rows():
+    """limit=None이면 LIMIT 없이 전체 조회, 다음 페이지 커서 없음"""
+    sections = [Section(id=i, document_id=1) for i in range(1, 4)]
+    db = FakeSession(sections)
+
+    page = await crud_section.get_by_document(db, document_id=1, limit=None)
+
+    assert list(page) == sections
+    assert page.next_cursor is None
+    assert "LIMIT" not in _sql(db.statements[0])
+
+
+async def test_batch_run_reads_all_template_and_document_sections(monkeypatch):
+    """배치 실행 시 템플릿/기존 문서 섹션을 전체 조회하고 작업 상태를 갱신"""
+    job = BatchJob(id=1, template_id=10, total_items=1, completed_sections=0, status=BatchJobStatus.PENDING)
+    item = BatchJobItem(id=1, job_id=1, company_id=5, document_id=20, status=BatchJobStatus.PENDING)
+
+    async def get_job(db, id):
+        return job
+
+    async def get_template(db, id):
+        return Document(id=10, title="Template")
+
+    async def get_company(db, id):
+        return Company(id=5, name="Company")
+
+    async def get_unfinished_items(db, job_id):
+        return [item]
+
+    monkeypatch.setattr(batch_job, "get", get_job)
+    monkeypatch.setattr(batch_job, "get_unfinished_items", get_unfinished_items)
+    monkeypatch.setattr(crud_document, "get", get_template)
+    monkeypatch.setattr(crud_company, "get", get_company)
+
+    # 템플릿 섹션 2개, 이전 실행에서 두 섹션 모두 생성됨
+    db = FakeSession(
+        [Section(id=1), Section(id=2)],
+        [Section(id=101, meta_data={"template_section_id": 1}), Section(id=102, meta_data={"template_section_id": 2})]
+    )
+
+    report = await BatchGenerationService(document_service=None)._run(db, job.id, concurrency=2)
+
+    assert report.status == BatchJobStatus.COMPLETED
+    assert report.completed_items == 1
+    assert item.status == BatchJobStatus.COMPLETED
+    assert all("LIMIT" not in _sql(statement) for statement in db.statements)
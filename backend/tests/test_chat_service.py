@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+import httpx
+import openai
+
+from app.services import chat_service as chat_service_module
+from app.services.chat_service import ChatService
+from app.services.context_packer import PackedContext
+
+
+def make_chunk(content):
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+async def test_stream_failure_is_not_accepted_or_cached(monkeypatch):
+    """스트림이 도중에 끊기면 잘린 응답을 유효 응답으로 저장/캐시하지 않고 error 이벤트로 종료"""
+    query = "진출시장 분석"
+    partial = "진출시장 분석 결과 베트남 시장은 규모와 성장성 측면에서 유망하며 현지 유통망 확보가 핵심입니다. " * 3
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+    async def stream():
+        yield make_chunk(partial)
+        raise openai.APIConnectionError(request=request)
+
+    async def stream_chat_completion(**kwargs):
+        return stream()
+
+    async def get_company(db, id):
+        return SimpleNamespace(id=id)
+
+    async def get_cache_key(company, query, db):
+        return object()
+
+    async def prepare_context(company, query, db, cache_key=None):
+        return PackedContext(text="context", token_count=10)
+
+    saved = []
+
+    async def save_chat(db, company_id, session_id, query, response, reference_scores=None):
+        saved.append(response)
+        return SimpleNamespace(id=1, references=[])
+
+    cached = []
+    service = ChatService(document_service=None)
+    service.llm = SimpleNamespace(stream_chat_completion=stream_chat_completion)
+    monkeypatch.setattr(chat_service_module.crud_company, "get", get_company)
+    monkeypatch.setattr(service, "_get_cache_key", get_cache_key)
+    monkeypatch.setattr(service, "_prepare_context", prepare_context)
+    monkeypatch.setattr(service, "_save_chat", save_chat)
+    monkeypatch.setattr(service, "_store_cache", lambda *args: cached.append(args))
+
+    events = [event async for event in service.stream_response(1, query, db=None)]
+
+    fallback = service._generate_fallback_response(query)
+    assert [event.event for event in events] == ["token", "error"]
+    assert events[-1].data["is_valid"] is False
+    assert events[-1].data["response"] == fallback
+    assert saved == [fallback]
+    assert cached == []
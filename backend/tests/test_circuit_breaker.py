@@ -0,0 +1,77 @@
+import time
+
+import pytest
+
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+def make_breaker(**kwargs) -> CircuitBreaker:
+    options = {"name": "gpt", "failure_threshold": 2, "recovery_timeout": 0.05}
+    options.update(kwargs)
+    return CircuitBreaker(**options)
+
+
+def test_opens_after_consecutive_failures():
+    """연속 실패 시 서킷 오픈 테스트"""
+    breaker = make_breaker()
+    breaker.before_call()
+    breaker.record_failure()
+    breaker.record_success()  # 성공하면 연속 실패 초기화
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.trip_count == 1
+    assert not breaker.is_available()
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.rejected_count == 1
+
+
+def test_half_open_probe_closes_on_success():
+    """반개방 시험 호출 성공 시 서킷 닫힘 테스트"""
+    transitions = []
+    breaker = make_breaker(on_state_change=lambda _, state: transitions.append(state))
+    breaker.record_failure()
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    assert breaker.is_available()
+    breaker.before_call()
+    assert breaker.state == CircuitState.HALF_OPEN
+
+    # 시험 호출 중에는 다른 호출 거부
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+    assert transitions == [CircuitState.OPEN, CircuitState.HALF_OPEN, CircuitState.CLOSED]
+
+
+def test_half_open_probe_failure_reopens():
+    """반개방 시험 호출 실패 시 재오픈 테스트"""
+    breaker = make_breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.trip_count == 2
+
+
+def test_cancelled_probe_releases_slot():
+    """취소된 시험 호출 슬롯 반환 테스트"""
+    breaker = make_breaker()
+    breaker.record_failure()
+    breaker.record_failure()
+    time.sleep(0.06)
+
+    breaker.before_call()
+    breaker.record_cancelled()
+    breaker.before_call()
+    assert breaker.state == CircuitState.HALF_OPEN
@@ -0,0 +1,73 @@
+from types import SimpleNamespace
+
+from app.services.context_packer import ContextPacker
+from app.utils.text_processor import count_tokens, split_sentences, truncate_to_tokens
+
+MODEL = "gpt-4"
+
+
+def make_company():
+    return SimpleNamespace(
+        name="테스트 기업",
+        industry="IT",
+        description="테스트 기업 설명",
+        export_countries=["미국"],
+        target_markets=None
+    )
+
+
+def make_document(doc_id: int, sentence: str, repeat: int):
+    return SimpleNamespace(id=doc_id, content=" ".join([sentence] * repeat))
+
+
+def test_split_sentences():
+    """문장 분할 테스트"""
+    text = "시장 규모가 큽니다. 성장률이 높습니다!\n경쟁이 치열합니까? 네"
+    assert split_sentences(text) == [
+        "시장 규모가 큽니다.",
+        "성장률이 높습니다!",
+        "경쟁이 치열합니까?",
+        "네"
+    ]
+
+
+def test_truncate_keeps_sentence_boundary():
+    """문장 경계 절단 테스트"""
+    text = "첫 번째 문장입니다. 두 번째 문장입니다. 세 번째 문장입니다."
+    budget = count_tokens("첫 번째 문장입니다. 두 번째 문장입니다.", MODEL)
+
+    truncated = truncate_to_tokens(text, budget, MODEL)
+
+    assert truncated == "첫 번째 문장입니다. 두 번째 문장입니다."
+    assert truncate_to_tokens(text, 1000, MODEL) == text
+    assert truncate_to_tokens(text, 0, MODEL) == ""
+
+
+def test_pack_respects_budget_and_records_passages():
+    """토큰 예산 및 포함 문서 기록 테스트"""
+    packer = ContextPacker(model=MODEL, max_tokens=400, profile_max_tokens=100)
+    documents = [
+        (make_document(1, "수출 시장 규모가 빠르게 성장하고 있습니다.", 50), 0.9),
+        (make_document(2, "제품 경쟁력이 우수합니다.", 50), 0.3),
+        (make_document(3, "", 1), 0.8),
+    ]
+
+    packed = packer.pack(make_company(), documents)
+
+    assert count_tokens(packed.text, MODEL) <= 400
+    assert "회사명: 테스트 기업" in packed.text
+    assert [p.document_id for p in packed.passages] == [1, 2]
+    assert packed.passages[0].token_count > packed.passages[1].token_count
+    assert all(p.truncated for p in packed.passages)
+    assert packed.reference_scores == {1: 0.9, 2: 0.3}
+
+
+def test_pack_skips_passages_when_budget_exhausted():
+    """예산 소진 시 문서 제외 테스트"""
+    packer = ContextPacker(model=MODEL, max_tokens=120, profile_max_tokens=100)
+    documents = [(make_document(1, "시장 분석 내용입니다.", 100), None)]
+
+    packed = packer.pack(make_company(), documents)
+
+    assert packed.passages == []
+    assert packed.reference_scores == {}
@@ -0,0 +1,86 @@
+from app.core.config import settings
+from app.models import ChatHistory
+from app.core.database import PRIMARY_PINNED_KEY
+from app.crud.chat import chat_session
+from app.services import conversation_memory as conversation_memory_module
+from app.services.conversation_memory import ConversationMemory, ConversationMemoryService
+from app.utils.text_processor import count_tokens
+
+
+def _turn(id: int, query: str, response: str) -> ChatHistory:
+    return ChatHistory(id=id, company_id=1, session_id=1, query=query, response=response)
+
+
+def test_memory_messages_order():
+    """요약 → 최근 대화 순서로 메시지 구성"""
+    memory = ConversationMemory.build(
+        "베트남 진출을 검토함",
+        [_turn(1, "시장 규모는?", "약 10조원입니다."), _turn(2, "경쟁사는?", "A사와 B사입니다.")],
+        settings.GPT_MODEL,
+        turn_max_tokens=100
+    )
+
+    messages = memory.to_messages()
+    assert [message["role"] for message in messages] == ["system", "user", "assistant", "user", "assistant"]
+    assert "베트남 진출을 검토함" in messages[0]["content"]
+    assert messages[3]["content"] == "경쟁사는?"
+
+
+def test_memory_turns_are_token_bounded():
+    """긴 대화도 대화별 토큰 상한 이내로 유지"""
+    long_response = "시장 규모가 빠르게 성장하고 있습니다. " * 200
+    memory = ConversationMemory.build(
+        None,
+        [_turn(1, "시장 분석", long_response)],
+        settings.GPT_MODEL,
+        turn_max_tokens=50
+    )
+
+    _, response = memory.turns[0]
+    assert count_tokens(response, settings.GPT_MODEL) <= 50
+
+
+def test_empty_memory():
+    """세션이 없으면 빈 메모리"""
+    memory = ConversationMemory()
+    assert memory.is_empty
+    assert memory.to_messages() == []
+
+
+async def test_session_locks_are_released_after_update(monkeypatch):
+    """요약 갱신이 끝나면 세션별 lock이 남지 않음"""
+    async def get_session(db, id):
+        return None
+
+    monkeypatch.setattr(chat_session, "get", get_session)
+    service = ConversationMemoryService()
+
+    for session_id in range(3):
+        assert await service.update(None, session_id) is False
+
+    assert len(service._locks) == 0
+
+
+async def test_background_update_reads_from_primary(monkeypatch):
+    """백그라운드 요약 갱신 세션은 primary로 고정"""
+    class FakeSession:
+        info = {}
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    pinned = []
+
+    async def update(db, session_id):
+        pinned.append(db.info.get(PRIMARY_PINNED_KEY))
+
+    service = ConversationMemoryService()
+    monkeypatch.setattr(conversation_memory_module, "AsyncSessionLocal", FakeSession)
+    monkeypatch.setattr(service, "update", update)
+
+    await service._update_in_background(1)
+
+    assert pinned == [True]
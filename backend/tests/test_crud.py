@@ -1,7 +1,8 @@
 import pytest
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.crud import company, document, section, chat_history, chat_reference, chat_feedback
+from app.crud import company, document, section, chat_history, chat_reference, chat_feedback, feedback_stat
 from app.schemas.company import CompanyCreate, CompanyUpdate
 from app.schemas.document import DocumentCreate, DocumentUpdate
 from app.schemas.section import SectionCreate, SectionUpdate
@@ -195,6 +196,53 @@ class TestCompanyCRUD:
 
         print("=== 회사 삭제 테스트 완료 ===")
 
+    async def test_company_exists_uses_session_cache(self, db_session: AsyncSession):
+        """회사 존재 확인 테스트 (같은 세션에서는 재확인 쿼리 없음)"""
+        print("\n=== 회사 존재 확인 테스트 시작 ===")
+
+        created_company = await company.create(
+            db_session,
+            obj_in=CompanyCreate(
+                name="Exists Test Company",
+                business_number="2233445566",
+                industry="IT"
+            )
+        )
+        company_id = created_company.id
+        db_session.expunge_all()
+
+        statements = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            # EXISTS 1회, 이후 확인은 세션 캐시 사용
+            assert await company.exists(db_session, company_id)
+            assert await company.exists(db_session, company_id)
+            assert not await company.exists(db_session, 99999)
+            exists_statements = len(statements)
+
+            # 조회한 객체는 identity map에서 재사용
+            fetched_company = await company.get(db_session, id=company_id)
+            fetched_again = await company.get(db_session, id=company_id)
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        print(f"실행된 쿼리 수: {len(statements)}")
+        assert exists_statements == 2, "존재 확인된 회사를 다시 조회함"
+        assert "EXISTS" in statements[0]
+        assert fetched_again is fetched_company
+        assert len(statements) == 3, "같은 세션에서 회사를 다시 조회함"
+
+        # 삭제 후에는 존재하지 않음
+        await company.remove(db_session, id=company_id)
+        assert not await company.exists(db_session, company_id)
+
+        print("=== 회사 존재 확인 테스트 완료 ===")
+
 @pytest.mark.asyncio
 class TestDocumentCRUD:
     async def test_create_document(self, db_session: AsyncSession):
@@ -405,6 +453,167 @@ class TestDocumentCRUD:
 
         print("=== 문서 삭제 테스트 완료 ===")
 
+    async def test_soft_delete_document_and_reap_file(self, db_session: AsyncSession, tmp_path):
+        """문서 삭제는 soft delete, 파일과 행은 정리 작업이 제거"""
+        from sqlalchemy import select
+        from app.models import Document
+        from app.services.file_reaper import FileReaper
+        from tests.conftest import TestingSessionLocal
+
+        test_company = await company.create(
+            db_session,
+            obj_in=CompanyCreate(name="Soft Delete Company", business_number="5566778899", industry="IT")
+        )
+        created_document = await document.create(
+            db_session,
+            obj_in=DocumentCreate(
+                company_id=test_company.id,
+                title="Soft Deleted",
+                type=DocumentType.TRAINING_DATA,
+                content="content"
+            )
+        )
+        upload = tmp_path / "upload.txt"
+        upload.write_bytes(b"x" * 128)
+        created_document.file_path = str(upload)
+        await db_session.commit()
+
+        await document.remove_with_file(db_session, id=created_document.id)
+
+        # 일반 조회/목록에서는 보이지 않고 파일은 아직 남아 있음
+        assert await document.get(db_session, id=created_document.id) is None
+        assert await document.get_by_company(db_session, company_id=test_company.id) == []
+        assert upload.exists()
+
+        reaper = FileReaper(
+            str(tmp_path),
+            batch_size=10,
+            orphan_grace_seconds=0,
+            session_factory=TestingSessionLocal
+        )
+        report = await reaper.reap_deleted_documents()
+
+        assert (report.documents_purged, report.files_removed, report.bytes_reclaimed) == (1, 1, 128)
+        assert not upload.exists()
+        remaining = await db_session.scalars(
+            select(Document.id).execution_options(include_deleted=True)
+        )
+        assert remaining.all() == []
+
+    async def test_get_document_with_sections(self, db_session: AsyncSession):
+        """섹션 포함 문서 조회 테스트 (섹션 수와 관계없이 쿼리 2회)"""
+        print("\n=== 섹션 포함 문서 조회 테스트 시작 ===")
+
+        test_company = await company.create(
+            db_session,
+            obj_in=CompanyCreate(
+                name="Eager Load Test Company",
+                business_number="1122334455",
+                industry="IT"
+            )
+        )
+        test_document = await document.create(
+            db_session,
+            obj_in=DocumentCreate(
+                company_id=test_company.id,
+                title="Eager Load Test Plan",
+                type=DocumentType.BUSINESS_PLAN
+            )
+        )
+        for order in (3, 1, 2):
+            await section.create(
+                db_session,
+                obj_in=SectionCreate(
+                    document_id=test_document.id,
+                    company_id=test_company.id,
+                    type=SectionType.EXECUTIVE_SUMMARY,
+                    title=f"Section {order}",
+                    content=f"Section {order} content",
+                    order=order
+                )
+            )
+        db_session.expunge_all()
+
+        statements = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        engine = db_session.bind.sync_engine
+        event.listen(engine, "before_cursor_execute", count_statement)
+        try:
+            fetched_document = await document.get_with_sections(db_session, id=test_document.id)
+            orders = [s.order for s in fetched_document.sections]
+            fetched_company = await company.get_with_relations(db_session, id=test_company.id)
+            nested_orders = [s.order for s in fetched_company.documents[0].sections]
+        finally:
+            event.remove(engine, "before_cursor_execute", count_statement)
+
+        print(f"실행된 쿼리 수: {len(statements)}")
+        assert orders == [1, 2, 3], "섹션이 순서대로 로딩되지 않음"
+        assert nested_orders == [1, 2, 3], "회사 문서의 섹션이 순서대로 로딩되지 않음"
+        # 문서 + 섹션 2회, 회사 + 문서 + 섹션 + 채팅 이력 4회
+        assert len(statements) == 6, "관계 로딩 중 추가 쿼리 발생"
+
+        with pytest.raises(ValueError):
+            await document.get(db_session, test_document.id, load="unknown")
+
+        print("=== 섹션 포함 문서 조회 테스트 완료 ===")
+
+    async def test_search_documents(self, db_session: AsyncSession):
+        """문서 전문 검색 테스트 (조사 포함 어절 일치, 관련도 정렬, 강조 스니펫)"""
+        print("\n=== 문서 검색 테스트 시작 ===")
+
+        test_company = await company.create(
+            db_session,
+            obj_in=CompanyCreate(name="Search Test Company", business_number="5566778899")
+        )
+        contents = {
+            "베트남 진출 계획": "베트남 화장품 시장은 규모가 빠르게 성장하고 있습니다.",
+            "회사 소개": "당사는 화장품 제조 기업입니다.",
+            "제품 목록": "스킨케어 제품 라인업",
+        }
+        for title, content in contents.items():
+            await document.create(
+                db_session,
+                obj_in=DocumentCreate(
+                    company_id=test_company.id,
+                    title=title,
+                    type=DocumentType.COMPANY_PROFILE,
+                    content=content
+                )
+            )
+
+        results = await document.search_documents(
+            db_session,
+            query="시장 규모",
+            company_id=test_company.id
+        )
+        print(f"검색 결과: {[(doc.title, doc.rank, doc.snippet) for doc in results]}")
+        assert [doc.title for doc in results] == ["베트남 진출 계획"], "조사가 붙은 어절이 검색되지 않음"
+        assert "<mark>시장은</mark>" in results[0].snippet, "검색어가 강조되지 않음"
+
+        results = await document.search_documents(
+            db_session,
+            query="화장품",
+            company_id=test_company.id,
+            limit=1
+        )
+        assert len(results) == 1
+        assert results.next_cursor is not None, "다음 페이지 커서 없음"
+        next_results = await document.search_documents(
+            db_session,
+            query="화장품",
+            company_id=test_company.id,
+            limit=1,
+            cursor=results.next_cursor
+        )
+        assert len(next_results) == 1
+        assert next_results[0].id != results[0].id, "다음 페이지에 같은 문서가 조회됨"
+        assert next_results[0].rank <= results[0].rank, "관련도순으로 정렬되지 않음"
+
+        print("=== 문서 검색 테스트 완료 ===")
+
 @pytest.mark.asyncio
 class TestSectionCRUD:
     async def test_create_section(self, db_session: AsyncSession):
@@ -900,4 +1109,88 @@ class TestChatCRUD:
         fetched_chat = await chat_history.get(db_session, id=created_chat.id)
         assert fetched_chat is None, "삭제된 채팅 이력이 여전히 조회됨"
 
-        print("=== 채팅 이력 삭제 테스트 완료 ===")
\ No newline at end of file
+        print("=== 채팅 이력 삭제 테스트 완료 ===")
+
+    async def test_create_chat_with_references(self, db_session: AsyncSession):
+        """채팅 이력과 참조 문서 일괄 저장 테스트"""
+        print("\n=== 채팅 이력/참조 일괄 저장 테스트 시작 ===")
+
+        test_company = await self.create_test_company(db_session)
+        doc1 = await self.create_test_document(db_session, test_company.id)
+        doc2 = await self.create_test_document(db_session, test_company.id)
+
+        created_chat = await chat_history.create_with_references(
+            db_session,
+            obj_in=ChatHistoryCreate(
+                company_id=test_company.id,
+                query="주요 진출 시장은?",
+                response="베트남 시장의 규모와 성장성을 고려했습니다."
+            ),
+            scores={doc1.id: 0.9, doc2.id: 0.4}
+        )
+        print(f"생성된 채팅 이력 ID: {created_chat.id}")
+
+        # RETURNING으로 받은 값 검증 (추가 조회 없이 사용 가능)
+        assert created_chat.id is not None, "채팅 ID가 할당되지 않음"
+        assert {ref.document_id: ref.relevance_score for ref in created_chat.references} == {
+            doc1.id: 0.9,
+            doc2.id: 0.4
+        }, "참조 문서 점수 불일치"
+
+        # 데이터베이스 재조회 검증
+        references = await chat_reference.get_by_chat(db_session, chat_id=created_chat.id)
+        assert [ref.document_id for ref in references] == [doc1.id, doc2.id], "참조 문서 저장 순서 불일치"
+
+        print("=== 채팅 이력/참조 일괄 저장 테스트 완료 ===")
+
+    async def test_feedback_stats_rollup(self, db_session: AsyncSession):
+        """피드백 저장 시 통계 누적 및 재계산 테스트"""
+        print("\n=== 피드백 통계 집계 테스트 시작 ===")
+
+        created_chat, test_company = await self.test_create_chat_history(db_session)
+        other_chat = await chat_history.create(
+            db_session,
+            obj_in=ChatHistoryCreate(
+                company_id=test_company.id,
+                query="경쟁사는 어디인가요?",
+                response="국내 경쟁사는 세 곳입니다."
+            )
+        )
+
+        await chat_feedback.update_or_create(
+            db_session,
+            chat_id=created_chat.id,
+            feedback_in=ChatFeedbackCreate(chat_id=created_chat.id, rating=5, is_accurate=True)
+        )
+        await chat_feedback.update_or_create(
+            db_session,
+            chat_id=other_chat.id,
+            feedback_in=ChatFeedbackCreate(chat_id=other_chat.id, rating=2, is_accurate=False)
+        )
+        # 기존 피드백 수정은 건수를 늘리지 않고 변경분만 반영
+        await chat_feedback.update_or_create(
+            db_session,
+            chat_id=other_chat.id,
+            feedback_in=ChatFeedbackCreate(chat_id=other_chat.id, rating=3, is_accurate=True)
+        )
+
+        stats = await chat_feedback.get_company_stats(db_session, company_id=test_company.id)
+        print(f"누적 통계: {stats}")
+        assert stats == {"total_count": 2, "average_rating": 4.0, "accuracy_rate": 1.0}
+
+        daily = await feedback_stat.get_daily_stats(db_session, company_id=test_company.id)
+        assert len(daily) == 1 and daily[0]["total_count"] == 2, "일자별 통계 불일치"
+
+        # 원본 데이터로 재계산해도 같은 결과
+        await feedback_stat.rebuild(db_session, company_id=test_company.id)
+        rebuilt = await chat_feedback.get_company_stats(db_session, company_id=test_company.id)
+        assert rebuilt == stats, "재계산 통계 불일치"
+
+        # 채팅 삭제 시 CASCADE로 지워지는 피드백의 기여분 차감
+        await chat_history.remove(db_session, id=other_chat.id)
+        stats = await chat_feedback.get_company_stats(db_session, company_id=test_company.id)
+        assert stats == {"total_count": 1, "average_rating": 5.0, "accuracy_rate": 1.0}, "삭제 후 통계 불일치"
+        daily = await feedback_stat.get_daily_stats(db_session, company_id=test_company.id)
+        assert daily[0]["total_count"] == 1, "삭제 후 일자별 통계 불일치"
+
+        print("=== 피드백 통계 집계 테스트 완료 ===")
@@ -0,0 +1,56 @@
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, exc, text
+
+from app.core.database import InstrumentedQueuePool, register_pool_metrics
+
+
+def _sample(name: str, pool: str) -> float:
+    return REGISTRY.get_sample_value(name, {"pool": pool}) or 0.0
+
+
+def test_pool_metrics_track_checkouts():
+    """체크아웃 대기 시간과 사용 중/유휴/오버플로 연결 수가 메트릭에 반영"""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_logging_name="test_checkouts"
+    )
+    register_pool_metrics(engine, "test_checkouts")
+
+    first = engine.connect()
+    second = engine.connect()
+    first.execute(text("SELECT 1"))
+
+    assert _sample("vouchergpt_db_pool_in_use_connections", "test_checkouts") == 2
+    assert _sample("vouchergpt_db_pool_overflow_connections", "test_checkouts") == 1
+    assert _sample("vouchergpt_db_pool_checkout_wait_seconds_count", "test_checkouts") == 2
+
+    first.close()
+    second.close()
+
+    assert _sample("vouchergpt_db_pool_in_use_connections", "test_checkouts") == 0
+    assert _sample("vouchergpt_db_pool_idle_connections", "test_checkouts") == 1
+    engine.dispose()
+
+
+def test_pool_checkout_timeout_is_counted():
+    """풀이 가득 차 대기 시간을 넘기면 타임아웃 카운터 증가"""
+    engine = create_engine(
+        "sqlite://",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+        pool_logging_name="test_timeouts"
+    )
+
+    held = engine.connect()
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+    held.close()
+
+    assert _sample("vouchergpt_db_pool_checkout_timeouts_total", "test_timeouts") == 1
+    engine.dispose()
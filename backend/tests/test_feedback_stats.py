@@ -0,0 +1,31 @@
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.crud.feedback_stat import feedback_counters, stats_summary, utc_day
+from app.models import ChatFeedback
+
+
+def test_feedback_counters_delta():
+    """피드백 수정 시 통계 변경분 계산"""
+    before = feedback_counters(ChatFeedback(rating=2, is_accurate=False))
+    after = feedback_counters(ChatFeedback(rating=None, is_accurate=True))
+    delta = {column: after[column] - before[column] for column in after}
+
+    assert delta == {"feedback_count": 0, "rating_count": -1, "rating_sum": -2, "accurate_count": 1}
+    assert feedback_counters(None) == {
+        "feedback_count": 0, "rating_count": 0, "rating_sum": 0, "accurate_count": 0
+    }
+
+
+def test_stats_summary():
+    """누적 값으로 평균 평점과 정확도 비율 계산"""
+    stat = SimpleNamespace(feedback_count=4, rating_count=2, rating_sum=7, accurate_count=3)
+    assert stats_summary(stat) == {"total_count": 4, "average_rating": 3.5, "accuracy_rate": 0.75}
+    assert stats_summary(None) == {"total_count": 0, "average_rating": 0.0, "accuracy_rate": 0.0}
+
+
+def test_utc_day():
+    """집계 일자는 UTC 기준"""
+    kst = timezone(timedelta(hours=9))
+    assert utc_day(datetime(2024, 5, 2, 3, 0, tzinfo=kst)) == date(2024, 5, 1)
+    assert utc_day(datetime(2024, 5, 2, 3, 0)) == date(2024, 5, 2)
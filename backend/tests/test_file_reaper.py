@@ -0,0 +1,28 @@
+import os
+
+from app.services.file_reaper import remove_files, scan_upload_dir
+
+
+def test_remove_files_reports_reclaimed_bytes_and_failures(tmp_path):
+    """이미 없는 파일은 삭제된 것으로, 지울 수 없는 경로는 실패로 보고"""
+    first = tmp_path / "a.pdf"
+    first.write_bytes(b"x" * 100)
+    directory = tmp_path / "not-a-file"
+    directory.mkdir()
+
+    removed, reclaimed, failed = remove_files([str(first), str(tmp_path / "missing.pdf"), str(directory)])
+
+    assert (removed, reclaimed) == (2, 100)
+    assert failed == [str(directory)]
+    assert not first.exists()
+
+
+def test_scan_upload_dir_skips_recent_files(tmp_path):
+    """유예 시간 안에 수정된 파일(업로드 중일 수 있음)은 대상에서 제외"""
+    old = tmp_path / "1" / "old.pdf"
+    old.parent.mkdir()
+    old.write_bytes(b"x" * 10)
+    os.utime(old, (1000, 1000))
+    (tmp_path / "1" / "new.pdf").write_bytes(b"y")
+
+    assert scan_upload_dir(str(tmp_path), older_than=2000) == {str(old): 10}
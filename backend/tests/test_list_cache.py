@@ -0,0 +1,89 @@
+from sqlalchemy import Column, Integer, String, create_engine, update
+from sqlalchemy.orm import Session, declarative_base
+
+from app.services.list_cache import ListCache, list_cache
+
+Base = declarative_base()
+
+
+class Widget(Base):
+    __tablename__ = "widgets"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    """TTL이 지난 항목은 조회되지 않음"""
+    clock = FakeClock()
+    cache = ListCache(ttl_seconds=5, max_entries=10, clock=clock)
+    entry = cache.store("/companies?", b"[]", ["companies"])
+
+    assert cache.get("/companies?") is entry
+    clock.now = 6
+    assert cache.get("/companies?") is None
+
+
+def test_etag_depends_on_body_and_lru_eviction():
+    """ETag는 본문 해시, 최대 개수 초과 시 가장 오래 사용하지 않은 항목 제거"""
+    cache = ListCache(ttl_seconds=5, max_entries=2)
+    first = cache.store("a", b"[1]", ["companies"])
+    same = cache.store("b", b"[1]", ["companies"])
+    cache.get("a")
+    cache.store("c", b"[2]", ["companies"])
+
+    assert first.etag == same.etag
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+
+def test_invalidate_tables_removes_dependent_entries():
+    """테이블 무효화 시 해당 테이블에 의존하는 항목만 제거"""
+    cache = ListCache(ttl_seconds=5, max_entries=10)
+    cache.store("sections", b"[]", ["sections", "documents"])
+    cache.store("companies", b"[]", ["companies"])
+
+    cache.invalidate_tables(["documents"])
+
+    assert cache.get("sections") is None
+    assert cache.get("companies") is not None
+
+
+def test_disabled_cache_does_not_store():
+    cache = ListCache(ttl_seconds=5, max_entries=10, enabled=False)
+    entry = cache.store("a", b"[]", ["companies"])
+
+    assert entry.etag
+    assert cache.get("a") is None
+
+
+def test_committed_writes_invalidate_entries():
+    """flush/일괄 UPDATE가 커밋되면 무효화, 롤백되면 유지"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    list_cache.clear()
+
+    with Session(engine) as session:
+        list_cache.store("widgets", b"[]", ["widgets"])
+        session.add(Widget(id=1, name="a"))
+        session.commit()
+        assert list_cache.get("widgets") is None
+
+        list_cache.store("widgets", b"[]", ["widgets"])
+        session.execute(update(Widget).values(name="b"))
+        session.rollback()
+        assert list_cache.get("widgets") is not None
+
+        session.execute(update(Widget).values(name="c"))
+        session.commit()
+        assert list_cache.get("widgets") is None
+
+    list_cache.clear()
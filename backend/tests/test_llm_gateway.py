@@ -0,0 +1,193 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from app.core.config import settings
+from app.services import llm_gateway as llm_gateway_module
+from app.services.llm_gateway import LLMGateway
+from app.utils.circuit_breaker import CircuitBreaker, CircuitState
+from app.utils.rate_limiter import TokenBucket
+
+
+def make_rate_limit_error(headers: dict) -> openai.RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, headers=headers, request=request)
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+async def test_token_bucket_waits_when_empty():
+    """토큰 버킷 대기 테스트"""
+    bucket = TokenBucket(rate_per_minute=600, capacity=2)  # 초당 10개
+
+    assert await bucket.acquire() == 0
+    assert await bucket.acquire() == 0
+
+    started = time.monotonic()
+    waited = await bucket.acquire()
+    assert waited > 0
+    assert time.monotonic() - started >= 0.05
+
+
+async def test_token_bucket_refund_and_cap():
+    """토큰 반환 및 용량 제한 테스트"""
+    bucket = TokenBucket(rate_per_minute=60, capacity=100)
+    await bucket.acquire(80)
+    bucket.refund(50)
+    assert 69 <= bucket.available <= 71
+
+    # 용량보다 큰 요청도 용량만큼만 대기
+    await asyncio.wait_for(TokenBucket(rate_per_minute=6000, capacity=10).acquire(1000), timeout=1)
+
+
+def test_retry_delay_honours_retry_after():
+    """Retry-After 헤더 우선 적용 테스트"""
+    assert LLMGateway._retry_delay(0, make_rate_limit_error({"retry-after": "3"})) == 3.0
+    assert LLMGateway._retry_delay(0, make_rate_limit_error({"retry-after-ms": "250"})) == 0.25
+    assert LLMGateway._retry_delay(
+        0, make_rate_limit_error({"retry-after": "3600"})
+    ) == settings.LLM_BACKOFF_MAX_SECONDS
+
+
+def test_retry_delay_exponential_backoff_with_jitter():
+    """지수 백오프 + 지터 테스트"""
+    error = make_rate_limit_error({})
+    for attempt in range(6):
+        delay = LLMGateway._retry_delay(attempt, error)
+        upper = min(settings.LLM_BACKOFF_MAX_SECONDS, settings.LLM_BACKOFF_BASE_SECONDS * 2 ** attempt)
+        assert 0 <= delay <= upper
+
+
+async def test_cancel_while_rate_limited_releases_half_open_probe():
+    """레이트 리밋 대기 중 취소되면 반개방 시험 호출 슬롯 반환 테스트"""
+    gateway = LLMGateway()
+    breaker = CircuitBreaker(name="gpt", failure_threshold=1, recovery_timeout=0.01)
+    gateway._breakers["gpt"] = breaker
+    # 요청 버킷이 비어 있어 acquire에서 대기
+    empty_bucket = TokenBucket(rate_per_minute=1, capacity=1)
+    await empty_bucket.acquire()
+    gateway._limiters["gpt"] = (empty_bucket, TokenBucket(rate_per_minute=6000))
+
+    breaker.record_failure()
+    await asyncio.sleep(0.02)
+
+    async def request():
+        raise AssertionError("request must not be sent")
+
+    task = asyncio.create_task(gateway._call("gpt", 1, request))
+    await asyncio.sleep(0.01)
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert not breaker.is_available()
+
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    assert breaker.is_available()
+
+
+async def test_failed_calls_record_retry_count(monkeypatch):
+    """재시도를 모두 소진한 실패 호출도 재시도 횟수를 기록하는지 테스트"""
+    monkeypatch.setattr(settings, "LLM_MAX_RETRIES", 2)
+    monkeypatch.setattr(LLMGateway, "_retry_delay", staticmethod(lambda attempt, error: 0))
+    records = []
+    monkeypatch.setattr(llm_gateway_module.llm_telemetry, "record_call", records.append)
+
+    async def create(**kwargs):
+        raise make_rate_limit_error({})
+
+    gateway = LLMGateway()
+    gateway._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    gateway._limiters["gpt"] = (TokenBucket(rate_per_minute=6000), TokenBucket(rate_per_minute=600000))
+    gateway._breakers["gpt"] = CircuitBreaker(name="gpt", failure_threshold=10, recovery_timeout=1)
+    messages = [{"role": "user", "content": "hi"}]
+
+    for call in (gateway.chat_completion, gateway.stream_chat_completion):
+        with pytest.raises(openai.RateLimitError):
+            await call(model="gpt", messages=messages, call_site="test")
+
+    assert [(record.success, record.retries) for record in records] == [(False, 2), (False, 2)]
+
+
+class FakeStream:
+    """청크 목록을 차례로 내보낸 뒤 error가 있으면 발생시키는 스트림"""
+
+    def __init__(self, chunks, error=None):
+        self._chunks = list(chunks)
+        self._error = error
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._chunks:
+            return self._chunks.pop(0)
+        if self._error is not None:
+            raise self._error
+        raise StopAsyncIteration
+
+    async def close(self):
+        self.closed = True
+
+
+def make_chunk(content=None, usage=None):
+    choices = [SimpleNamespace(delta=SimpleNamespace(content=content))] if content else []
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+def make_stream_gateway(monkeypatch, stream):
+    monkeypatch.setattr(llm_gateway_module.llm_telemetry, "record_call", lambda record: None)
+
+    async def create(**kwargs):
+        return stream
+
+    gateway = LLMGateway()
+    gateway._client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    # 분당 6토큰 - 테스트 중 리필은 무시할 수 있음
+    gateway._limiters["gpt"] = (TokenBucket(rate_per_minute=6000), TokenBucket(rate_per_minute=6, capacity=10000))
+    gateway._breakers["gpt"] = CircuitBreaker(name="gpt", failure_threshold=2, recovery_timeout=60)
+    return gateway
+
+
+async def test_stream_refunds_unused_tokens(monkeypatch):
+    """스트리밍 호출도 종료 시 최종 사용량 기준으로 남은 토큰을 반환하는지 테스트"""
+    usage = SimpleNamespace(prompt_tokens=10, completion_tokens=5, total_tokens=15)
+    stream = FakeStream([make_chunk("hello"), make_chunk(usage=usage)])
+    gateway = make_stream_gateway(monkeypatch, stream)
+
+    chunks = await gateway.stream_chat_completion(
+        model="gpt", messages=[{"role": "user", "content": "hi"}], call_site="test", max_tokens=2000
+    )
+    async for _ in chunks:
+        pass
+
+    _, token_bucket = gateway._limiters["gpt"]
+    assert stream.closed
+    assert 10000 - 15 <= token_bucket.available < 10000 - 14
+
+
+async def test_mid_stream_errors_trip_circuit(monkeypatch):
+    """스트림이 열린 뒤 발생한 업스트림 오류도 서킷 브레이커 실패로 집계하는지 테스트"""
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    gateway = make_stream_gateway(monkeypatch, None)
+    messages = [{"role": "user", "content": "hi"}]
+
+    for _ in range(2):
+        stream = FakeStream([make_chunk("partial")], error=openai.APIConnectionError(request=request))
+
+        async def create(**kwargs):
+            return stream
+
+        gateway._client.chat.completions.create = create
+        chunks = await gateway.stream_chat_completion(model="gpt", messages=messages, call_site="test")
+        with pytest.raises(openai.APIConnectionError):
+            async for _ in chunks:
+                pass
+        assert stream.closed
+
+    assert gateway._breakers["gpt"].state == CircuitState.OPEN
@@ -0,0 +1,127 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import settings
+from app.services import llm_telemetry as llm_telemetry_module
+from app.services.llm_telemetry import LLMCallRecord, LLMTelemetry, estimate_cost
+
+
+def test_estimate_cost_uses_pricing_table():
+    """가격표 기반 비용 추정 테스트"""
+    pricing = settings.LLM_PRICING[settings.GPT_MODEL]
+    expected = (1000 * pricing["prompt"] + 500 * pricing["completion"]) / 1000
+
+    assert estimate_cost(settings.GPT_MODEL, 1000, 500) == pytest.approx(expected)
+    assert estimate_cost("unknown-model", 1000, 500) == 0.0
+
+
+def test_record_call_accumulates_per_company():
+    """회사별 사용량 누적 테스트"""
+    telemetry = LLMTelemetry()
+    for success in (True, False):
+        telemetry.record_call(LLMCallRecord(
+            call_site="generate_response",
+            model=settings.GPT_MODEL,
+            company_id=1,
+            duration=0.5,
+            success=success,
+            retries=1,
+            prompt_tokens=100,
+            completion_tokens=50
+        ))
+    telemetry.record_validation_failure("generate_response", settings.GPT_MODEL, 1)
+
+    assert len(telemetry._pending) == 1
+    totals = next(iter(telemetry._pending.values()))
+    assert totals["call_count"] == 2
+    assert totals["error_count"] == 1
+    assert totals["retry_count"] == 2
+    assert totals["validation_failure_count"] == 1
+    assert totals["prompt_tokens"] == 200
+    assert totals["total_duration_ms"] == 1000
+
+
+def test_record_call_without_company_is_not_persisted():
+    """회사 미지정 호출은 집계 대상에서 제외"""
+    telemetry = LLMTelemetry()
+    telemetry.record_call(LLMCallRecord(
+        call_site="analyze_content",
+        model=settings.GPT_MODEL,
+        company_id=None,
+        duration=0.1,
+        success=True
+    ))
+
+    assert telemetry._pending == {}
+
+
+def _record_usage(telemetry: LLMTelemetry, *company_ids: int) -> None:
+    for company_id in company_ids:
+        telemetry.record_call(LLMCallRecord(
+            call_site="generate_response",
+            model=settings.GPT_MODEL,
+            company_id=company_id,
+            duration=0.1,
+            success=True
+        ))
+
+
+class FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def _patch_increment_many(monkeypatch, increment_many):
+    monkeypatch.setattr(llm_telemetry_module, "AsyncSessionLocal", FakeSession)
+    monkeypatch.setattr(llm_telemetry_module.llm_usage, "increment_many", increment_many)
+
+
+async def test_flush_drops_rows_of_deleted_companies(monkeypatch):
+    """삭제된 회사의 집계는 반영되지 않아도 복원하지 않음"""
+    async def increment_many(db, *, rows):
+        return [
+            (row["company_id"], row["day"], row["call_site"], row["model"])
+            for row in rows if row["company_id"] == 1
+        ]
+
+    _patch_increment_many(monkeypatch, increment_many)
+    telemetry = LLMTelemetry()
+    _record_usage(telemetry, 1, 2)
+
+    assert await telemetry.flush() == 1
+    assert telemetry._pending == {}
+
+
+async def test_flush_does_not_restore_integrity_errors(monkeypatch):
+    """무결성 오류로 실패한 배치는 다음 주기에 다시 시도하지 않음"""
+    async def increment_many(db, *, rows):
+        raise IntegrityError("INSERT", {}, Exception("fk violation"))
+
+    _patch_increment_many(monkeypatch, increment_many)
+    telemetry = LLMTelemetry()
+    _record_usage(telemetry, 1)
+
+    assert await telemetry.flush() == 0
+    assert telemetry._pending == {}
+
+
+async def test_flush_restores_backlog_up_to_limit(monkeypatch):
+    """일시적 오류는 복원하되 보관 한도를 넘는 오래된 집계는 버림"""
+    async def increment_many(db, *, rows):
+        raise ConnectionError("database unavailable")
+
+    _patch_increment_many(monkeypatch, increment_many)
+    monkeypatch.setattr(settings, "LLM_USAGE_MAX_PENDING_ROWS", 2)
+    telemetry = LLMTelemetry()
+    _record_usage(telemetry, 1, 2, 3)
+    old_key = next(iter(telemetry._pending))
+    telemetry._pending[(old_key[0], date(2020, 1, 1), *old_key[2:])] = telemetry._pending.pop(old_key)
+
+    assert await telemetry.flush() == 0
+    assert len(telemetry._pending) == 2
+    assert all(day == date.today() for _, day, _, _ in telemetry._pending)
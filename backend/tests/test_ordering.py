@@ -0,0 +1,50 @@
+import pytest
+
+from app.crud.ordering import ORDER_GAP, plan_reorder
+
+
+def test_move_updates_only_moved_section():
+    """이웃 사이 간격이 있으면 이동한 섹션만 갱신"""
+    ranks = [(1, 1024), (2, 2048), (3, 3072)]
+
+    # 마지막 섹션을 첫 번째로
+    assert plan_reorder(ranks, {3: 1}) == {3: 512}
+    # 첫 번째 섹션을 두 번째와 세 번째 사이로
+    assert plan_reorder(ranks, {1: 2}) == {1: 2560}
+    # 첫 번째 섹션을 마지막으로
+    assert plan_reorder(ranks, {1: 3}) == {1: 3072 + ORDER_GAP}
+
+
+def test_consecutive_moves_share_gap():
+    """연속으로 이동한 섹션은 같은 간격을 나누어 사용"""
+    ranks = [(1, 1024), (2, 2048), (3, 3072), (4, 4096)]
+
+    changes = plan_reorder(ranks, {3: 1, 4: 2})
+    assert set(changes) == {3, 4}
+    assert 0 < changes[3] < changes[4] < 1024
+
+
+def test_renumbers_when_gap_runs_out():
+    """간격이 없거나 순서 값이 중복되면 전체를 다시 매김"""
+    assert plan_reorder([(1, 1), (2, 2), (3, 3)], {3: 2}) == {
+        1: ORDER_GAP,
+        3: 2 * ORDER_GAP,
+        2: 3 * ORDER_GAP
+    }
+    # 기본값 0으로 생성된 섹션들
+    assert plan_reorder([(1, 0), (2, 0)], {2: 1}) == {2: ORDER_GAP, 1: 2 * ORDER_GAP}
+
+
+def test_full_order_and_unchanged_positions():
+    """전체 순서 지정 및 위치가 그대로인 경우"""
+    ranks = [(1, 1), (2, 2), (3, 3)]
+    changes = plan_reorder(ranks, {1: 3, 2: 1, 3: 2})
+    assert sorted(changes, key=changes.get) == [2, 3, 1]
+
+    assert plan_reorder([(1, 1024), (2, 2048)], {1: 1}) == {}
+
+
+def test_rejects_unknown_section():
+    """문서에 없는 섹션 ID 거부"""
+    with pytest.raises(ValueError):
+        plan_reorder([(1, 1024)], {99: 1})
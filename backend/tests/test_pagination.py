@@ -0,0 +1,69 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.crud.pagination import (
+    InvalidCursorError,
+    Page,
+    decode_cursor,
+    encode_cursor,
+    keyset_condition
+)
+from app.models import ChatHistory, DocumentType, Document
+
+
+def _compile(clause) -> str:
+    return str(clause.compile(dialect=postgresql.dialect()))
+
+
+def test_cursor_round_trip_restores_column_types():
+    """커서 인코딩/디코딩 시 컬럼 타입 복원 테스트"""
+    created_at = datetime(2024, 5, 1, 12, 30, 15, 123456)
+    cursor = encode_cursor("created_at", "desc", created_at, 42)
+    decoded = decode_cursor(cursor, ChatHistory.created_at, "created_at", "desc")
+
+    assert decoded.value == created_at
+    assert decoded.id == 42
+
+    cursor = encode_cursor("type", "asc", DocumentType.BUSINESS_PLAN, 7)
+    decoded = decode_cursor(cursor, Document.type, "type", "asc")
+    assert decoded.value is DocumentType.BUSINESS_PLAN
+
+
+def test_decode_cursor_rejects_invalid_or_mismatched_cursor():
+    """잘못된 커서 및 정렬 조건이 다른 커서 거부 테스트"""
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor", ChatHistory.id, "id", "asc")
+
+    cursor = encode_cursor("created_at", "desc", None, 1)
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, ChatHistory.created_at, "created_at", "asc")
+
+
+def test_keyset_condition_follows_sort_direction():
+    """정렬 방향별 키셋 조건 생성 테스트"""
+    cursor = decode_cursor(
+        encode_cursor("created_at", "desc", datetime(2024, 5, 1), 10),
+        ChatHistory.created_at,
+        "created_at",
+        "desc"
+    )
+    sql = _compile(keyset_condition(ChatHistory.created_at, ChatHistory.id, "desc", cursor))
+    assert "chat_histories.created_at < " in sql
+    assert "chat_histories.id < " in sql
+    assert "chat_histories.created_at IS NULL" in sql
+
+    cursor = decode_cursor(encode_cursor("id", "asc", 10, 10), ChatHistory.id, "id", "asc")
+    sql = _compile(keyset_condition(ChatHistory.id, ChatHistory.id, "asc", cursor))
+    assert sql == "chat_histories.id > %(id_1)s"
+
+
+def test_page_behaves_like_list():
+    """페이지 결과의 목록 호환성 테스트"""
+    page = Page([1, 2, 3], next_cursor="abc")
+
+    assert page == [1, 2, 3]
+    assert len(page) == 3
+    assert page + [4] == [1, 2, 3, 4]
+    assert page.next_cursor == "abc"
@@ -0,0 +1,153 @@
+import json
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud import chat_history, chat_reference, chat_feedback, document, section
+from app.models import (
+    ChatHistory,
+    ChatReference,
+    Company,
+    Document,
+    DocumentType,
+    Section,
+    SectionType
+)
+
+# 이 행 수보다 큰 테이블을 순차 스캔하는 쿼리는 실패
+SEQ_SCAN_ROW_THRESHOLD = 1000
+
+COMPANY_COUNT = 50
+DOCUMENTS_PER_COMPANY = 40
+SECTIONS_PER_DOCUMENT = 5
+CHATS_PER_COMPANY = 40
+REFERENCES_PER_CHAT = 2
+
+
+async def _seed(db: AsyncSession) -> None:
+    """실제 규모의 분포로 회사/문서/섹션/채팅 데이터 생성 후 통계 갱신"""
+    document_types = list(DocumentType)
+    section_types = list(SectionType)
+
+    await db.execute(insert(Company), [
+        {"id": company_id, "name": f"Plan Test {company_id}", "business_number": f"{company_id:010d}"}
+        for company_id in range(1, COMPANY_COUNT + 1)
+    ])
+    documents = [
+        {
+            "id": (company_id - 1) * DOCUMENTS_PER_COMPANY + index + 1,
+            "company_id": company_id,
+            "title": f"Document {index}",
+            "type": document_types[index % len(document_types)],
+        }
+        for company_id in range(1, COMPANY_COUNT + 1)
+        for index in range(DOCUMENTS_PER_COMPANY)
+    ]
+    await db.execute(insert(Document), documents)
+    await db.execute(insert(Section), [
+        {
+            "document_id": doc["id"],
+            "company_id": doc["company_id"],
+            "type": section_types[order % len(section_types)],
+            "title": f"Section {order}",
+            "order": (order + 1) * 1024,
+        }
+        for doc in documents
+        for order in range(SECTIONS_PER_DOCUMENT)
+    ])
+    chats = [
+        {
+            "id": (company_id - 1) * CHATS_PER_COMPANY + index + 1,
+            "company_id": company_id,
+            "query": f"Question {index}",
+            "response": f"Answer {index}",
+        }
+        for company_id in range(1, COMPANY_COUNT + 1)
+        for index in range(CHATS_PER_COMPANY)
+    ]
+    await db.execute(insert(ChatHistory), chats)
+    await db.execute(insert(ChatReference), [
+        {
+            "chat_id": chat["id"],
+            "document_id": (chat["company_id"] - 1) * DOCUMENTS_PER_COMPANY + index + 1,
+            "relevance_score": 0.5,
+        }
+        for chat in chats
+        for index in range(REFERENCES_PER_CHAT)
+    ])
+    await db.commit()
+    await db.execute(text("ANALYZE"))
+
+
+def _plan_nodes(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+async def _explain_call(db: AsyncSession, call) -> List[Dict[str, Any]]:
+    """CRUD 호출이 실행하는 SELECT를 모아 각각의 실행 계획 반환"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = db.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        await call()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    connection = await db.connection()
+    plans = []
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        plans.append(plan[0]["Plan"])
+    return plans
+
+
+@pytest.mark.asyncio
+async def test_crud_queries_avoid_large_sequential_scans(db_session: AsyncSession):
+    """주요 CRUD 쿼리가 큰 테이블을 순차 스캔하지 않는지 실행 계획으로 확인"""
+    await _seed(db_session)
+
+    calls = {
+        "document.get_by_company": lambda: document.get_by_company(db_session, company_id=7),
+        "document.get_by_type": lambda: document.get_by_type(
+            db_session, doc_type=DocumentType.BUSINESS_PLAN, company_id=7
+        ),
+        "section.get_by_document": lambda: section.get_by_document(db_session, document_id=123),
+        "section.get_by_type": lambda: section.get_by_type(
+            db_session, section_type=SectionType.EXECUTIVE_SUMMARY, company_id=7
+        ),
+        "chat_history.get_by_company": lambda: chat_history.get_by_company(db_session, company_id=7),
+        "chat_reference.get_by_chat": lambda: chat_reference.get_by_chat(db_session, chat_id=55),
+        "chat_feedback.get_by_chat": lambda: chat_feedback.get_by_chat(db_session, chat_id=55),
+    }
+
+    table_rows = {
+        row.relname: row.reltuples
+        for row in await db_session.execute(text(
+            "SELECT relname, reltuples FROM pg_class WHERE relkind = 'r'"
+        ))
+    }
+
+    violations = []
+    for name, call in calls.items():
+        for plan in await _explain_call(db_session, call):
+            for node in _plan_nodes(plan):
+                if node["Node Type"] != "Seq Scan":
+                    continue
+                rows = table_rows.get(node["Relation Name"], 0)
+                if rows > SEQ_SCAN_ROW_THRESHOLD:
+                    violations.append(f"{name}: Seq Scan on {node['Relation Name']} ({rows:.0f} rows)")
+
+    print("\n".join(violations))
+    assert not violations, "큰 테이블 순차 스캔 발생: " + ", ".join(violations)
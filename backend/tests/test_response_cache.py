@@ -0,0 +1,50 @@
+from app.services.response_cache import CacheKey, ResponseCache
+
+
+def make_cache(**kwargs) -> ResponseCache:
+    options = {"similarity_threshold": 0.95, "ttl_seconds": 60, "max_entries_per_company": 2}
+    options.update(kwargs)
+    return ResponseCache(**options)
+
+
+def test_similar_question_hits_cache():
+    """유사 질문 캐시 적중 테스트"""
+    cache = make_cache()
+    cache.store(1, CacheKey("ctx", [1.0, 0.0]), "진출시장 작성", "## 답변", saved_tokens=100)
+
+    hit = cache.lookup(1, CacheKey("ctx", [0.99, 0.05]))
+    miss = cache.lookup(1, CacheKey("ctx", [0.0, 1.0]))
+
+    assert hit.response == "## 답변"
+    assert miss is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hit_rate"] == 0.5
+    assert cache.stats()["saved_tokens"] == 100
+
+
+def test_context_change_and_invalidation():
+    """컨텍스트 변경 및 무효화 테스트"""
+    cache = make_cache()
+    cache.store(1, CacheKey("old", [1.0, 0.0]), "q", "a")
+    cache.store(2, CacheKey("ctx", [1.0, 0.0]), "q", "a")
+
+    assert cache.lookup(1, CacheKey("new", [1.0, 0.0])) is None
+    assert cache.stats()["entries"] == 1  # 지문이 바뀐 항목은 제거됨
+
+    cache.invalidate_company(2)
+    assert cache.lookup(2, CacheKey("ctx", [1.0, 0.0])) is None
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_expired_and_evicted_entries():
+    """만료 및 최대 개수 초과 테스트"""
+    cache = make_cache(ttl_seconds=-1)
+    cache.store(1, CacheKey("ctx", [1.0, 0.0]), "q", "a")
+    assert cache.lookup(1, CacheKey("ctx", [1.0, 0.0])) is None
+
+    cache = make_cache()
+    for idx in range(3):
+        cache.store(1, CacheKey("ctx", [1.0, float(idx)]), f"q{idx}", f"a{idx}")
+    assert cache.stats()["entries"] == 2
+    assert cache.lookup(1, CacheKey("ctx", [1.0, 0.0])) is None
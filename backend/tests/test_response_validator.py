@@ -0,0 +1,77 @@
+from app.services.response_validator import StreamingValidator, Verdict, required_keywords_for
+
+
+def _feed_all(validator, text, size=5):
+    verdict = Verdict.PENDING
+    for i in range(0, len(text), size):
+        verdict = validator.feed(text[i:i + size])
+        if verdict == Verdict.REJECTED:
+            break
+    return verdict
+
+
+def test_required_keywords_for_query():
+    """질문 유형별 필수 키워드 테스트"""
+    assert required_keywords_for("진출시장을 알려주세요") == ["시장", "규모", "성장"]
+    assert required_keywords_for("진출시장 선정사유") == ["시장", "규모", "성장", "제품", "경쟁력"]
+    assert required_keywords_for("회사 소개") == []
+
+
+def test_accepts_as_soon_as_keywords_found():
+    """필수 키워드가 모두 나오면 즉시 통과"""
+    validator = StreamingValidator("진출시장 추천", min_length=20)
+    text = "베트남 시장은 규모가 크고 성장 속도가 빠른 시장입니다. 이후 내용은 검사하지 않습니다."
+
+    assert _feed_all(validator, text) == Verdict.ACCEPTED
+    result = validator.finish()
+    assert result.verdict == Verdict.ACCEPTED
+    assert result.text == text
+
+
+def test_keyword_split_across_chunks():
+    """청크 경계에 걸친 키워드 인식"""
+    validator = StreamingValidator("진출시장 추천", min_length=0)
+    for delta in ["시", "장 규", "모와 성", "장"]:
+        validator.feed(delta)
+
+    assert validator.verdict == Verdict.ACCEPTED
+
+
+def test_rejects_when_keywords_missing_past_deadline():
+    """마감 길이까지 키워드가 없으면 조기 중단"""
+    validator = StreamingValidator("진출시장 추천", keyword_deadline=100)
+    text = "회사의 연혁과 조직 구성에 대해 설명드리겠습니다. " * 10
+
+    assert _feed_all(validator, text) == Verdict.REJECTED
+    result = validator.finish()
+    assert result.reason == "missing_keywords"
+    assert len(result.text) < len(text)
+    assert "규모" in result.retry_hint
+
+
+def test_rejects_refusal_and_wrong_language():
+    """답변 거부와 다른 언어 응답 조기 중단"""
+    refusal = StreamingValidator("회사 소개")
+    assert _feed_all(refusal, "죄송합니다. 해당 정보는 제공할 수 없습니다.") == Verdict.REJECTED
+    assert refusal.reason == "refusal"
+
+    english = StreamingValidator("회사 소개", min_length=1000)
+    assert _feed_all(english, "This company builds software for global markets. " * 10) == Verdict.REJECTED
+    assert english.reason == "language"
+
+
+def test_rejects_repeated_lines():
+    """같은 줄 반복 시 조기 중단"""
+    validator = StreamingValidator("회사 소개", min_length=1000)
+    assert _feed_all(validator, "- 시장 규모가 큰 국가입니다\n" * 5) == Verdict.REJECTED
+    assert validator.reason == "repetition"
+
+
+def test_finish_rejects_short_response():
+    """짧은 응답은 최종 검증에서 거부"""
+    validator = StreamingValidator("회사 소개")
+    validator.feed("짧은 답변")
+
+    result = validator.finish()
+    assert result.verdict == Verdict.REJECTED
+    assert result.reason == "too_short"
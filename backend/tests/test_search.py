@@ -0,0 +1,33 @@
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from app.crud.search import build_prefix_tsquery, escape_like
+from app.models import Document
+
+
+def test_build_prefix_tsquery_strips_operators():
+    """검색어의 tsquery 연산자 제거 및 접두사 검색 변환 테스트"""
+    assert build_prefix_tsquery("시장 규모") == "'시장':* & '규모':*"
+    assert build_prefix_tsquery("  K-뷰티 & (수출)!") == "'K-뷰티':* & '수출':*"
+    assert build_prefix_tsquery("it's") == "'it':* & 's':*"
+    assert build_prefix_tsquery(" & | ! ") is None
+
+
+def test_escape_like_special_characters():
+    """LIKE 패턴 특수문자 이스케이프 테스트"""
+    assert escape_like("100%_달성\\") == "100\\%\\_달성\\\\"
+
+
+def test_document_search_schema():
+    """문서 검색 컬럼 및 인덱스 DDL 테스트"""
+    dialect = postgresql.dialect()
+    ddl = str(CreateTable(Document.__table__).compile(dialect=dialect))
+    assert "search_vector TSVECTOR GENERATED ALWAYS AS" in ddl
+    assert "to_tsvector('simple', coalesce(content, ''))" in ddl
+
+    indexes = {
+        index.name: str(CreateIndex(index).compile(dialect=dialect))
+        for index in Document.__table__.indexes
+    }
+    assert "USING gin (search_vector)" in indexes["ix_documents_search_vector"]
+    assert "USING gin (title gin_trgm_ops)" in indexes["ix_documents_title_trgm"]
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from app.utils.singleflight import SingleFlight, make_key
+
+
+def test_make_key_is_canonical():
+    """키 정규화 테스트"""
+    assert make_key("gpt", {"a": 1, "b": 2}) == make_key("gpt", {"b": 2, "a": 1})
+    assert make_key("gpt", "질문") != make_key("gpt", "다른 질문")
+
+
+async def test_concurrent_calls_share_one_upstream_call():
+    """동시 호출 병합 테스트"""
+    flight = SingleFlight()
+    calls = 0
+
+    async def upstream():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "응답"
+
+    results = await asyncio.gather(*[flight.do("key", upstream) for _ in range(5)])
+
+    assert results == ["응답"] * 5
+    assert calls == 1
+    assert not flight.in_flight("key")
+
+    # 완료 후 호출은 새로 실행
+    await flight.do("key", upstream)
+    assert calls == 2
+
+
+async def test_error_propagates_to_all_waiters():
+    """예외 전달 테스트"""
+    flight = SingleFlight()
+
+    async def upstream():
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream error")
+
+    results = await asyncio.gather(
+        flight.do("key", upstream),
+        flight.do("key", upstream),
+        return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert not flight.in_flight("key")
+
+
+async def test_cancel_one_waiter_keeps_others():
+    """일부 대기자 취소 테스트"""
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def upstream():
+        started.set()
+        await asyncio.sleep(0.02)
+        return "응답"
+
+    first = asyncio.ensure_future(flight.do("key", upstream))
+    second = asyncio.ensure_future(flight.do("key", upstream))
+    await started.wait()
+    first.cancel()
+
+    assert await second == "응답"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+async def test_cancel_all_waiters_cancels_upstream():
+    """전체 대기자 취소 시 업스트림 취소 테스트"""
+    flight = SingleFlight()
+    upstream_cancelled = asyncio.Event()
+
+    async def upstream():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            upstream_cancelled.set()
+            raise
+
+    waiter = asyncio.ensure_future(flight.do("key", upstream))
+    await asyncio.sleep(0)
+    waiter.cancel()
+
+    await asyncio.wait_for(upstream_cancelled.wait(), timeout=1)
+    await asyncio.sleep(0)
+    assert not flight.in_flight("key")
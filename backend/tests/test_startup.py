@@ -0,0 +1,37 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# 앱 import 시점에 로드되면 안 되는 무거운 모듈 (첫 사용 시점에 로드)
+LAZY_MODULES = ["openai", "psycopg2", "magic", "PyPDF2", "docx"]
+
+PROBE = f"""
+import json, sys
+import app.main
+from app.core.database import get_async_engine, get_engine
+from app.services.llm_gateway import llm_gateway
+print(json.dumps({{
+    "loaded": [name for name in {LAZY_MODULES!r} if name in sys.modules],
+    "engines": get_async_engine.cache_info().currsize + get_engine.cache_info().currsize,
+    "llm_client": llm_gateway._client is not None or llm_gateway._http_client is not None,
+}}))
+"""
+
+
+def test_app_import_is_lazy():
+    """앱 import만으로는 DB 엔진, OpenAI 클라이언트, 무거운 파서 모듈이 생성/로드되지 않음"""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    state = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert state["loaded"] == []
+    assert state["engines"] == 0
+    assert state["llm_client"] is False
@@ -0,0 +1,37 @@
+import asyncio
+
+from app.utils.worker_pool import run_worker_pool
+
+
+async def test_worker_pool_processes_all_tasks_with_bounded_concurrency():
+    """동시 작업 수 제한 테스트"""
+    processed = []
+    active = 0
+    max_active = 0
+
+    async def handler(task):
+        nonlocal active, max_active
+        active += 1
+        max_active = max(max_active, active)
+        await asyncio.sleep(0.01)
+        processed.append(task)
+        active -= 1
+
+    await run_worker_pool(range(10), handler, concurrency=3)
+
+    assert sorted(processed) == list(range(10))
+    assert max_active == 3
+
+
+async def test_worker_pool_continues_after_handler_error():
+    """작업 실패 시 나머지 작업 계속 처리"""
+    processed = []
+
+    async def handler(task):
+        if task == 2:
+            raise RuntimeError("failed")
+        processed.append(task)
+
+    await run_worker_pool(range(5), handler, concurrency=2)
+
+    assert sorted(processed) == [0, 1, 3, 4]